@@ -0,0 +1,106 @@
+"""Latency/throughput of the GameCore API on synthetic dictionaries.
+
+    python benchmarks/bench_core.py --sizes 100,10000,1000000 --output bench.json
+
+Each dictionary size is measured on the native path and on the pure-Python
+emulation path (``GameCore(use_native=False)``); results are JSON so runs
+from different commits can be diffed.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from common import UI_DIR, emit, measure, report, write_words_file
+
+from core_bridge import GameCore, find_library
+
+DEFAULT_SIZES = "100,1000,10000,100000,1000000"
+HUGE_ATTEMPTS = 1 << 30
+
+
+def bench_core(core: GameCore, iterations: int) -> dict:
+    category = "CAT00"
+    results = {
+        "get_categories": measure(core.get_categories, iterations),
+        "filter_words_by_category": measure(lambda: core.filter_words_by_category(category), iterations),
+        "start_game": measure(lambda: core.start_game(category, HUGE_ATTEMPTS), iterations),
+    }
+
+    core.start_game(category, HUGE_ATTEMPTS)
+    length = len(core.get_secret())
+    guesses = core.lexicon().words_of_length(length)[:1024] or ["A" * length]
+    cursor = iter(range(1 << 62))
+
+    def guess() -> None:
+        core.guess_word(guesses[next(cursor) % len(guesses)], length)
+
+    results["guess_word"] = measure(guess, iterations * 10)
+
+    def guess_view() -> None:
+        core.guess_word_view(guesses[next(cursor) % len(guesses)], length)
+
+    results["guess_word_view"] = measure(guess_view, iterations * 10)
+    return results
+
+
+def run(sizes: list[int], paths: list[str], lib: Path | None, iterations: int, seed: int) -> list[dict]:
+    rows = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="gw_bench_") as tmp:
+        for size in sizes:
+            words = write_words_file(Path(tmp) / f"words_{size}" / "words.txt", size, seed=seed)
+            # init_db reads words.txt from the working directory, so the native core runs next to the dictionary.
+            os.chdir(words.parent)
+            try:
+                for path in paths:
+                    native = path == "native"
+                    t0 = time.perf_counter()
+                    core = GameCore(lib, words, use_native=native)
+                    init_ms = (time.perf_counter() - t0) * 1e3
+                    try:
+                        n = max(20, min(iterations, 20_000_000 // size))
+                        rows.append({
+                            "size": size,
+                            "path": path,
+                            "init_ms": round(init_ms, 3),
+                            "ops": bench_core(core, n),
+                        })
+                        print(f"[INFO] size={size} path={path} done")
+                    finally:
+                        core.close()
+            finally:
+                os.chdir(cwd)
+    return rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated dictionary sizes")
+    parser.add_argument("--paths", default="native,emulation", help="native and/or emulation")
+    parser.add_argument("--lib", type=Path, help="native library (defaults to the usual build locations)")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    paths = [p.strip() for p in args.paths.split(",") if p.strip()]
+    lib = args.lib
+    if "native" in paths and lib is None:
+        try:
+            lib = find_library(UI_DIR)
+        except FileNotFoundError as e:
+            print(f"[WARNING] {e} Skipping the native path.")
+            paths = [p for p in paths if p != "native"]
+
+    rows = run(sizes, paths, lib, args.iterations, args.seed)
+    params = {"sizes": sizes, "paths": paths, "iterations": args.iterations, "seed": args.seed}
+    emit(report("core", rows, params), args.output)
+
+
+if __name__ == "__main__":
+    main()
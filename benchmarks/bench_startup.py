@@ -0,0 +1,94 @@
+"""Cold-start time of the desktop app and of its headless phases.
+
+    python benchmarks/bench_startup.py --runs 5 --output startup.json
+
+``app`` runs ``python_ui/app.py --no-intro --startup-report`` in a fresh
+interpreter and records its time-to-interactive marks (needs a display).
+The headless phases - importing GameCore, loading the native core and
+dictionary - are also measured in fresh interpreters so they work anywhere.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from common import ROOT, UI_DIR, emit, report
+
+PHASES = {
+    "import_core_bridge": "import core_bridge",
+    "import_customtkinter": "import customtkinter",
+    "import_pygame": "import os; os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'; import pygame",
+    "load_core": (
+        "from pathlib import Path; from core_bridge import GameCore, find_library; "
+        "ui = Path.cwd(); GameCore(find_library(ui), ui.parent / 'words.txt').get_categories()"
+    ),
+}
+
+
+def _time_subprocess(args: list[str], cwd: Path, timeout: float) -> tuple[float, subprocess.CompletedProcess]:
+    t0 = time.perf_counter()
+    proc = subprocess.run(args, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+    return (time.perf_counter() - t0) * 1e3, proc
+
+
+def _stats(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "min_ms": round(ordered[0], 1),
+        "median_ms": round(ordered[len(ordered) // 2], 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+def bench_phase(name: str, code: str, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        wall_ms, proc = _time_subprocess([sys.executable, "-c", code], UI_DIR, timeout=60)
+        if proc.returncode != 0:
+            return {"phase": name, "error": proc.stderr.strip().splitlines()[-1:]}
+        samples.append(wall_ms)
+    return {"phase": name, "wall": _stats(samples)}
+
+
+def bench_app(runs: int, intro: bool) -> dict:
+    args = [sys.executable, str(UI_DIR / "app.py"), "--startup-report"]
+    if not intro:
+        args.append("--no-intro")
+    walls, ttis, marks = [], [], []
+    for _ in range(runs):
+        wall_ms, proc = _time_subprocess(args, ROOT, timeout=120)
+        report_line = next((l for l in reversed(proc.stdout.splitlines()) if l.startswith("{")), None)
+        if proc.returncode != 0 or report_line is None:
+            return {"phase": "app", "intro": intro, "error": proc.stderr.strip().splitlines()[-1:]}
+        data = json.loads(report_line)
+        walls.append(wall_ms)
+        ttis.append(data["time_to_interactive_ms"])
+        marks.append(data["marks_ms"])
+    return {"phase": "app", "intro": intro, "wall": _stats(walls), "time_to_interactive": _stats(ttis), "marks_ms": marks}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--intro", action="store_true", help="also time a start with the 3D intro")
+    parser.add_argument("--no-app", action="store_true", help="only the headless phases")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    rows = [bench_phase(name, code, args.runs) for name, code in PHASES.items()]
+    if not args.no_app:
+        rows.append(bench_app(args.runs, intro=False))
+        if args.intro:
+            rows.append(bench_app(args.runs, intro=True))
+    for row in rows:
+        print(f"[INFO] {row['phase']}: {row.get('time_to_interactive', row.get('wall', row.get('error')))}")
+    emit(report("startup", rows, {"runs": args.runs, "intro": args.intro}), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Scaling of GameCore across threads: one GameSession per worker on a ThreadPoolExecutor.
+
+    python benchmarks/bench_threads.py --threads 1,2,4,8 --games 20000 --output threads.json
+
+Native calls release the GIL, so the speedup over one thread shows how much
+of the work runs in C++ in parallel: ``games`` plays whole games through the
+session API, ``evaluate_many`` scores large batches in single native calls.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from common import UI_DIR, emit, report, write_words_file
+
+from core_bridge import GameCore, find_library
+
+
+def play_games(core: GameCore, games: int, seed: int) -> int:
+    rng = random.Random(seed)
+    with core.new_session() as session:
+        session.seed(seed)
+        for _ in range(games):
+            session.start_game("Any", 6)
+            length = len(session.get_secret())
+            pool = core.lexicon().words_of_length(length)
+            while session.get_state().status == 0:
+                session.guess_word(pool[rng.randrange(len(pool))], length)
+    return games
+
+
+def score_batches(core: GameCore, batches: int, guesses: list[str], secret: str) -> int:
+    for _ in range(batches):
+        core.evaluate_many(guesses, secret)
+    return batches * len(guesses)
+
+
+def run_parallel(threads: int, work, total: int) -> dict:
+    per_thread = [total // threads + (i < total % threads) for i in range(threads)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        done = sum(pool.map(work, per_thread, range(threads)))
+    wall_s = time.perf_counter() - started
+    return {"threads": threads, "units": done, "wall_s": round(wall_s, 4), "units_per_s": round(done / wall_s, 1)}
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8", help="comma-separated thread counts")
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--batches", type=int, default=400, help="evaluate_many calls in total")
+    parser.add_argument("--batch-size", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=100000, help="synthetic dictionary size")
+    parser.add_argument("--lib", type=Path, help="native library (defaults to the usual build locations)")
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+
+    lib = args.lib or find_library(UI_DIR)
+    thread_counts = [int(t) for t in args.threads.split(",") if t]
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="gw_bench_") as tmp:
+        words = write_words_file(Path(tmp) / "words.txt", args.size)
+        core = GameCore(lib, words)
+        try:
+            pool = core.lexicon().words_of_length(6)
+            secret = pool[0]
+            guesses = [pool[i % len(pool)] for i in range(args.batch_size)]
+            for name, work, total in (
+                ("games", lambda n, i: play_games(core, n, i), args.games),
+                ("evaluate_many", lambda n, i: score_batches(core, n, guesses, secret), args.batches),
+            ):
+                base = None
+                for threads in thread_counts:
+                    row = {"op": name, **run_parallel(threads, work, total)}
+                    base = base or row["units_per_s"]
+                    row["speedup"] = round(row["units_per_s"] / base, 2)
+                    rows.append(row)
+                    print(f"[INFO] {name} threads={threads} speedup={row['speedup']}")
+        finally:
+            core.close()
+    params = {"threads": thread_counts, "games": args.games, "batches": args.batches,
+              "batch_size": args.batch_size, "size": args.size, "cpus": os.cpu_count()}
+    emit(report("threads", rows, params), args.output)
+
+
+if __name__ == "__main__":
+    main()
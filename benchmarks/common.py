@@ -0,0 +1,103 @@
+"""Shared helpers for the benchmark scripts: timing, summaries, synthetic dictionaries, JSON reports."""
+from __future__ import annotations
+
+import json
+import platform
+import random
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+UI_DIR = ROOT / "python_ui"
+if str(UI_DIR) not in sys.path:
+    sys.path.insert(0, str(UI_DIR))
+
+
+def summarize(samples_ns: list[int]) -> dict:
+    """Latency percentiles in microseconds plus throughput for one measured operation."""
+    if not samples_ns:
+        return {"n": 0}
+    ordered = sorted(samples_ns)
+    n = len(ordered)
+    total_s = sum(ordered) / 1e9
+
+    def pct(p: float) -> float:
+        return ordered[min(n - 1, int(p * n))] / 1e3
+
+    return {
+        "n": n,
+        "total_s": round(total_s, 6),
+        "ops_per_s": round(n / total_s, 1) if total_s else None,
+        "mean_us": round(total_s * 1e6 / n, 3),
+        "p50_us": round(pct(0.50), 3),
+        "p95_us": round(pct(0.95), 3),
+        "p99_us": round(pct(0.99), 3),
+        "max_us": round(ordered[-1] / 1e3, 3),
+    }
+
+
+def measure(fn, iterations: int, warmup: int = 3) -> dict:
+    for _ in range(min(warmup, iterations)):
+        fn()
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        t0 = clock()
+        fn()
+        samples.append(clock() - t0)
+    return summarize(samples)
+
+
+def synthetic_words(count: int, seed: int = 0, categories: int = 20, min_len: int = 4, max_len: int = 8):
+    """Yield ``(word, category)`` pairs of unique random upper-case words."""
+    rng = random.Random(seed)
+    seen: set[str] = set()
+    letters = string.ascii_uppercase
+    while len(seen) < count:
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(min_len, max_len)))
+        if word in seen:
+            continue
+        seen.add(word)
+        yield word, f"CAT{rng.randrange(categories):02d}"
+
+
+def write_words_file(path: Path, count: int, seed: int = 0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        for word, cat in synthetic_words(count, seed=seed):
+            fh.write(f"{word};{cat}\n")
+    return path
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def report(name: str, results: list[dict], params: dict | None = None) -> dict:
+    return {
+        "benchmark": name,
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params or {},
+        "results": results,
+    }
+
+
+def emit(data: dict, output: Path | None) -> None:
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    if output is None:
+        print(text)
+    else:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(text + "\n", encoding="utf-8")
+        print(f"[INFO] Wrote {output}")
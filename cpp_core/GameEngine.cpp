@@ -3,77 +3,450 @@
 #include <sstream>
 #include <algorithm>
 #include <random>
-#include <map>
+#include <cctype>
+#include <cstring>
+#include <filesystem>
+#include <unordered_map>
 
 namespace guess_game {
 
-bool GameEngine::loadWordsFromFile(const std::string& path, std::string& error) {
+static std::string trim(const std::string& s) {
+    const char* ws = " \t\r\n";
+    size_t b = s.find_first_not_of(ws);
+    if (b == std::string::npos) return "";
+    size_t e = s.find_last_not_of(ws);
+    return s.substr(b, e - b + 1);
+}
+
+template <typename Result>
+static void scoreInto(const char* guess, const char* secret, size_t length, Result* results) {
+    int counts[256] = {0};
+    for (size_t i = 0; i < length; ++i) counts[static_cast<unsigned char>(secret[i])]++;
+
+    //перший прохід: CORRECT (Зелений)
+    for (size_t i = 0; i < length; ++i) {
+        if (guess[i] == secret[i]) {
+            results[i] = static_cast<Result>(LetterStatus::Correct);
+            counts[static_cast<unsigned char>(guess[i])]--;
+        } else {
+            results[i] = static_cast<Result>(LetterStatus::Absent);
+        }
+    }
+
+    //другий прохід: PRESENT (Жовтий)
+    for (size_t i = 0; i < length; ++i) {
+        if (results[i] == static_cast<Result>(LetterStatus::Correct)) continue;
+        int& left = counts[static_cast<unsigned char>(guess[i])];
+        if (left > 0) {
+            results[i] = static_cast<Result>(LetterStatus::Present);
+            left--;
+        }
+    }
+}
+
+void scoreGuess(const char* guess, const char* secret, size_t length, int* results) {
+    scoreInto(guess, secret, length, results);
+}
+
+void scoreGuess(const char* guess, const char* secret, size_t length, uint8_t* results) {
+    scoreInto(guess, secret, length, results);
+}
+
+bool decodeUtf8(std::string_view text, std::u32string& out) {
+    out.clear();
+    for (size_t i = 0; i < text.size();) {
+        const unsigned char lead = static_cast<unsigned char>(text[i]);
+        char32_t cp;
+        size_t extra;
+        if (lead < 0x80) { cp = lead; extra = 0; }
+        else if ((lead & 0xE0) == 0xC0) { cp = lead & 0x1F; extra = 1; }
+        else if ((lead & 0xF0) == 0xE0) { cp = lead & 0x0F; extra = 2; }
+        else if ((lead & 0xF8) == 0xF0) { cp = lead & 0x07; extra = 3; }
+        else return false;
+        if (i + extra >= text.size()) return false;
+        for (size_t k = 1; k <= extra; ++k) {
+            const unsigned char next = static_cast<unsigned char>(text[i + k]);
+            if ((next & 0xC0) != 0x80) return false;
+            cp = (cp << 6) | (next & 0x3F);
+        }
+        out.push_back(cp);
+        i += extra + 1;
+    }
+    return true;
+}
+
+//без розгалужень на кожен байт, тож компілятор векторизує
+static bool isAscii(std::string_view text) {
+    unsigned char bits = 0;
+    for (char ch : text) bits |= static_cast<unsigned char>(ch);
+    return bits < 0x80;
+}
+
+static void encodeUtf8(char32_t cp, std::string& out) {
+    if (cp < 0x80) {
+        out.push_back(static_cast<char>(cp));
+    } else if (cp < 0x800) {
+        out.push_back(static_cast<char>(0xC0 | (cp >> 6)));
+        out.push_back(static_cast<char>(0x80 | (cp & 0x3F)));
+    } else if (cp < 0x10000) {
+        out.push_back(static_cast<char>(0xE0 | (cp >> 12)));
+        out.push_back(static_cast<char>(0x80 | ((cp >> 6) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | (cp & 0x3F)));
+    } else {
+        out.push_back(static_cast<char>(0xF0 | (cp >> 18)));
+        out.push_back(static_cast<char>(0x80 | ((cp >> 12) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | ((cp >> 6) & 0x3F)));
+        out.push_back(static_cast<char>(0x80 | (cp & 0x3F)));
+    }
+}
+
+static char32_t toUpperCodePoint(char32_t cp) {
+    if (cp >= U'a' && cp <= U'z') return cp - 0x20;
+    if (cp >= 0xE0 && cp <= 0xFE && cp != 0xF7) return cp - 0x20;                   //Latin-1
+    if (cp >= 0x3B1 && cp <= 0x3C9 && cp != 0x3C2) return cp - 0x20;                //грецька
+    if (cp >= 0x430 && cp <= 0x44F) return cp - 0x20;                               //кирилиця а-я
+    if (cp >= 0x450 && cp <= 0x45F) return cp - 0x50;                               //ѐ-џ (є, і, ї)
+    if (((cp >= 0x460 && cp <= 0x481) || (cp >= 0x48A && cp <= 0x4BF) || (cp >= 0x4D0 && cp <= 0x4FF)) && (cp & 1)) {
+        return cp - 1;                                                              //пари, зокрема ґ
+    }
+    return cp;
+}
+
+std::string toUpperUtf8(std::string_view text) {
+    std::u32string codes;
+    if (!decodeUtf8(text, codes)) return std::string(text);
+    std::string out;
+    out.reserve(text.size());
+    for (char32_t cp : codes) encodeUtf8(toUpperCodePoint(cp), out);
+    return out;
+}
+
+bool WordTable::loadFromFile(const std::string& path, std::string& error) {
     std::ifstream file(path);
     if (!file.is_open()) {
         error = "File not found: " + path;
         return false;
     }
+    return loadFromLines(file, path, error);
+}
+
+bool WordTable::loadFromText(std::string_view text, std::string& error) {
+    std::istringstream in{std::string(text)};
+    return loadFromLines(in, "text", error);
+}
+
+bool WordTable::loadFromLines(std::istream& file, const std::string& source, std::string& error) {
+    mapping_.close();
+    ownedBlob_.clear();
+    ownedRecords_.clear();
+    ownedCategoryIds_.clear();
+    std::unordered_map<std::string, uint16_t> categoryIds;
+    std::vector<std::pair<uint32_t, uint32_t>> categorySpans;
 
-    words_.clear();
     std::string line;
+    //формат рядка: WORD;CATEGORY
     while (std::getline(file, line)) {
-        std::stringstream ss(line);
-        std::string w, c;
-        if (ss >> w >> c) {
-            words_.push_back({w, c}); 
+        size_t sep = line.find(';');
+        std::string w = trim(line.substr(0, sep));
+        std::string c = sep == std::string::npos ? "" : trim(line.substr(sep + 1));
+        if (w.empty()) continue;
+        w = toUpperUtf8(w);
+        if (w.size() > 0xFFFF) continue;
+
+        uint16_t cat = NO_CATEGORY;
+        if (!c.empty()) {
+            auto it = categoryIds.find(c);
+            if (it == categoryIds.end()) {
+                if (categorySpans.size() >= NO_CATEGORY) {
+                    error = "Too many categories in " + source;
+                    return false;
+                }
+                cat = static_cast<uint16_t>(categorySpans.size());
+                categoryIds.emplace(c, cat);
+                categorySpans.emplace_back(static_cast<uint32_t>(ownedBlob_.size()), static_cast<uint32_t>(c.size()));
+                ownedBlob_ += c;
+            } else {
+                cat = it->second;
+            }
+        }
+        ownedRecords_.push_back({static_cast<uint32_t>(ownedBlob_.size()), static_cast<uint16_t>(w.size()), cat});
+        ownedBlob_ += w;
+    }
+
+    //string_view створюємо лише після того, як blob більше не росте
+    blob_ = ownedBlob_.data();
+    records_ = ownedRecords_.data();
+    count_ = ownedRecords_.size();
+    categoryNames_.clear();
+    for (const auto& span : categorySpans) categoryNames_.emplace_back(blob_ + span.first, span.second);
+
+    //id слів, згруповані за категоріями (сортування підрахунком, як секція category ids у .gwd)
+    std::vector<uint32_t> firsts(categorySpans.size() + 1, 0);
+    for (const auto& r : ownedRecords_) {
+        if (r.category != NO_CATEGORY) firsts[r.category + 1]++;
+    }
+    for (size_t i = 1; i < firsts.size(); ++i) firsts[i] += firsts[i - 1];
+    ownedCategoryIds_.resize(firsts.back());
+    std::vector<uint32_t> fill(firsts.begin(), firsts.end() - 1);
+    for (size_t id = 0; id < ownedRecords_.size(); ++id) {
+        uint16_t cat = ownedRecords_[id].category;
+        if (cat != NO_CATEGORY) ownedCategoryIds_[fill[cat]++] = static_cast<uint32_t>(id);
+    }
+    categoryWords_.clear();
+    for (size_t i = 0; i < categorySpans.size(); ++i) {
+        categoryWords_.push_back({ownedCategoryIds_.data() + firsts[i], firsts[i + 1] - firsts[i]});
+    }
+    buildCategoryIndex();
+    return true;
+}
+
+void WordTable::buildCategoryIndex() {
+    categoryIndex_.clear();
+    for (size_t i = 0; i < categoryNames_.size(); ++i) {
+        categoryIndex_.emplace(categoryNames_[i], static_cast<uint16_t>(i));
+    }
+}
+
+bool WordTable::loadFromBinary(const std::string& path, std::string& error) {
+    if (!mapping_.open(path, error)) return false;
+    const char* base = mapping_.data();
+    const size_t size = mapping_.size();
+
+    auto fail = [&](const char* why) {
+        mapping_.close();
+        error = std::string(why) + ": " + path;
+        return false;
+    };
+    auto fits = [&](uint64_t offset, uint64_t bytes) { return offset + bytes <= size; };
+
+    if (size < sizeof(DictionaryHeader)) return fail("Truncated dictionary");
+    DictionaryHeader header;
+    std::memcpy(&header, base, sizeof(header));
+    if (std::memcmp(header.magic, "GWDICT\0\1", 8) != 0) return fail("Not a word dictionary");
+    if (header.version != DICTIONARY_VERSION) return fail("Unsupported dictionary version");
+    if (!fits(header.recordsOffset, uint64_t(header.wordCount) * sizeof(WordRecord)) ||
+        !fits(header.categoriesOffset, uint64_t(header.categoryCount) * sizeof(CategoryRecord)) ||
+        !fits(header.categoryIdsOffset, 0) ||
+        !fits(header.bucketsOffset, uint64_t(header.bucketCount) * sizeof(LengthBucket)) ||
+        !fits(header.blobOffset, header.blobSize) ||
+        header.recordsOffset % alignof(WordRecord) != 0 ||
+        header.categoriesOffset % alignof(CategoryRecord) != 0 ||
+        header.categoryIdsOffset % alignof(uint32_t) != 0) {
+        return fail("Corrupt dictionary");
+    }
+
+    ownedBlob_.clear();
+    ownedRecords_.clear();
+    ownedCategoryIds_.clear();
+    blob_ = base + header.blobOffset;
+    records_ = reinterpret_cast<const WordRecord*>(base + header.recordsOffset);
+    count_ = header.wordCount;
+
+    const auto* cats = reinterpret_cast<const CategoryRecord*>(base + header.categoriesOffset);
+    const auto* categoryIds = reinterpret_cast<const uint32_t*>(base + header.categoryIdsOffset);
+    const uint64_t idsAvailable = (size - header.categoryIdsOffset) / sizeof(uint32_t);
+    categoryNames_.clear();
+    categoryWords_.clear();
+    for (uint32_t i = 0; i < header.categoryCount; ++i) {
+        if (uint64_t(cats[i].nameOffset) + cats[i].nameLength > header.blobSize ||
+            uint64_t(cats[i].idsFirst) + cats[i].idsCount > idsAvailable) {
+            return fail("Corrupt dictionary");
+        }
+        categoryNames_.emplace_back(blob_ + cats[i].nameOffset, cats[i].nameLength);
+        //індекс категорій береться прямо з відображеного файлу
+        WordIdSpan span{categoryIds + cats[i].idsFirst, cats[i].idsCount};
+        for (size_t k = 0; k < span.count; ++k) {
+            if (span.ids[k] >= count_) return fail("Corrupt dictionary");
+        }
+        categoryWords_.push_back(span);
+    }
+    buildCategoryIndex();
+    for (size_t i = 0; i < count_; ++i) {
+        const WordRecord& r = records_[i];
+        if (uint64_t(r.offset) + r.length > header.blobSize ||
+            (r.category != NO_CATEGORY && r.category >= header.categoryCount)) {
+            return fail("Corrupt dictionary");
         }
     }
     return true;
 }
 
+//найновіше покоління .gwd: words.gwd, words.1.gwd, words.2.gwd...
+//(під Windows змаплений файл не замінити, тому новий словник пишеться поруч з наступним номером)
+static std::filesystem::path newestBinary(const std::filesystem::path& text) {
+    namespace fs = std::filesystem;
+    fs::path best = fs::path(text).replace_extension(".gwd");
+    unsigned long bestGen = 0;
+    const std::string prefix = best.stem().string() + ".";
+    fs::path dir = best.parent_path().empty() ? fs::path(".") : best.parent_path();
+    std::error_code ec;
+    for (fs::directory_iterator it(dir, ec), end; !ec && it != end; it.increment(ec)) {
+        const fs::path& p = it->path();
+        if (p.extension() != ".gwd") continue;
+        std::string stem = p.stem().string();
+        if (stem.size() <= prefix.size() || stem.size() > prefix.size() + 9 || stem.compare(0, prefix.size(), prefix) != 0) continue;
+        std::string digits = stem.substr(prefix.size());
+        if (digits.find_first_not_of("0123456789") != std::string::npos) continue;
+        unsigned long gen = std::stoul(digits);
+        if (gen > bestGen) {
+            bestGen = gen;
+            best = p;
+        }
+    }
+    return best;
+}
+
+bool WordTable::loadPreferBinary(const std::string& textPath, std::string& error) {
+    namespace fs = std::filesystem;
+    fs::path text(textPath);
+    fs::path binary = newestBinary(text);
+    std::error_code ec;
+    if (fs::exists(binary, ec)) {
+        bool fresh = !fs::exists(text, ec) || fs::last_write_time(binary, ec) >= fs::last_write_time(text, ec);
+        if (fresh && loadFromBinary(binary.string(), error)) return true;
+    }
+    return loadFromFile(textPath, error);
+}
+
+std::string_view WordTable::word(size_t id) const {
+    const WordRecord& r = records_[id];
+    return std::string_view(blob_ + r.offset, r.length);
+}
+
+std::string_view WordTable::category(size_t id) const {
+    uint16_t cat = records_[id].category;
+    if (cat == NO_CATEGORY) return std::string_view();
+    return categoryNames_[cat];
+}
+
+WordIdSpan WordTable::wordsInCategory(std::string_view category) const {
+    auto it = categoryIndex_.find(category);
+    if (it == categoryIndex_.end()) return {};
+    return categoryWords_[it->second];
+}
+
+std::string WordTable::getAvailableCategories() const {
+    std::string res = "Any";
+    for (const auto& c : categoryNames_) {
+        res += ",";
+        res += c;
+    }
+    return res;
+}
+
+GameEngine::GameEngine(std::shared_ptr<const WordTable> words)
+    : words_(words ? std::move(words) : std::make_shared<const WordTable>()) {}
+
+bool GameEngine::loadWordsFromFile(const std::string& path, std::string& error) {
+    auto table = std::make_shared<WordTable>();
+    if (!table->loadFromFile(path, error)) return false;
+    words_ = std::move(table);
+    return true;
+}
+
 bool GameEngine::startNewGame(int attempts, const std::string& category, std::string& error) {
-    std::vector<WordEntry> candidates;
-    for (const auto& entry : words_) {
-        if (category == "Any" || entry.category == category) {
-            candidates.push_back(entry);
+    //вибір за O(1): випадковий id з усього словника або з готового індексу категорії
+    size_t id = 0;
+    if (category == "Any") {
+        if (words_->size() == 0) {
+            error = "No words in category";
+            return false;
         }
+        id = pickRandomIndex(words_->size());
+    } else {
+        WordIdSpan span = words_->wordsInCategory(category);
+        if (span.count == 0) {
+            error = "No words in category";
+            return false;
+        }
+        id = span.ids[pickRandomIndex(span.count)];
     }
 
-    if (candidates.empty()) {
-        error = "No words in category";
+    currentWord_.assign(words_->word(id));
+    resetGame(attempts, category);
+    return true;
+}
+
+bool GameEngine::startGameWithWord(int attempts, const std::string& category, std::string_view word, std::string& error) {
+    if (word.empty()) {
+        error = "Empty word";
         return false;
     }
+    currentWord_.assign(word);
+    resetGame(attempts, category);
+    return true;
+}
 
-    currentWord_ = pickRandomWord(candidates);
+void GameEngine::resetGame(int attempts, const std::string& category) {
     currentCategory_ = category;
-    maskedWord_ = std::string(currentWord_.size(), '?');
+    asciiSecret_ = isAscii(currentWord_);
+    if (!decodeUtf8(currentWord_, secretCodes_)) {
+        //некоректний UTF-8 граємо побайтово
+        secretCodes_.assign(currentWord_.begin(), currentWord_.end());
+        asciiSecret_ = true;
+    }
+    maskedWord_.assign(secretCodes_.size(), '?');
     attemptsLeft_ = attempts;
     won_ = false;
     lost_ = false;
     usedLetters_.clear();
-    return true;
 }
 
 bool GameEngine::checkWord(const std::string& guess, std::vector<LetterStatus>& feedback, std::string& error) {
-    if (guess.size() != currentWord_.size()) {
-        error = "Invalid length";
-        return false;
-    }
+    std::vector<int> results(guess.size());
+    if (!checkWord(std::string_view(guess), results.data(), error)) return false;
+    feedback.resize(secretCodes_.size());
+    for (size_t i = 0; i < feedback.size(); ++i) feedback[i] = static_cast<LetterStatus>(results[i]);
+    return true;
+}
 
-    feedback.assign(currentWord_.size(), LetterStatus::Absent);
-    
-    std::map<char, int> counts;
-    for (char c : currentWord_) counts[c]++;
+bool GameEngine::checkWord(std::string_view guess, int* results, std::string& error) {
+    return scoreAndRecord(guess, results, error);
+}
 
-    //перший прохід: CORRECT (Зелений)
-    for (size_t i = 0; i < currentWord_.size(); ++i) {
-        if (guess[i] == currentWord_[i]) {
-            feedback[i] = LetterStatus::Correct;
-            counts[guess[i]]--;
-        }
-    }
+bool GameEngine::checkWord(std::string_view guess, uint8_t* results, std::string& error) {
+    return scoreAndRecord(guess, results, error);
+}
 
-    //другий прохід: PRESENT (Жовтий)
-    for (size_t i = 0; i < currentWord_.size(); ++i) {
-        if (feedback[i] == LetterStatus::Correct) continue;
-        if (counts[guess[i]] > 0) {
-            feedback[i] = LetterStatus::Present;
-            counts[guess[i]]--;
+template <typename Result>
+bool GameEngine::scoreAndRecord(std::string_view guess, Result* results, std::string& error) {
+    if (asciiSecret_ && isAscii(guess)) {
+        //швидкий шлях: байт = літера
+        if (guess.size() != currentWord_.size()) {
+            error = "Invalid length";
+            return false;
+        }
+        scoreGuess(guess.data(), currentWord_.data(), guess.size(), results);
+    } else {
+        if (!decodeUtf8(guess, guessCodes_)) {
+            error = "Invalid UTF-8";
+            return false;
+        }
+        const size_t n = secretCodes_.size();
+        if (guessCodes_.size() != n) {
+            error = "Invalid length";
+            return false;
+        }
+        //ті самі два проходи, що й у scoreGuess, але за кодовими точками;
+        //використані літери секрету обнуляються в unmatched_ (0 не буває літерою)
+        unmatched_.assign(secretCodes_);
+        for (size_t i = 0; i < n; ++i) {
+            if (guessCodes_[i] == secretCodes_[i]) {
+                results[i] = static_cast<Result>(LetterStatus::Correct);
+                unmatched_[i] = 0;
+            } else {
+                results[i] = static_cast<Result>(LetterStatus::Absent);
+            }
+        }
+        for (size_t i = 0; i < n; ++i) {
+            if (results[i] == static_cast<Result>(LetterStatus::Correct)) continue;
+            for (size_t j = 0; j < n; ++j) {
+                if (unmatched_[j] == guessCodes_[i]) {
+                    results[i] = static_cast<Result>(LetterStatus::Present);
+                    unmatched_[j] = 0;
+                    break;
+                }
+            }
         }
     }
 
@@ -85,18 +458,12 @@ bool GameEngine::checkWord(const std::string& guess, std::vector<LetterStatus>&
 }
 
 std::string GameEngine::getAvailableCategories() const {
-    std::unordered_set<std::string> unique_cats;
-    for (const auto& e : words_) unique_cats.insert(e.category);
-    
-    std::string res = "Any";
-    for (const auto& c : unique_cats) res += "," + c;
-    return res;
+    return words_->getAvailableCategories();
 }
 
-std::string GameEngine::pickRandomWord(const std::vector<WordEntry>& candidates) const {
-    static std::mt19937 gen(std::random_device{}());
-    std::uniform_int_distribution<> dis(0, candidates.size() - 1);
-    return candidates[dis(gen)].word;
+size_t GameEngine::pickRandomIndex(size_t count) {
+    std::uniform_int_distribution<size_t> dis(0, count - 1);
+    return dis(rng_);
 }
 
 GameSnapshot GameEngine::getSnapshot() const {
@@ -107,8 +474,9 @@ GuessResult GameEngine::checkLetter(char letter, std::string& error) {
     if (usedLetters_.count(letter)) return GuessResult::Repeat;
     usedLetters_.insert(letter);
     bool hit = false;
-    for (size_t i = 0; i < currentWord_.size(); ++i) {
-        if (currentWord_[i] == letter) {
+    //маска індексується літерами, тож порівнюємо з кодовими точками секрету
+    for (size_t i = 0; i < secretCodes_.size(); ++i) {
+        if (secretCodes_[i] == static_cast<unsigned char>(letter)) {
             maskedWord_[i] = letter;
             hit = true;
         }
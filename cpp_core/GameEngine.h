@@ -4,24 +4,26 @@
 #include <vector>
 #include <unordered_set>
 #include <iostream>
+#include <memory>
+#include <random>
+#include <cstdint>
+#include <string_view>
+#include <unordered_map>
+
+#include "MappedFile.h"
 
 namespace guess_game {
 
 enum class LetterStatus {
-    Correct = 0, 
-    Present = 1, 
-    Absent = 2  
+    Absent = 0,
+    Present = 1,
+    Correct = 2
 };
 
 enum class GuessResult {
     Hit = 0, Miss = 1, Repeat = 2, Invalid = 3
 };
 
-struct WordEntry {
-    std::string word;
-    std::string category;
-};
-
 struct GameSnapshot {
     std::string currentWord;
     std::string maskedWord;
@@ -31,30 +33,151 @@ struct GameSnapshot {
     bool lost = false;
 };
 
+//оцінює одну спробу без виділення пам'яті: results[i] = 0-ABSENT, 1-PRESENT, 2-CORRECT
+void scoreGuess(const char* guess, const char* secret, size_t length, int* results);
+//те саме з байтовими результатами (ABI session_check_word_guess_u8)
+void scoreGuess(const char* guess, const char* secret, size_t length, uint8_t* results);
+
+//UTF-8 -> кодові точки; false для некоректної послідовності
+bool decodeUtf8(std::string_view text, std::u32string& out);
+//верхній регістр для латиниці, Latin-1, грецької та кирилиці; некоректний UTF-8 повертає як є
+std::string toUpperUtf8(std::string_view text);
+
+//бінарний словник (.gwd), little-endian; усі зміщення рахуються від початку файлу
+struct DictionaryHeader {
+    char magic[8];               // "GWDICT\0\1"
+    uint32_t version;            // 1
+    uint32_t wordCount;
+    uint32_t categoryCount;
+    uint32_t bucketCount;
+    uint32_t recordsOffset;      // wordCount x WordRecord, слова впорядковані за (довжина, текст)
+    uint32_t categoriesOffset;   // categoryCount x CategoryRecord
+    uint32_t categoryIdsOffset;  // uint32 id слів, згруповані за категоріями
+    uint32_t bucketsOffset;      // bucketCount x LengthBucket
+    uint32_t blobOffset;         // UTF-8 тексти слів і назв категорій
+    uint32_t blobSize;
+};
+
+struct WordRecord {
+    uint32_t offset;             // від початку blob
+    uint16_t length;             // у байтах
+    uint16_t category;           // NO_CATEGORY, якщо категорії немає
+};
+
+struct CategoryRecord {
+    uint32_t nameOffset;
+    uint32_t nameLength;
+    uint32_t idsFirst;
+    uint32_t idsCount;
+};
+
+struct LengthBucket {
+    uint32_t length;             // у символах
+    uint32_t first;
+    uint32_t count;
+};
+
+constexpr uint16_t NO_CATEGORY = 0xFFFF;
+constexpr uint32_t DICTIONARY_VERSION = 1;
+
+//незмінний діапазон id слів (у відображеному файлі або у власному масиві таблиці)
+struct WordIdSpan {
+    const uint32_t* ids = nullptr;
+    size_t count = 0;
+};
+
+//спільний словник: після завантаження лише читається, тому ним можуть користуватися всі сесії
+class WordTable {
+public:
+    bool loadFromFile(const std::string& path, std::string& error);
+    //рядки WORD;CATEGORY з пам'яті (напр. словник, уже нормалізований у Python)
+    bool loadFromText(std::string_view text, std::string& error);
+    //відображає .gwd у пам'ять: записи та тексти читаються прямо з файлу, без копіювання слів
+    bool loadFromBinary(const std::string& path, std::string& error);
+    //.gwd поруч із текстовим файлом, якщо він не старший за текст, інакше сам текстовий файл
+    bool loadPreferBinary(const std::string& textPath, std::string& error);
+
+    size_t size() const { return count_; }
+    std::string_view word(size_t id) const;
+    std::string_view category(size_t id) const;
+    std::string getAvailableCategories() const;
+    //id слів категорії; порожній діапазон, якщо такої категорії немає
+    WordIdSpan wordsInCategory(std::string_view category) const;
+
+private:
+    bool loadFromLines(std::istream& in, const std::string& source, std::string& error);
+    void buildCategoryIndex();
+
+    const char* blob_{nullptr};
+    const WordRecord* records_{nullptr};
+    size_t count_{0};
+    std::vector<std::string_view> categoryNames_{};
+    //індекс будується один раз при завантаженні: назва -> діапазон id у categoryIds_
+    std::vector<WordIdSpan> categoryWords_{};
+    std::unordered_map<std::string_view, uint16_t> categoryIndex_{};
+
+    //текстовий словник зберігає все тут; бінарний лише посилається на відображений файл
+    std::string ownedBlob_{};
+    std::vector<WordRecord> ownedRecords_{};
+    std::vector<uint32_t> ownedCategoryIds_{};
+    MappedFile mapping_{};
+};
+
 class GameEngine {
 public:
+    explicit GameEngine(std::shared_ptr<const WordTable> words = nullptr);
+
     bool loadWordsFromFile(const std::string& path, std::string& error);
+    void setWordTable(std::shared_ptr<const WordTable> words) { words_ = std::move(words); }
     
     bool startNewGame(int attempts, const std::string& category, std::string& error);
+    //гра з наперед відомим словом (слово дня з розкладу); чи є слово у словнику, перевіряє викликач
+    bool startGameWithWord(int attempts, const std::string& category, std::string_view word, std::string& error);
+    //детермінований вибір слів: однаковий seed дає однакову послідовність ігор
+    void seed(uint32_t value) { rng_.seed(value); }
+    //мова словника сесії (порожній рядок - основний); таблицю за мовою підставляє bridge
+    void setLanguage(std::string language) { language_ = std::move(language); }
+    const std::string& getLanguage() const { return language_; }
     
     bool checkWord(const std::string& guess, std::vector<LetterStatus>& feedback, std::string& error);
+    //гарячий шлях: без виділення пам'яті, results (по значенню на літеру) заповнює як scoreGuess.
+    //Слова в UTF-8 оцінюються за кодовими точками, ASCII - побайтово
+    bool checkWord(std::string_view guess, int* results, std::string& error);
+    bool checkWord(std::string_view guess, uint8_t* results, std::string& error);
     
     GuessResult checkLetter(char letter, std::string& error);
 
     std::string getAvailableCategories() const;
     const std::string& getCurrentCategory() const { return currentCategory_; }
+    //дешеві геттери без копій рядків (getSnapshot копіює слово й маску)
+    const std::string& getCurrentWord() const { return currentWord_; }
+    const std::string& getMaskedWord() const { return maskedWord_; }
+    int getAttemptsLeft() const { return attemptsLeft_; }
+    //довжина слова в літерах (кодових точках), а не в байтах
+    size_t getWordLength() const { return secretCodes_.size(); }
+    int getScore() const { return score_; }
     bool isWin() const { return won_; }
     bool isLose() const { return lost_; }
     GameSnapshot getSnapshot() const;
 
 private:
-    std::string pickRandomWord(const std::vector<WordEntry>& candidates) const;
+    size_t pickRandomIndex(size_t count);
+    void resetGame(int attempts, const std::string& category);
+    template <typename Result>
+    bool scoreAndRecord(std::string_view guess, Result* results, std::string& error);
     
     //інкапсуляція
-    std::vector<WordEntry> words_{}; 
+    std::shared_ptr<const WordTable> words_{};
+    std::mt19937 rng_{std::random_device{}()};
     std::string currentWord_{};
     std::string currentCategory_{}; 
     std::string maskedWord_{};
+    std::string language_{};
+    //секрет у кодових точках (декодується раз на гру) і робочі буфери оцінки, що лише перевикористовуються
+    std::u32string secretCodes_{};
+    std::u32string guessCodes_{};
+    std::u32string unmatched_{};
+    bool asciiSecret_{true};
     std::unordered_set<char> usedLetters_{};
     
     int attemptsLeft_{0};
@@ -0,0 +1,98 @@
+#include "MappedFile.h"
+
+#ifdef _WIN32
+#define WIN32_LEAN_AND_MEAN
+#include <windows.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
+namespace guess_game {
+
+MappedFile::~MappedFile() {
+    close();
+}
+
+#ifdef _WIN32
+
+bool MappedFile::open(const std::string& path, std::string& error) {
+    close();
+    HANDLE file = CreateFileA(path.c_str(), GENERIC_READ, FILE_SHARE_READ | FILE_SHARE_DELETE, nullptr, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, nullptr);
+    if (file == INVALID_HANDLE_VALUE) {
+        error = "File not found: " + path;
+        return false;
+    }
+    LARGE_INTEGER size;
+    if (!GetFileSizeEx(file, &size) || size.QuadPart == 0) {
+        CloseHandle(file);
+        error = "Empty or unreadable file: " + path;
+        return false;
+    }
+    HANDLE mapping = CreateFileMappingA(file, nullptr, PAGE_READONLY, 0, 0, nullptr);
+    if (!mapping) {
+        CloseHandle(file);
+        error = "Cannot map file: " + path;
+        return false;
+    }
+    void* view = MapViewOfFile(mapping, FILE_MAP_READ, 0, 0, 0);
+    if (!view) {
+        CloseHandle(mapping);
+        CloseHandle(file);
+        error = "Cannot map file: " + path;
+        return false;
+    }
+    file_ = file;
+    mapping_ = mapping;
+    data_ = static_cast<const char*>(view);
+    size_ = static_cast<size_t>(size.QuadPart);
+    return true;
+}
+
+void MappedFile::close() {
+    if (data_) UnmapViewOfFile(data_);
+    if (mapping_) CloseHandle(mapping_);
+    if (file_) CloseHandle(file_);
+    data_ = nullptr;
+    mapping_ = nullptr;
+    file_ = nullptr;
+    size_ = 0;
+}
+
+#else
+
+bool MappedFile::open(const std::string& path, std::string& error) {
+    close();
+    int fd = ::open(path.c_str(), O_RDONLY);
+    if (fd < 0) {
+        error = "File not found: " + path;
+        return false;
+    }
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size == 0) {
+        ::close(fd);
+        error = "Empty or unreadable file: " + path;
+        return false;
+    }
+    void* view = mmap(nullptr, static_cast<size_t>(st.st_size), PROT_READ, MAP_PRIVATE, fd, 0);
+    ::close(fd);
+    if (view == MAP_FAILED) {
+        error = "Cannot map file: " + path;
+        return false;
+    }
+    data_ = static_cast<const char*>(view);
+    size_ = static_cast<size_t>(st.st_size);
+    return true;
+}
+
+void MappedFile::close() {
+    if (data_) munmap(const_cast<char*>(data_), size_);
+    data_ = nullptr;
+    size_ = 0;
+}
+
+#endif
+
+}
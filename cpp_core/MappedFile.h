@@ -0,0 +1,31 @@
+#pragma once
+
+#include <cstddef>
+#include <string>
+
+namespace guess_game {
+
+//файл, відображений у пам'ять лише для читання; звільняється в деструкторі
+class MappedFile {
+public:
+    MappedFile() = default;
+    ~MappedFile();
+    MappedFile(const MappedFile&) = delete;
+    MappedFile& operator=(const MappedFile&) = delete;
+
+    bool open(const std::string& path, std::string& error);
+    void close();
+
+    const char* data() const { return data_; }
+    size_t size() const { return size_; }
+
+private:
+    const char* data_{nullptr};
+    size_t size_{0};
+#ifdef _WIN32
+    void* file_{nullptr};
+    void* mapping_{nullptr};
+#endif
+};
+
+}
@@ -0,0 +1,104 @@
+//мікро-бенчмарк GameEngine::checkWord: старий шлях (std::map + std::vector + копія в int*)
+//проти нового (масив лічильників, запис одразу в буфер викликача)
+//
+//  cmake -S cpp_core -B build -DGAME_CORE_BENCHMARKS=ON && cmake --build build --config Release
+//  ./build/check_word_bench [guesses] [word length]
+#include "GameEngine.h"
+
+#include <chrono>
+#include <climits>
+#include <cstdio>
+#include <cstdlib>
+#include <filesystem>
+#include <fstream>
+#include <map>
+#include <random>
+#include <string>
+#include <vector>
+
+using guess_game::GameEngine;
+using guess_game::LetterStatus;
+
+namespace {
+
+//копія checkWord до оптимізації, щоб порівнювати в одному запуску
+bool legacyCheckWord(const std::string& secret, const std::string& guess, std::vector<LetterStatus>& feedback) {
+    if (guess.size() != secret.size()) return false;
+    feedback.assign(secret.size(), LetterStatus::Absent);
+    std::map<char, int> counts;
+    for (char c : secret) counts[c]++;
+    for (size_t i = 0; i < secret.size(); ++i) {
+        if (guess[i] == secret[i]) {
+            feedback[i] = LetterStatus::Correct;
+            counts[guess[i]]--;
+        }
+    }
+    for (size_t i = 0; i < secret.size(); ++i) {
+        if (feedback[i] == LetterStatus::Correct) continue;
+        if (counts[guess[i]] > 0) {
+            feedback[i] = LetterStatus::Present;
+            counts[guess[i]]--;
+        }
+    }
+    return true;
+}
+
+std::vector<std::string> randomWords(size_t count, size_t length, unsigned seed) {
+    std::mt19937 rng(seed);
+    std::uniform_int_distribution<int> letter('A', 'Z');
+    std::vector<std::string> words(count, std::string(length, 'A'));
+    for (auto& w : words) {
+        for (char& c : w) c = static_cast<char>(letter(rng));
+    }
+    return words;
+}
+
+template <typename Fn>
+double guessesPerSecond(size_t iterations, Fn&& fn) {
+    auto start = std::chrono::steady_clock::now();
+    for (size_t i = 0; i < iterations; ++i) fn(i);
+    std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    return iterations / elapsed.count();
+}
+
+}
+
+int main(int argc, char** argv) {
+    const size_t iterations = argc > 1 ? std::strtoull(argv[1], nullptr, 10) : 5000000;
+    const size_t length = argc > 2 ? std::strtoull(argv[2], nullptr, 10) : 5;
+    const auto guesses = randomWords(4096, length, 1);
+
+    //словник з одного слова, щоб секрет був відомий і однаковий для обох шляхів
+    const auto secret = randomWords(1, length, 2).front();
+    auto path = std::filesystem::temp_directory_path() / "check_word_bench_words.txt";
+    std::ofstream(path) << secret << ";BENCH\n";
+    GameEngine engine;
+    std::string error;
+    if (!engine.loadWordsFromFile(path.string(), error) || !engine.startNewGame(INT_MAX, "Any", error)) {
+        std::fprintf(stderr, "setup failed: %s\n", error.c_str());
+        return 1;
+    }
+    std::filesystem::remove(path);
+
+    long long checksum = 0;
+    std::vector<int> results(length);
+
+    const double before = guessesPerSecond(iterations, [&](size_t i) {
+        //як у старому bridge.cpp: вектор статусів на кожну спробу і копія в int*
+        std::vector<LetterStatus> feedback;
+        legacyCheckWord(secret, guesses[i & 4095], feedback);
+        for (size_t k = 0; k < feedback.size(); ++k) results[k] = static_cast<int>(feedback[k]);
+        checksum += results[0];
+    });
+
+    const double after = guessesPerSecond(iterations, [&](size_t i) {
+        engine.checkWord(std::string_view(guesses[i & 4095]), results.data(), error);
+        checksum += results[0];
+    });
+
+    std::printf(
+        "{\"benchmark\": \"check_word\", \"iterations\": %zu, \"length\": %zu, "
+        "\"before_guesses_per_s\": %.0f, \"after_guesses_per_s\": %.0f, \"speedup\": %.2f, \"checksum\": %lld}\n",
+        iterations, length, before, after, after / before, checksum);
+    return 0;
+}
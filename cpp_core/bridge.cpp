@@ -2,8 +2,13 @@
 #include <vector>
 #include <string>
 #include <cstring>
+#include <algorithm>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
 
-static guess_game::GameEngine engine;
+using guess_game::GameEngine;
+using guess_game::WordTable;
 
 #ifdef _WIN32
 #define EXPORT __declspec(dllexport)
@@ -11,52 +16,235 @@ static guess_game::GameEngine engine;
 #define EXPORT
 #endif
 
+//словники спільні для всіх сесій і змінюються лише цілком (заміною вказівника);
+//ключ - мова, порожній рядок - основний словник
+static std::mutex words_mutex;
+static std::unordered_map<std::string, std::shared_ptr<const WordTable>> language_words{
+    {"", std::make_shared<const WordTable>()},
+};
+static int words_generation = 0;
+
+//nullptr, якщо словник цієї мови не завантажено
+static std::shared_ptr<const WordTable> current_words(const std::string& language = "") {
+    std::lock_guard<std::mutex> lock(words_mutex);
+    auto it = language_words.find(language);
+    return it != language_words.end() ? it->second : nullptr;
+}
+
+//сесія за замовчуванням для старого API без дескрипторів
+static GameEngine& default_engine() {
+    static GameEngine engine;
+    return engine;
+}
+
+//копіює рядок у буфер викликача; повертає потрібну довжину без нуль-термінатора
+static int copy_out(const std::string& value, char* buffer, int size) {
+    if (buffer && size > 0) {
+        size_t n = std::min(value.size(), static_cast<size_t>(size - 1));
+        std::memcpy(buffer, value.data(), n);
+        buffer[n] = '\0';
+    }
+    return static_cast<int>(value.size());
+}
+
+static int status_of(const GameEngine& engine) {
+    if (engine.isWin()) return 1;
+    if (engine.isLose()) return -1;
+    return 0;
+}
+
+//стан гри для session_get_state; розкладка має збігатися з NativeGameState у core_bridge.py
+struct SessionState {
+    int32_t attempts_left;
+    int32_t status;        //1 - перемога, -1 - поразка, 0 - гра триває
+    int32_t word_length;
+    int32_t score;
+};
+
+//атомарно підміняє таблицю мови; повертає кількість слів
+static int install_words(const char* language, std::shared_ptr<WordTable> table) {
+    const int count = static_cast<int>(table->size());
+    std::lock_guard<std::mutex> lock(words_mutex);
+    language_words[language ? language : ""] = std::move(table);
+    ++words_generation;
+    return count;
+}
+
 extern "C" {
 
+    //завантажує словник мови (текст або .gwd поруч) і атомарно підміняє її таблицю.
+    //Нова таблиця будується поза блокуванням у потоці викликача; сесії, що вже грають,
+    //тримають свій shared_ptr на стару таблицю, доки не почнуть нову гру.
+    //language NULL або "" - основний словник. Повертає кількість слів або -1 (текст помилки - у error)
+    EXPORT int load_language_words(const char* language, const char* path, char* error, int error_size) {
+        std::string message;
+        auto table = std::make_shared<WordTable>();
+        if (!path || !table->loadPreferBinary(path, message)) {
+            copy_out(path ? message : "No path", error, error_size);
+            return -1;
+        }
+        return install_words(language, std::move(table));
+    }
+
+    //як load_language_words, але рядки WORD;CATEGORY передаються з пам'яті (size байтів).
+    //Python передає сюди вже нормалізовані (str.upper()) слова, тож обидві сторони бачать ті самі секрети
+    EXPORT int load_language_text(const char* language, const char* text, int size, char* error, int error_size) {
+        std::string message;
+        auto table = std::make_shared<WordTable>();
+        if (!text || size < 0 || !table->loadFromText(std::string_view(text, static_cast<size_t>(size)), message)) {
+            copy_out(text ? message : "No text", error, error_size);
+            return -1;
+        }
+        return install_words(language, std::move(table));
+    }
+
+    EXPORT int load_words(const char* path, char* error, int error_size) {
+        return load_language_words(nullptr, path, error, error_size);
+    }
+
+    //зростає з кожною успішною заміною словника
+    EXPORT int get_words_generation() {
+        std::lock_guard<std::mutex> lock(words_mutex);
+        return words_generation;
+    }
+
     EXPORT void init_db() {
+        load_words("words.txt", nullptr, 0);
+    }
+
+    // ---- API сесій: кожен виклик отримує дескриптор власної гри ----
+
+    EXPORT GameEngine* create_session() {
+        return new GameEngine(current_words());
+    }
+
+    EXPORT void destroy_session(GameEngine* session) {
+        delete session;
+    }
+
+    //наступні ігри сесії беруть слова зі словника language (NULL або "" - основний).
+    //1 - успіх, 0 - словник цієї мови не завантажено (мова сесії не змінюється)
+    EXPORT int session_set_language(GameEngine* session, const char* language) {
+        if (!session) return 0;
+        std::string name = language ? language : "";
+        if (!current_words(name)) return 0;
+        session->setLanguage(std::move(name));
+        return 1;
+    }
+
+    //1 - гру розпочато, 0 - помилка (немає слів у категорії)
+    EXPORT int session_start_game(GameEngine* session, const char* category, int attempts) {
+        if (!session) return 0;
         std::string error;
-        engine.loadWordsFromFile("words.txt", error);
+        auto words = current_words(session->getLanguage());
+        if (!words) return 0;
+        session->setWordTable(std::move(words));
+        return session->startNewGame(attempts, category ? category : "Any", error) ? 1 : 0;
     }
 
-    EXPORT void start_game(const char* category) {
+    //1 - гру розпочато з word (напр. слово дня з розкладу), 0 - помилка
+    EXPORT int session_start_with_word(GameEngine* session, const char* category, const char* word, int attempts) {
+        if (!session || !word) return 0;
         std::string error;
-        engine.startNewGame(5, category, error);
+        auto words = current_words(session->getLanguage());
+        if (!words) return 0;
+        session->setWordTable(std::move(words));
+        return session->startGameWithWord(attempts, category ? category : "Any", word, error) ? 1 : 0;
+    }
+
+    //однаковий seed - однакова послідовність слів у session_start_game (для відтворюваних прогонів)
+    EXPORT void session_seed(GameEngine* session, unsigned int seed) {
+        if (session) session->seed(seed);
+    }
+
+    EXPORT int session_get_secret(GameEngine* session, char* buffer, int size) {
+        if (!session) return copy_out("", buffer, size);
+        return copy_out(session->getCurrentWord(), buffer, size);
+    }
+
+    EXPORT int session_get_lives(GameEngine* session) {
+        return session ? session->getAttemptsLeft() : 0;
+    }
+
+    //увесь стан за один виклик: заповнює state і маску (як copy_out, mask може бути NULL).
+    //Повертає 1 при успіху, 0 якщо немає сесії чи state
+    EXPORT int session_get_state(GameEngine* session, SessionState* state, char* mask, int mask_size) {
+        if (!session || !state) return 0;
+        state->attempts_left = session->getAttemptsLeft();
+        state->status = status_of(*session);
+        state->word_length = static_cast<int32_t>(session->getWordLength());
+        state->score = session->getScore();
+        copy_out(session->getMaskedWord(), mask, mask_size);
+        return 1;
+    }
+
+    //0-ABSENT, 1-PRESENT, 2-CORRECT; повертає 1 при успіху
+    EXPORT int session_check_word_guess(GameEngine* session, const char* guess, int* results) {
+        if (!session || !guess || !results) return 0;
+        //результати пишуться одразу в буфер викликача, без проміжного вектора
+        std::string error;
+        return session->checkWord(std::string_view(guess), results, error) ? 1 : 0;
+    }
+
+    //те саме, але по одному байту на літеру: менший буфер, який Python тримає на сесію й читає через memoryview
+    EXPORT int session_check_word_guess_u8(GameEngine* session, const char* guess, uint8_t* results) {
+        if (!session || !guess || !results) return 0;
+        std::string error;
+        return session->checkWord(std::string_view(guess), results, error) ? 1 : 0;
+    }
+
+    EXPORT int session_get_game_status(GameEngine* session) {
+        return session ? status_of(*session) : 0;
+    }
+
+    //оцінює count спроб, упакованих підряд по length байтів, проти secret;
+    //results має вміщати count * length значень. Повертає кількість оцінених спроб або -1
+    EXPORT int evaluate_many(const char* guesses, int count, int length, const char* secret, int* results) {
+        if (!guesses || !secret || !results || count < 0 || length <= 0) return -1;
+        if (std::strlen(secret) != static_cast<size_t>(length)) return -1;
+        const size_t n = static_cast<size_t>(length);
+        for (int g = 0; g < count; ++g) {
+            guess_game::scoreGuess(guesses + g * n, secret, n, results + g * n);
+        }
+        return count;
+    }
+
+    EXPORT int copy_categories(char* buffer, int size) {
+        std::string cats = current_words()->getAvailableCategories();
+        for (char &c : cats) if (c == ',') c = '|';
+        return copy_out(cats, buffer, size);
+    }
+
+    // ---- старий API з однією глобальною грою (залишено для сумісності) ----
+
+    EXPORT void start_game(const char* category) {
+        session_start_game(&default_engine(), category, 5);
     }
 
     EXPORT const char* get_secret() {
         static std::string secret;
-        secret = engine.getSnapshot().currentWord;
+        secret = default_engine().getCurrentWord();
         return secret.c_str();
     }
 
     EXPORT int get_lives() {
-        return engine.getSnapshot().attemptsLeft;
+        return session_get_lives(&default_engine());
     }
 
     //0-ABSENT, 1-PRESENT, 2-CORRECT
     EXPORT void check_word_guess(const char* guess, int* results) {
-        std::vector<guess_game::LetterStatus> feedback;
-        std::string error;
-        
-        if (engine.checkWord(guess, feedback, error)) {
-            for (size_t i = 0; i < feedback.size(); ++i) {
-                results[i] = static_cast<int>(feedback[i]);
-            }
-        }
+        session_check_word_guess(&default_engine(), guess, results);
     }
 
     //1 - перемога, -1 - поразка, 0 - гра триває
     EXPORT int get_game_status() {
-        auto snapshot = engine.getSnapshot();
-        if (snapshot.won) return 1;
-        if (snapshot.lost) return -1;
-        return 0;
+        return status_of(default_engine());
     }
 
     EXPORT const char* get_categories() {
         static std::string cats;
-        cats = engine.getAvailableCategories();
+        cats = current_words()->getAvailableCategories();
         for (char &c : cats) if (c == ',') c = '|';
         return cats.c_str();
     }
-}
\ No newline at end of file
+}
@@ -1,8 +1,12 @@
 @echo off
 echo Компілюємо з примусовим експортом функцій...
-cl /EHsc /MD /LD bridge.cpp GameEngine.cpp ^
+cl /EHsc /MD /LD /std:c++17 bridge.cpp GameEngine.cpp MappedFile.cpp ^
    /link ^
    /EXPORT:init_db ^
+   /EXPORT:load_words ^
+   /EXPORT:load_language_words ^
+   /EXPORT:load_language_text ^
+   /EXPORT:get_words_generation ^
    /EXPORT:get_categories ^
    /EXPORT:get_category ^
    /EXPORT:start_game ^
@@ -10,6 +14,20 @@ cl /EHsc /MD /LD bridge.cpp GameEngine.cpp ^
    /EXPORT:get_secret ^
    /EXPORT:get_lives ^
    /EXPORT:get_game_status ^
+   /EXPORT:create_session ^
+   /EXPORT:destroy_session ^
+   /EXPORT:session_start_game ^
+   /EXPORT:session_start_with_word ^
+   /EXPORT:session_seed ^
+   /EXPORT:session_set_language ^
+   /EXPORT:session_get_secret ^
+   /EXPORT:session_get_lives ^
+   /EXPORT:session_check_word_guess ^
+   /EXPORT:session_check_word_guess_u8 ^
+   /EXPORT:session_get_game_status ^
+   /EXPORT:session_get_state ^
+   /EXPORT:copy_categories ^
+   /EXPORT:evaluate_many ^
    /OUT:game_core.dll
 
 if exist game_core.dll (
@@ -1,30 +1,79 @@
 from __future__ import annotations
 
+import time
+_STARTED_AT = time.perf_counter()
+
+import argparse
 import webbrowser
 import json
 import sys
-import time
 import random
-from dataclasses import dataclass
-import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum, IntEnum
 from pathlib import Path
 from tkinter import messagebox
 import os
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "1"
-import pygame
-from pygame.locals import *
-from OpenGL.GL import *
-from OpenGL.GLU import *
+# customtkinter stays a module-level import: the frame classes below subclass its widgets.
 import customtkinter as ctk
 
-from core_bridge import GameCore
+from core_bridge import DEFAULT_LANGUAGE, GameCore, find_library, language_words_path
+from stats import SQLiteStatsStore, StatsStore, open_stats_store
+
+UI_DIR = Path(__file__).resolve().parent
+STARTUP_MARKS: dict[str, float] = {}
+
+
+def _mark(name: str) -> None:
+    STARTUP_MARKS[name] = round((time.perf_counter() - _STARTED_AT) * 1000, 1)
+
+
+def resolve_library_path(ui_dir: Path = UI_DIR) -> Path:
+    found = find_library(ui_dir)
+    dest = ui_dir / found.name
+    if found.resolve() != dest.resolve():
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        from shutil import copy2
+
+        copy2(found, dest)
+    return dest
+
+
+def load_core(ui_dir: Path = UI_DIR) -> GameCore:
+    words_path = ui_dir.parent / "words.txt"
+    core = GameCore(resolve_library_path(ui_dir), words_path)
+    # Dictionaries for the other UI languages live next to it: words_uk.txt and so on.
+    for language in Language:
+        path = language_words_path(words_path, language.value)
+        if language.value != DEFAULT_LANGUAGE and path.exists():
+            try:
+                core.load_language(language.value, path)
+            except (OSError, ValueError, RuntimeError) as e:
+                print(f"[WARNING] Failed to load {path}: {e}")
+    _mark("core_loaded")
+    return core
+
+
+def _preload_audio() -> None:
+    import pygame  # noqa: F401
+
 
 def run_intro():
+    # pygame and PyOpenGL are only needed here and for music, so they are imported on demand.
+    import pygame
+    from OpenGL.GL import (
+        GL_BLEND, GL_COLOR_BUFFER_BIT, GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_LINES, GL_MODELVIEW,
+        GL_ONE_MINUS_SRC_ALPHA, GL_PROJECTION, GL_QUADS, GL_RGBA, GL_SRC_ALPHA, GL_UNSIGNED_BYTE,
+        glBegin, glBlendFunc, glClear, glClearColor, glColor3fv, glDisable, glDrawPixels, glEnable,
+        glEnd, glLineWidth, glLoadIdentity, glMatrixMode, glPopMatrix, glPushMatrix, glRasterPos2f,
+        glRotatef, glTranslatef, glVertex3fv,
+    )
+    from OpenGL.GLU import gluOrtho2D, gluPerspective
+
     pygame.init()
     display = (800, 600)
     
-    pygame.display.set_mode(display, DOUBLEBUF | OPENGL | NOFRAME)
+    pygame.display.set_mode(display, pygame.DOUBLEBUF | pygame.OPENGL | pygame.NOFRAME)
     pygame.display.set_caption("Leksa Game Intro")
 
     glMatrixMode(GL_PROJECTION)
@@ -150,6 +199,10 @@ TRANSLATIONS = {
         "stats_wins": "Wins: {value}",
         "stats_losses": "Losses: {value}",
         "stats_rate": "Win rate: {value:.1f}%",
+        "stats_by_category": "By category",
+        "stats_by_length": "By word length",
+        "stats_distribution": "Guesses per win",
+        "stats_hardest": "Hardest words",
         "game_title": "Daily Puzzle",
         "btn_restart": "Restart",
         "btn_back": "Back",
@@ -179,6 +232,10 @@ TRANSLATIONS = {
         "stats_wins": "Перемоги: {value}",
         "stats_losses": "Поразки: {value}",
         "stats_rate": "Відсоток перемог: {value:.1f}%",
+        "stats_by_category": "За категоріями",
+        "stats_by_length": "За довжиною слова",
+        "stats_distribution": "Спроб до перемоги",
+        "stats_hardest": "Найважчі слова",
         "game_title": "Щоденний челендж",
         "btn_restart": "Рестарт",
         "btn_back": "Назад",
@@ -244,29 +301,6 @@ CATEGORY_TRANSLATIONS = {
     },
 }
 
-WORD_TRANSLATIONS_MAP = {
-    "PYTHON": "ПАЙТОН", "JAVA": "ДЖАВА", "SCRIPT": "СКРИПТ", "CPP": "СІПЛЮС", "RUBY": "РУБІ", "SWIFT": "СВІФТ",
-    "SERVER": "СЕРВЕР", "DATABASE": "БАЗА", "NETWORK": "МЕРЕЖА", "INTERNET": "ІНТЕРНЕТ", "CLOUD": "ХМАРА", "ROBOT": "РОБОТ",
-    "LINUX": "ЛІНУКС", "WINDOWS": "ВІНДОВС", "MACOS": "МАКОС", "ANDROID": "АНДРОЇД", "UNIX": "ЮНІКС",
-    "DISPLAY": "ЕКРАН", "MONITOR": "МОНІТОР", "KEYBOARD": "КЛАВІАТУРА", "LAPTOP": "НОУТБУК", "MEMORY": "ПАМЯТЬ", "CAMERA": "КАМЕРА",
-    "MOUSE": "МИША", "PRINTER": "ПРИНТЕР", "ROUTER": "РОУТЕР",
-    "UKRAINE": "УКРАЇНА", "POLAND": "ПОЛЬЩА", "FRANCE": "ФРАНЦІЯ", "CANADA": "КАНАДА", "BRAZIL": "БРАЗИЛІЯ",
-    "JAPAN": "ЯПОНІЯ", "ITALY": "ІТАЛІЯ", "SPAIN": "ІСПАНІЯ", "CHINA": "КИТАЙ",
-    "LONDON": "ЛОНДОН", "PARIS": "ПАРИЖ", "KYIV": "КИЇВ", "BERLIN": "БЕРЛІН", "TOKYO": "ТОКІО", "LVIV": "ЛЬВІВ", "ROME": "РИМ", "OSLO": "ОСЛО",
-    "APPLE": "ЯБЛУКО", "BANANA": "БАНАН", "ORANGE": "АПЕЛЬСИН", "LEMON": "ЛИМОН", "CHERRY": "ВИШНЯ", "MANGO": "МАНГО", "PEACH": "ПЕРСИК", "GRAPE": "ВИНОГРАД",
-    "PIZZA": "ПІЦА", "BURGER": "БУРГЕР", "SUSHI": "СУШІ", "PASTA": "ПАСТА", "BREAD": "ХЛІБ", "SOUP": "СУП", "STEAK": "СТЕЙК", "CAKE": "ТОРТ",
-    "TIGER": "ТИГР", "EAGLE": "ОРЕЛ", "SHARK": "АКУЛА", "PANDA": "ПАНДА", "ZEBRA": "ЗЕБРА", "HORSE": "КІНЬ", "RABBIT": "КРОЛИК", "LION": "ЛЕВ", "WOLF": "ВОВК", "BEAR": "ВЕДМІДЬ",
-    "TOYOTA": "ТОЙОТА", "TESLA": "ТЕСЛА", "HONDA": "ХОНДА", "VOLVO": "ВОЛЬВО", "FORD": "ФОРД", "BMW": "БМВ", "AUDI": "АУДІ", "NISSAN": "НІССАН",
-    "SOCCER": "ФУТБОЛ", "TENNIS": "ТЕНІС", "HOCKEY": "ХОКЕЙ", "BOXING": "БОКС", "RUGBY": "РЕГБІ", "GOLF": "ГОЛЬФ", "JUDO": "ДЗЮДО",
-    "DOCTOR": "ЛІКАР", "DRIVER": "ВОДІЙ", "ARTIST": "МИТЕЦЬ", "FARMER": "ФЕРМЕР", "PILOT": "ПІЛОТ", "CHEF": "КУХАР", "NURSE": "МЕДСЕСТРА",
-    "GALAXY": "ГАЛАКТИКА", "PLANET": "ПЛАНЕТА", "ORBIT": "ОРБІТА", "ROCKET": "РАКЕТА", "MOON": "МІСЯЦЬ", "MARS": "МАРС", "STAR": "ЗІРКА",
-    "SUMMER": "ЛІТО", "WINTER": "ЗИМА", "AUTUMN": "ОСІНЬ", "SPRING": "ВЕСНА",
-    "YELLOW": "ЖОВТИЙ", "PURPLE": "ФІОЛЕТОВИЙ", "SILVER": "СРІБНИЙ", "RED": "ЧЕРВОНИЙ", "BLUE": "СИНІЙ", "GREEN": "ЗЕЛЕНИЙ",
-    "SCHOOL": "ШКОЛА", "LESSON": "УРОК", "STUDENT": "СТУДЕНТ", "TEACHER": "ВЧИТЕЛЬ", "BOOK": "КНИГА", "EXAM": "ЕКЗАМЕН",
-    "FAMILY": "СІМЯ", "FRIEND": "ДРУГ", "MARKET": "РИНОК", "PARTY": "ВЕЧІРКА", "TEAM": "КОМАНДА", "GROUP": "ГРУПА",
-    "MONEY": "ГРОШІ", "DOLLAR": "ДОЛАР", "EURO": "ЄВРО", "BANK": "БАНК", "COIN": "МОНЕТА"
-}
-
 class LetterStatus(IntEnum):
     ABSENT = 0
     PRESENT = 1
@@ -279,53 +313,6 @@ STATUS_COLORS = {
     LetterStatus.ABSENT: "#c0392b",
 }
 
-@dataclass
-class GameStats:
-    wins: int = 0
-    losses: int = 0
-
-    @property
-    def total(self) -> int:
-        return self.wins + self.losses
-
-    @property
-    def win_rate(self) -> float:
-        return (self.wins / self.total) * 100 if self.total else 0.0
-
-
-class StatsStore:
-    def __init__(self, path: Path, persist: bool = True):
-        self.path = path
-        self.persist = bool(persist)
-        self.data = GameStats()
-        if self.persist:
-            self._load()
-                            
-    def _load(self) -> None:
-        if not self.path.exists():
-            return
-        try:
-            with self.path.open("r", encoding="utf-8") as fh:
-                raw = json.load(fh)
-            self.data = GameStats(**raw)
-        except Exception:
-            self.data = GameStats()
-
-    def save(self) -> None:
-        if not self.persist:
-            return
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as fh:
-            json.dump(self.data.__dict__, fh, indent=2)
-
-    def record(self, won: bool) -> None:
-        if won:
-            self.data.wins += 1
-        else:
-            self.data.losses += 1
-        self.save()
-
-
 class MenuFrame(ctk.CTkFrame):
     def __init__(self, master: "GameApp"):
         super().__init__(master, fg_color="white")
@@ -391,19 +378,48 @@ class StatsFrame(ctk.CTkFrame):
         self.win_label = ctk.CTkLabel(self, font=("Segoe UI", 20))
         self.loss_label = ctk.CTkLabel(self, font=("Segoe UI", 20))
         self.rate_label = ctk.CTkLabel(self, font=("Segoe UI", 20))
+        self.details_label = ctk.CTkLabel(self, font=("Consolas", 14), justify="left", text="")
         self.back_button = ctk.CTkButton(self, width=160, command=self.master_app.show_menu)
 
-        self.title_label.pack(pady=30)
+        self.title_label.pack(pady=(30, 15))
         self.win_label.pack(pady=5)
         self.loss_label.pack(pady=5)
         self.rate_label.pack(pady=5)
+        self.details_label.pack(pady=(10, 0))
         self.back_button.pack(pady=25)
 
     def refresh(self) -> None:
-        stats = self.master_app.stats_store.data
+        store = self.master_app.stats_store
+        stats = store.data
         self.win_label.configure(text=self.master_app.t("stats_wins", value=stats.wins))
         self.loss_label.configure(text=self.master_app.t("stats_losses", value=stats.losses))
         self.rate_label.configure(text=self.master_app.t("stats_rate", value=stats.win_rate))
+        self.details_label.configure(text=self._details(store))
+
+    def _details(self, store: StatsStore) -> str:
+        if not isinstance(store, SQLiteStatsStore):
+            return ""
+        t = self.master_app.t
+        lines = []
+        by_category = store.win_rate_by_category()[:5]
+        if by_category:
+            lines.append(t("stats_by_category"))
+            for category, games, rate in by_category:
+                name = self.master_app.get_friendly_category_name(category)
+                lines.append(f"  {name[:18]:<18} {games:>6}  {rate:5.1f}%")
+        by_length = store.win_rate_by_length()
+        if by_length:
+            lines.append(t("stats_by_length"))
+            lines.append("  " + "  ".join(f"{length}: {rate:.0f}%" for length, _, rate in by_length))
+        distribution = store.guess_distribution()
+        if distribution:
+            lines.append(t("stats_distribution"))
+            lines.append("  " + "  ".join(f"{guesses}: {games}" for guesses, games in distribution.items()))
+        hardest = store.hardest_words(limit=3)
+        if hardest:
+            lines.append(t("stats_hardest"))
+            lines.append("  " + ", ".join(f"{word} ({loss_rate:.0f}%)" for word, _, loss_rate, _ in hardest))
+        return "\n".join(lines)
 
     def refresh_texts(self) -> None:
         self.title_label.configure(text=self.master_app.t("stats_title"))
@@ -411,6 +427,41 @@ class StatsFrame(ctk.CTkFrame):
         self.refresh()
 
 
+class TileRow:
+    """Letter tiles inside ``frame`` that are reused: a tile is reconfigured only when its cell changes."""
+
+    def __init__(self, frame: ctk.CTkFrame, size: int, corner_radius: int, font: tuple, padx: int, pady: int = 0):
+        self.frame = frame
+        self._tile_kwargs = dict(width=size, height=size, corner_radius=corner_radius, font=font)
+        self._padx = padx
+        self._pady = pady
+        self.tiles: list[ctk.CTkLabel] = []
+        self._cells: list[tuple[str, str, str] | None] = []
+        self._visible = 0
+
+    def reserve(self, count: int) -> None:
+        while len(self.tiles) < count:
+            self.tiles.append(ctk.CTkLabel(self.frame, text="", **self._tile_kwargs))
+            self._cells.append(None)
+
+    def show(self, cells: list[tuple[str, str, str]]) -> None:
+        """Display ``(letter, background, text color)`` cells; surplus tiles are hidden, not destroyed."""
+        count = len(cells)
+        self.reserve(count)
+        for idx, cell in enumerate(cells):
+            if self._cells[idx] != cell:
+                text, bg, fg = cell
+                self.tiles[idx].configure(text=text, fg_color=bg, text_color=fg)
+                self._cells[idx] = cell
+        if count < self._visible:
+            for tile in self.tiles[count:self._visible]:
+                tile.pack_forget()
+        else:
+            for tile in self.tiles[self._visible:count]:
+                tile.pack(side="left", padx=self._padx, pady=self._pady)
+        self._visible = count
+
+
 class GameFrame(ctk.CTkFrame):
     def __init__(self, master: "GameApp"):
         super().__init__(master, fg_color="white")
@@ -419,11 +470,16 @@ class GameFrame(ctk.CTkFrame):
         self._game_over = False
         self._latest_secret = ""
         self.hearts: list[ctk.CTkLabel] = []
-        self.guess_rows: list[ctk.CTkFrame] = []
-        self.placeholder_tiles: list[ctk.CTkLabel] = []
+        # Tiles are created once and only reconfigured between updates and games.
+        self.guess_rows: list[TileRow] = []
+        self._rows_in_use = 0
         
         self.revealed_indices = set()
         self.life_penalty = 0
+        self.hint_engine = None
+        self._guess_count = 0
+        self._guess_history: list[tuple[str, list[int]]] = []
+        self._started_at = time.monotonic()
 
         self.top_bar = ctk.CTkFrame(self, fg_color="white")
         self.title_label = ctk.CTkLabel(self.top_bar, font=("Segoe UI", 26, "bold"))
@@ -467,6 +523,7 @@ class GameFrame(ctk.CTkFrame):
         self.hearts_frame.pack(side="top")
 
         self.placeholder_row = ctk.CTkFrame(self, fg_color="white")
+        self.placeholder_tiles = TileRow(self.placeholder_row, 48, 6, ("Consolas", 24, "bold"), padx=4, pady=4)
         self.guess_container = ctk.CTkScrollableFrame(self, fg_color="#f8f8f8")
 
         self.input_row = ctk.CTkFrame(self, fg_color="white")
@@ -499,8 +556,14 @@ class GameFrame(ctk.CTkFrame):
             messagebox.showinfo("Hint", self.master_app.t("msg_hint_all_revealed"))
             return
 
-        idx_to_reveal = random.choice(available_indices)
+        idx_to_reveal = None
+        if self.hint_engine is not None:
+            idx_to_reveal = self.hint_engine.best_reveal_position(exclude=self.revealed_indices)
+        if idx_to_reveal is None:
+            idx_to_reveal = random.choice(available_indices)
         self.revealed_indices.add(idx_to_reveal)
+        if self.hint_engine is not None:
+            self.hint_engine.apply_reveal(idx_to_reveal, secret[idx_to_reveal])
         
         self.life_penalty += 1
         self._update_state()
@@ -541,10 +604,11 @@ class GameFrame(ctk.CTkFrame):
         self.back_button.pack(side="left", padx=5)
 
     def _build_hearts(self) -> None:
-        for h in self.hearts:
-            h.destroy()
-        self.hearts.clear()
-        for _ in range(self.master_app.attempts_per_game):
+        count = self.master_app.attempts_per_game
+        for heart in self.hearts[count:]:
+            heart.destroy()
+        del self.hearts[count:]
+        while len(self.hearts) < count:
             heart = ctk.CTkLabel(self.hearts_frame, text="♥", font=("Segoe UI", 26), text_color="#c0392b")
             heart.pack(side="left", padx=2)
             self.hearts.append(heart)
@@ -561,30 +625,17 @@ class GameFrame(ctk.CTkFrame):
             return
 
         try:
-            secret = self.master_app.core.get_secret() or b""
-            if isinstance(secret, bytes):
-                secret = secret.decode("utf-8")
-            
-            import re
-            secret = re.sub(r'[^A-Z]', '', secret.upper())
-            
+            # The word already comes from the current language's dictionary (see GameApp._apply_language).
+            secret = (self.master_app.core.get_secret() or "").strip().upper()
         except Exception:
             secret = ""
 
-        if self.master_app.language == Language.UK:
-            if secret in WORD_TRANSLATIONS_MAP:
-                uk_secret = WORD_TRANSLATIONS_MAP[secret]
-                
-                self.master_app.core._local_secret = uk_secret
-                self.master_app.core._use_local_emulation = True
-                self.master_app.core._local_attempts = self.master_app.attempts_per_game
-                self.master_app.core._local_won = False
-                self.master_app.core._local_lost = False
-                
-                secret = uk_secret
-
         self._latest_secret = secret
         self.word_length = len(secret) if secret else 5
+        self._guess_count = 0
+        self._guess_history = []
+        self._started_at = time.monotonic()
+        self.hint_engine = self._build_hint_engine(secret, selected_category)
         self._game_over = False
         self.entry.configure(state="normal")
         self.submit_button.configure(state="normal")
@@ -592,15 +643,36 @@ class GameFrame(ctk.CTkFrame):
         self.entry.delete(0, "end")
         self._reset_board()
         self._build_hearts()
+        self._reserve_guess_rows(self.master_app.attempts_per_game, self.word_length)
         self._update_state()
 
+    def _build_hint_engine(self, secret: str, category: str):
+        if not secret:
+            return None
+        # hints pulls in NumPy, so it is imported with the first game rather than at startup.
+        try:
+            from hints import HintEngine
+        except ImportError:
+            return None
+        core = self.master_app.core
+        words = core.filter_words_by_category(category) or core.filter_words_by_category("Any")
+        try:
+            return HintEngine(words + [secret], len(secret))
+        except Exception as e:
+            print(f"[WARNING] Hint engine unavailable: {e}")
+            return None
+
     def _reset_board(self) -> None:
+        for row in self.guess_rows[:self._rows_in_use]:
+            row.frame.pack_forget()
+        self._rows_in_use = 0
+
+    def _reserve_guess_rows(self, rows: int, length: int) -> None:
+        while len(self.guess_rows) < rows:
+            frame = ctk.CTkFrame(self.guess_container, fg_color="#f8f8f8")
+            self.guess_rows.append(TileRow(frame, 60, 8, ("Consolas", 28, "bold"), padx=5))
         for row in self.guess_rows:
-            row.destroy()
-        self.guess_rows.clear()
-        for t in self.placeholder_tiles:
-            t.destroy()
-        self.placeholder_tiles.clear()
+            row.reserve(length)
 
     def _submit_guess(self) -> None:
         if self._game_over:
@@ -618,47 +690,36 @@ class GameFrame(ctk.CTkFrame):
             return
 
         self.entry.delete(0, "end")
+        self._guess_count += 1
+        self._guess_history.append((guess, list(statuses)))
+        if self.hint_engine is not None:
+            self.hint_engine.apply_feedback(guess, statuses)
         self._append_guess_row(guess, statuses)
         self._update_state()
 
     def _append_guess_row(self, word: str, statuses: list[int]) -> None:
-        row = ctk.CTkFrame(self.guess_container, fg_color="#f8f8f8")
-        row.pack(pady=5)
+        self._reserve_guess_rows(self._rows_in_use + 1, len(word))
+        row = self.guess_rows[self._rows_in_use]
+        self._rows_in_use += 1
+        cells = []
         for idx, ch in enumerate(word):
             val = statuses[idx] if idx < len(statuses) else 0
             status = LetterStatus(val)
-            color = STATUS_COLORS.get(status, "#bdc3c7")
-            tile = ctk.CTkLabel(row, text=ch, width=60, height=60, corner_radius=8, fg_color=color, text_color="white", font=("Consolas", 28, "bold"))
-            tile.pack(side="left", padx=5)
-        self.guess_rows.append(row)
+            cells.append((ch, STATUS_COLORS.get(status, "#bdc3c7"), "white"))
+        row.show(cells)
+        row.frame.pack(pady=5)
 
     def _update_state(self) -> None:
-        attempts_left = self._get_current_lives()
-        
-        won = False
-        lost = False
-        
+        # One core call instead of get_lives + get_game_status.
         try:
-            status = int(self.master_app.core.get_game_status())
-            won = (status == 1)
-            lost = (status == -1)
+            state = self.master_app.core.get_state()
+            attempts_left = state.attempts_left - self.life_penalty
+            won = state.won
+            lost = state.lost
         except Exception:
-            try:
-                s = self.master_app.core.get_state()
-                if hasattr(s, "as_dict"):
-                    sd = s.as_dict()
-                    attempts_left = sd.get("attempts_left", attempts_left)
-                    won = sd.get("won", False)
-                    lost = sd.get("lost", False)
-                else:
-                    attempts_left = getattr(s, "attempts_left", attempts_left)
-                    won = getattr(s, "won", won)
-                    lost = getattr(s, "lost", lost)
-            except Exception:
-                pass
-
-        if attempts_left is None:
-            attempts_left = self.master_app.attempts_per_game
+            attempts_left = self._get_current_lives()
+            won = False
+            lost = False
 
         if attempts_left <= 0 and not won:
             lost = True
@@ -683,16 +744,27 @@ class GameFrame(ctk.CTkFrame):
         self._update_hearts(attempts_left) 
 
         if won and not self._game_over:
-            self.master_app.stats_store.record(True)
+            self._record_result(True)
             self._game_over = True
             self._lock_inputs()
             messagebox.showinfo(self.master_app.t("victory_title"), self.master_app.t("victory_message"))
         elif lost and not self._game_over:
-            self.master_app.stats_store.record(False)
+            self._record_result(False)
             self._game_over = True
             self._lock_inputs()
             messagebox.showwarning(self.master_app.t("defeat_title"), self.master_app.t("defeat_message"))
 
+    def _record_result(self, won: bool) -> None:
+        self.master_app.stats_store.record(
+            won,
+            category=self.master_app.selected_category,
+            word_length=self.word_length,
+            guesses=self._guess_count,
+            duration_s=time.monotonic() - self._started_at,
+            word=self._latest_secret or None,
+            history=self._guess_history,
+        )
+
     def _update_hearts(self, attempts_left: int) -> None:
         for idx, heart in enumerate(self.hearts):
             color = "#c0392b" if idx < attempts_left else "#dfe4ea"
@@ -704,20 +776,14 @@ class GameFrame(ctk.CTkFrame):
         self.hint_btn.configure(state="disabled")
 
     def _update_placeholder_tiles(self, mask: str) -> None:
-        for t in self.placeholder_tiles:
-            t.destroy()
-        self.placeholder_tiles.clear()
-        if not mask:
-            return
+        cells = []
         for ch in mask:
             text_col = "#2c3e50"
             bg_col = "#ecf0f1"
             if ch != "?":
                 bg_col = "#ffeaa7"
-            
-            tile = ctk.CTkLabel(self.placeholder_row, text=ch, width=48, height=48, corner_radius=6, fg_color=bg_col, text_color=text_col, font=("Consolas", 24, "bold"))
-            tile.pack(side="left", padx=4, pady=4)
-            self.placeholder_tiles.append(tile)
+            cells.append((ch, bg_col, text_col))
+        self.placeholder_tiles.show(cells)
 
     def refresh_texts(self) -> None:
         self.title_label.configure(text=self.master_app.t("game_title"))
@@ -736,7 +802,7 @@ class GameFrame(ctk.CTkFrame):
 
 
 class GameApp(ctk.CTk):
-    def __init__(self):
+    def __init__(self, core_future: Future | None = None):
         super().__init__()
         self.attempts_per_game = 5
         self.geometry("850x650")
@@ -746,30 +812,17 @@ class GameApp(ctk.CTk):
         self._ui_dir = Path(__file__).resolve().parent
         self.project_root = self._ui_dir.parent
         self.language = Language.EN
-        self.stats_store = StatsStore(self._ui_dir / "stats.json", persist=True)
+        self.stats_store = self._open_stats_store()
 
         self.is_muted = False
-        try:
-            if not pygame.mixer.get_init():
-                pygame.mixer.init()
-            
-            music_path = self._ui_dir / "music.mp3"
-            if music_path.exists():
-                pygame.mixer.music.load(music_path)
-                pygame.mixer.music.set_volume(0.3)
-                pygame.mixer.music.play(-1)
-            else:
-                print(f"Music file not found at: {music_path}")
-        except Exception as e:
-            print(f"Music init error: {e}")
+        self._music_ready = False
+        self.after_idle(self._init_music)
 
         self.available_categories: list[str] = ["ANY"] 
         self._selected_category: str = "ANY"
 
         try:
-            lib_path = self._resolve_library_path()
-            words = self.project_root / "words.txt"
-            self.core = GameCore(lib_path, words)
+            self.core = core_future.result() if core_future is not None else load_core(self._ui_dir)
             self.available_categories = [c.upper() for c in (self.core.get_categories() or ["ANY"])]
             self._selected_category = self.available_categories[0] 
         except Exception as e:
@@ -784,37 +837,50 @@ class GameApp(ctk.CTk):
 
         self._apply_language()
                   
+    def _init_music(self) -> None:
+        try:
+            import pygame
+
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            
+            music_path = self._ui_dir / "music.mp3"
+            if music_path.exists():
+                pygame.mixer.music.load(music_path)
+                pygame.mixer.music.set_volume(0.3)
+                if not self.is_muted:
+                    pygame.mixer.music.play(-1)
+                self._music_ready = True
+            else:
+                print(f"Music file not found at: {music_path}")
+        except Exception as e:
+            print(f"Music init error: {e}")
+
     def toggle_music(self) -> bool:
         self.is_muted = not self.is_muted
-        if self.is_muted:
-            pygame.mixer.music.pause()
-            return False
-        else:
-            pygame.mixer.music.unpause()
-            return True
+        if self._music_ready:
+            import pygame
+
+            if self.is_muted:
+                pygame.mixer.music.pause()
+            elif pygame.mixer.music.get_busy():
+                pygame.mixer.music.unpause()
+            else:
+                pygame.mixer.music.play(-1)
+        return not self.is_muted
            
     def open_author_page(self):
         webbrowser.open("https://github.com/leksa777")    
 
-    def _resolve_library_path(self) -> Path:
-        import sys
-        
-        binary = "game_core.dll" if sys.platform.startswith("win") else ("libgame_core.dylib" if sys.platform == "darwin" else "libgame_core.so")
-        candidates = [
-            self._ui_dir / binary,
-            self.project_root / "cpp_core" / "build" / "Release" / binary,
-            self.project_root / "cpp_core" / "build" / binary,
-        ]
-        for c in candidates:
-            if c.exists():
-                dest = self._ui_dir / binary
-                if c.resolve() != dest.resolve():
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    from shutil import copy2
+    def _open_stats_store(self) -> StatsStore:
+        return open_stats_store(self._ui_dir)
+
+    def destroy(self) -> None:
+        self.stats_store.close()
+        super().destroy()
 
-                    copy2(c, dest)
-                return dest
-        raise FileNotFoundError("Cannot find native game core. Build C++ project first.")
+    def _resolve_library_path(self) -> Path:
+        return resolve_library_path(self._ui_dir)
 
     @staticmethod
     def _is_windows() -> bool:
@@ -880,22 +946,51 @@ class GameApp(ctk.CTk):
         self._apply_language()
 
     def _apply_language(self) -> None:
+        language = self.language.value
+        if language not in self.core.languages():
+            print(f"[WARNING] No dictionary for language '{language}'; using '{DEFAULT_LANGUAGE}' words.")
+            language = DEFAULT_LANGUAGE
+        self.core.set_language(language)
         self.title(self.t("app_title"))
         self.menu_frame.refresh_texts()
         self.stats_frame.refresh_texts()
         self.game_frame.refresh_texts()
 
 
-def main() -> None:
-    try:
-        run_intro()
-    except Exception as e:
-        print(f"Не вдалося запустити 3D-інтро: {e}")
+def _report_startup(app: GameApp, intro: bool) -> None:
+    _mark("interactive")
+    print(json.dumps({"intro": intro, "marks_ms": STARTUP_MARKS, "time_to_interactive_ms": STARTUP_MARKS["interactive"]}))
+    app.destroy()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Guess The Word")
+    parser.add_argument("--no-intro", action="store_true", help="skip the 3D intro (or set GUESS_WORD_NO_INTRO=1)")
+    parser.add_argument("--startup-report", action="store_true", help="print startup timings as JSON and exit")
+    args = parser.parse_args(argv)
+    show_intro = not (args.no_intro or os.environ.get("GUESS_WORD_NO_INTRO") == "1")
+    _mark("imports")
+
+    # The core and dictionary load in the background while the intro plays or the window is built.
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="startup")
+    core_future = loader.submit(load_core)
+    loader.submit(_preload_audio)
+    loader.shutdown(wait=False)
+
+    if show_intro:
+        try:
+            run_intro()
+        except Exception as e:
+            print(f"Не вдалося запустити 3D-інтро: {e}")
+        _mark("intro_done")
 
     ctk.set_appearance_mode("light")
     ctk.set_default_color_theme("blue")
     
-    app = GameApp()
+    app = GameApp(core_future=core_future)
+    _mark("window_built")
+    if args.startup_report:
+        app.after_idle(lambda: _report_startup(app, show_intro))
     app.mainloop()
 
 
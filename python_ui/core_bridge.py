@@ -1,241 +1,1037 @@
+from __future__ import annotations
+
+from collections import Counter
 import ctypes
-from ctypes import c_char_p, c_int, POINTER
+from ctypes import c_char_p, c_int, c_uint8, c_void_p, POINTER
 from pathlib import Path
 import random
 import shutil
 import sys
+import threading
+import weakref
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+
+CORE_METRIC_METHODS = ("get_categories", "filter_words_by_category", "evaluate_many", "reload")
+SESSION_METRIC_METHODS = (
+    "start_game", "start_with_word", "start_local_game", "guess_word", "guess_word_view",
+    "get_secret", "get_lives", "get_game_status", "get_state",
+)
+
+_score_words = None
+
+
+def _vectorized_scorer():
+    """NumPy scorer, imported on first use so that importing core_bridge stays cheap."""
+    global _score_words
+    if _score_words is None:
+        try:
+            from scoring import score_words
+        except ImportError:
+            score_words = False
+        _score_words = score_words
+    return _score_words or None
+
+
+# Below this batch size NumPy's overhead outweighs the gain.
+VECTORIZED_MIN_BATCH = 32
 
 
 def _is_windows() -> bool:
     return sys.platform.startswith("win")
 
 
+def library_file_name() -> str:
+    if _is_windows():
+        return "game_core.dll"
+    return "libgame_core.dylib" if sys.platform == "darwin" else "libgame_core.so"
+
+
+# Language of the main dictionary (words.txt); others are loaded with GameCore.load_language().
+DEFAULT_LANGUAGE = "en"
+
+
+def language_words_path(words_path: Path, language: str) -> Path:
+    """words.txt -> words_uk.txt: where the dictionary of ``language`` lives next to the default one."""
+    words_path = Path(words_path)
+    if language == DEFAULT_LANGUAGE:
+        return words_path
+    return words_path.with_name(f"{words_path.stem}_{language}{words_path.suffix}")
+
+
+def find_library(ui_dir: Path) -> Path:
+    """Locate the native core next to the UI or in the CMake build tree."""
+    ui_dir = Path(ui_dir)
+    binary = library_file_name()
+    candidates = [
+        ui_dir / binary,
+        ui_dir.parent / "cpp_core" / "build" / "Release" / binary,
+        ui_dir.parent / "cpp_core" / "build" / binary,
+    ]
+    for c in candidates:
+        if c.exists():
+            return c
+    raise FileNotFoundError("Cannot find native game core. Build C++ project first.")
+
+
+class NativeGameState(ctypes.Structure):
+    """C layout of SessionState in bridge.cpp."""
+
+    _fields_ = [
+        ("attempts_left", ctypes.c_int32),
+        ("status", ctypes.c_int32),
+        ("word_length", ctypes.c_int32),
+        ("score", ctypes.c_int32),
+    ]
+
+
+@dataclass(slots=True)
+class GameState:
+    """Everything the UI refreshes after a guess, read in one go."""
+
+    attempts_left: int
+    status: int
+    word_length: int
+    mask: str = ""
+    score: int = 0
+
+    @property
+    def won(self) -> bool:
+        return self.status == 1
+
+    @property
+    def lost(self) -> bool:
+        return self.status == -1
+
+    def as_dict(self) -> dict:
+        return {
+            "attempts_left": self.attempts_left,
+            "status": self.status,
+            "word_length": self.word_length,
+            "mask": self.mask,
+            "score": self.score,
+            "won": self.won,
+            "lost": self.lost,
+        }
+
+
+# Prototypes of every core export: name -> (restype, argtypes).
+NATIVE_PROTOTYPES = {
+    "init_db": (None, []),
+    "load_words": (c_int, [c_char_p, c_char_p, c_int]),
+    "load_language_words": (c_int, [c_char_p, c_char_p, c_char_p, c_int]),
+    "load_language_text": (c_int, [c_char_p, c_char_p, c_int, c_char_p, c_int]),
+    "session_set_language": (c_int, [c_void_p, c_char_p]),
+    "get_words_generation": (c_int, []),
+    "create_session": (c_void_p, []),
+    "destroy_session": (None, [c_void_p]),
+    "session_start_game": (c_int, [c_void_p, c_char_p, c_int]),
+    "session_start_with_word": (c_int, [c_void_p, c_char_p, c_char_p, c_int]),
+    "session_seed": (None, [c_void_p, ctypes.c_uint]),
+    "session_get_secret": (c_int, [c_void_p, c_char_p, c_int]),
+    "session_get_lives": (c_int, [c_void_p]),
+    "session_check_word_guess": (c_int, [c_void_p, c_char_p, POINTER(c_int)]),
+    "session_check_word_guess_u8": (c_int, [c_void_p, c_char_p, POINTER(c_uint8)]),
+    "session_get_game_status": (c_int, [c_void_p]),
+    "session_get_state": (c_int, [c_void_p, POINTER(NativeGameState), c_char_p, c_int]),
+    "evaluate_many": (c_int, [c_char_p, c_int, c_int, c_char_p, POINTER(c_int)]),
+    "copy_categories": (c_int, [c_char_p, c_int]),
+    "start_game": (None, [c_char_p]),
+    "get_secret": (c_char_p, []),
+    "get_lives": (c_int, []),
+    "check_word_guess": (None, [c_char_p, POINTER(c_int)]),
+    "get_game_status": (c_int, []),
+    "get_categories": (c_char_p, []),
+}
+SESSION_API = (
+    "create_session", "destroy_session", "session_start_game", "session_get_secret",
+    "session_get_lives", "session_check_word_guess", "session_get_game_status",
+)
+# Old DLLs with a single global game.
+LEGACY_API = ("start_game", "get_secret", "get_lives", "check_word_guess", "get_game_status")
+
+
+class NativeBindings:
+    """Every export of one native library, resolved and typed in a single pass; missing ones are ``None``."""
+
+    def __init__(self, lib=None):
+        self.lib = lib
+        exports = None
+        for name, (restype, argtypes) in NATIVE_PROTOTYPES.items():
+            fn = getattr(lib, name, None) if lib is not None else None
+            if fn is None and lib is not None:
+                # stdcall builds on Windows decorate names: _name@N.
+                if exports is None:
+                    exports = dir(lib)
+                decorated = next((n for n in exports if n.lstrip("_").split("@")[0] == name), None)
+                fn = getattr(lib, decorated) if decorated else None
+            if fn is not None:
+                fn.restype = restype
+                fn.argtypes = argtypes
+            setattr(self, name, fn)
+        self.has_sessions = all(getattr(self, n) is not None for n in SESSION_API)
+        self.has_legacy_game = all(getattr(self, n) is not None for n in LEGACY_API)
+
+
+NO_NATIVE = NativeBindings()
+_bindings: dict[tuple, NativeBindings] = {}
+_bindings_lock = threading.Lock()
+
+
+def bind_library(path: Path) -> NativeBindings:
+    """Load and bind the library once per (path, mtime, size); later GameCores reuse the prototypes."""
+    path = Path(path).resolve()
+    st = path.stat()
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    with _bindings_lock:
+        bindings = _bindings.get(key)
+        if bindings is None:
+            lib = ctypes.WinDLL(str(path)) if _is_windows() else ctypes.CDLL(str(path))
+            bindings = _bindings[key] = NativeBindings(lib)
+    return bindings
+
+
+class NativeSession:
+    """One native engine handle with every call pre-bound to it, so hot calls do no lookups or checks."""
+
+    def __init__(self, native: NativeBindings):
+        handle = native.create_session()
+        if not handle:
+            raise RuntimeError("create_session returned NULL")
+        h = c_void_p(handle)
+        self.start = partial(native.session_start_game, h)
+        # check(word, results) writes statuses into a buffer of result_type elements.
+        if native.session_check_word_guess_u8:
+            self.result_type = c_uint8
+            self.check = partial(native.session_check_word_guess_u8, h)
+        else:
+            self.result_type = c_int
+            self.check = partial(native.session_check_word_guess, h)
+        self.lives = partial(native.session_get_lives, h)
+        self.status = partial(native.session_get_game_status, h)
+        self.start_with_word = partial(native.session_start_with_word, h) if native.session_start_with_word else None
+        self.seed = partial(native.session_seed, h) if native.session_seed else None
+        self.set_language = partial(native.session_set_language, h) if native.session_set_language else None
+        self._get_secret = partial(native.session_get_secret, h)
+        self._destroy = partial(native.destroy_session, h)
+        self._buf = ctypes.create_string_buffer(64)
+        self._get_state = partial(native.session_get_state, h) if native.session_get_state else None
+        self._state = NativeGameState()
+        self._state_ref = ctypes.byref(self._state)
+        self._mask = ctypes.create_string_buffer(64)
+
+    def state(self) -> GameState | None:
+        """One FFI call for attempts, status, word length, score and mask; None on cores without it."""
+        if self._get_state is None or not self._get_state(self._state_ref, self._mask, len(self._mask)):
+            return None
+        st = self._state
+        if st.word_length >= len(self._mask):
+            self._mask = ctypes.create_string_buffer(st.word_length + 1)
+            self._get_state(self._state_ref, self._mask, len(self._mask))
+        return GameState(st.attempts_left, st.status, st.word_length, self._mask.value.decode("utf-8"), st.score)
+
+    def secret(self) -> str:
+        size = len(self._buf)
+        needed = self._get_secret(self._buf, size)
+        if needed >= size:
+            self._buf = ctypes.create_string_buffer(needed + 1)
+            self._get_secret(self._buf, needed + 1)
+        return self._buf.value.decode("utf-8")
+
+    def close(self) -> None:
+        self._destroy()
+
+
+class LegacyNativeSession:
+    """The single global game of DLLs without the session API, behind the NativeSession interface."""
+
+    start_with_word = None
+    seed = None
+    set_language = None
+    result_type = c_int
+
+    def state(self) -> None:
+        return None
+
+    def __init__(self, native: NativeBindings):
+        self._start_game = native.start_game
+        self._get_secret = native.get_secret
+        self._check = native.check_word_guess
+        self.lives = native.get_lives
+        self.status = native.get_game_status
+
+    def start(self, category: bytes, attempts: int) -> int:
+        self._start_game(category)
+        return 1
+
+    def check(self, word: bytes, arr) -> int:
+        self._check(word, arr)
+        return 1
+
+    def secret(self) -> str:
+        raw = self._get_secret() or b""
+        return raw.decode("utf-8")
+
+    def close(self) -> None:
+        pass
+
+
+def _read_native_string(fn, *args, size: int = 256) -> bytes:
+    buf = ctypes.create_string_buffer(size)
+    needed = fn(*args, buf, size)
+    if needed >= size:
+        buf = ctypes.create_string_buffer(needed + 1)
+        fn(*args, buf, needed + 1)
+    return buf.value
+
+
+def evaluate_guess(guess: str, secret: str) -> list[int]:
+    """Score one guess against the secret: 0 - absent, 1 - present, 2 - correct."""
+    guess = guess.upper()
+    secret = secret.upper()
+    
+    if len(guess) != len(secret):
+        raise ValueError("Guess length mismatch")
+        
+    counts = Counter(secret)
+    
+    result = [0] * len(secret)
+    
+    for i, ch in enumerate(guess):
+        if ch == secret[i]:
+            result[i] = 2
+            counts[ch] -= 1
+    
+    for i, ch in enumerate(guess):
+        if result[i] == 2:
+            continue
+        
+        if counts[ch] > 0:
+            result[i] = 1
+            counts[ch] -= 1
+            
+    return result
+
+
+def parse_word_lines(lines):
+    """Yield ``(WORD, category or None)`` from ``WORD;CATEGORY`` lines, skipping blank ones."""
+    for line in lines:
+        s = line.strip()
+        if not s:
+            continue
+        if ";" in s:
+            word, cat = s.split(";", 1)
+            word = word.strip().upper()
+            if word:
+                # "WORD;" has no category, the same as a bare "WORD".
+                yield word, cat.strip() or None
+        else:
+            yield s.upper(), None
+
+
 class NativeUnavailableError(RuntimeError):
     pass
 
 
+def _close_lexicon(lexicon) -> None:
+    close = getattr(lexicon, "close", None)
+    if close is not None:
+        close()
+
+
+class Lexicon:
+    """In-memory index over words.txt, built once and queried without file I/O."""
+
+    def __init__(self):
+        self.words: list[str] = []
+        self.known: set[str] = set()
+        self.by_category: dict[str, list[str]] = {}
+        self.by_length: dict[int, list[str]] = {}
+        self.category_of: dict[str, str] = {}
+        self.categories: list[str] = []
+
+    @classmethod
+    def from_file(cls, path: Path) -> "Lexicon":
+        lexicon = cls()
+        with Path(path).open("r", encoding="utf-8") as fh:
+            for word, cat in parse_word_lines(fh):
+                lexicon.add(word, cat)
+        lexicon.categories = sorted(lexicon.by_category)
+        return lexicon
+
+    def add(self, word: str, category: str | None = None) -> None:
+        word = word.strip().upper()
+        if not word or word in self.known:
+            return
+        self.words.append(word)
+        self.known.add(word)
+        self.by_length.setdefault(len(word), []).append(word)
+        category = category.strip() if category is not None else ""
+        if category:
+            self.category_of[word] = category
+            self.by_category.setdefault(category, []).append(word)
+
+    def words_in(self, category: str | None) -> list[str]:
+        if category in (None, "", "Any"):
+            return self.words
+        return self.by_category.get(category, [])
+
+    def words_of_length(self, length: int) -> list[str]:
+        return self.by_length.get(length, [])
+
+    def __contains__(self, word: str) -> bool:
+        return word.upper() in self.known
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
 class GameCore:
-    def __init__(self, lib_path: Path, words_path: Path):
-        self.lib_path = Path(lib_path)
+    def __init__(self, lib_path: Path | None, words_path: Path, use_native: bool = True):
+        """With ``use_native=False`` the library is not loaded and every call runs in Python emulation."""
+        self.lib_path = Path(lib_path) if lib_path is not None else None
         self.words_path = Path(words_path)
-        if not self.lib_path.exists():
+        self.native = NO_NATIVE
+        if use_native and (self.lib_path is None or not self.lib_path.exists()):
             raise FileNotFoundError(f"Library not found: {self.lib_path}")
         if not self.words_path.exists():
             raise FileNotFoundError(f"Words file not found: {self.words_path}")
 
+        if use_native:
+            try:
+                self.native = bind_library(self.lib_path)
+            except Exception as e:
+                raise RuntimeError(f"Failed to load native library: {e}")
+
+            try:
+                dll_dir = self.lib_path.parent
+                target = dll_dir / "words.txt"
+                if not target.exists():
+                    shutil.copy2(self.words_path, target)
+                   # print(f"[DEBUG] Copied words file to {target}")
+                else:
+                    # print(f"[DEBUG] words.txt already exists next to DLL at {target}; not overwriting")
+                    pass
+            except Exception as e:
+                print(f"[WARNING] Failed to copy words.txt next to DLL: {e}")
+        self.lib = self.native.lib
+
+        self.metrics = None
+        self._sessions = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._lexicon_lock = threading.Lock()
+        self._lexicon_readers = 0
+        self._retired_lexicons: list = []
+        self._watcher = None
+        self.dictionary_generation = 0
+        self._daily: dict[tuple, tuple] = {}
+        self._daily_lock = threading.Lock()
+        # Other languages' dictionaries: language -> (Lexicon, path); and those the native core has too.
+        self._lexicons: dict[str, tuple[Lexicon, Path]] = {}
+        self._native_languages: set[str] = set()
+
+        self._lexicon = self._load_words_file()
+        self._all_words = self._lexicon.words
+        if not self._all_words:
+            print("[WARNING] No words loaded from words.txt; the game cannot run correctly.")
+
+        if self.native.load_words:
+            try:
+                self._load_native_words(self.words_path, lexicon=self._lexicon)
+            except RuntimeError as e:
+                print(f"[WARNING] {e}")
+        elif self.native.init_db:
+            try:
+                self.native.init_db()
+            except Exception as e:
+               # print(f"[WARNING] init_db raised: {e}")
+               pass
+
+        # Old DLLs without the session API have one global game, so only the default session gets it.
+        self._default_session = GameSession(self, legacy=not self.native.has_sessions)
+
+    def _load_native_words(self, words_path: Path, language: str = DEFAULT_LANGUAGE, lexicon=None) -> int:
+        error = ctypes.create_string_buffer(256)
+        path = str(words_path).encode(sys.getfilesystemencoding())
+        if isinstance(lexicon, Lexicon) and self.native.load_language_text:
+            # Hand over the words as str.upper() normalized them, so every native secret is in lexicon.known.
+            # A .gwd is already normalized by the Python compiler, and the core maps the same file.
+            lines = (w if (c := lexicon.category_of.get(w)) is None else f"{w};{c}" for w in lexicon.words)
+            text = "\n".join(lines).encode("utf-8")
+            name = None if language == DEFAULT_LANGUAGE else language.encode("utf-8")
+            count = self.native.load_language_text(name, text, len(text), error, len(error))
+        elif language == DEFAULT_LANGUAGE:
+            count = self.native.load_words(path, error, len(error))
+        else:
+            count = self.native.load_language_words(language.encode("utf-8"), path, error, len(error))
+        if count < 0:
+            raise RuntimeError(f"Native dictionary load failed: {error.value.decode('utf-8', 'replace')}")
+        return count
+
+    def _load_words_file(self, words_path: Path | None = None) -> Lexicon:
+        from dictionary import MappedLexicon, current_binary_path, is_binary_dictionary
+
+        words_path = words_path or self.words_path
+        # A compiled .gwd is opened through mmap without parsing text, unless it is older than words.txt.
+        binary = current_binary_path(words_path)
+        if not binary.exists() and is_binary_dictionary(words_path):
+            binary = words_path
         try:
-            if _is_windows():
-                self.lib = ctypes.WinDLL(str(self.lib_path))
-            else:
-                self.lib = ctypes.CDLL(str(self.lib_path))
+            if binary.exists() and binary.stat().st_mtime >= words_path.stat().st_mtime:
+                return MappedLexicon(binary)
         except Exception as e:
-            raise RuntimeError(f"Failed to load native library: {e}")
-
+            print(f"[WARNING] Ignoring binary dictionary {binary}: {e}")
         try:
-            dll_dir = self.lib_path.parent
-            target = dll_dir / "words.txt"
-            if not target.exists():
-                shutil.copy2(self.words_path, target)
-               # print(f"[DEBUG] Copied words file to {target}")
-            else:
-                # print(f"[DEBUG] words.txt already exists next to DLL at {target}; not overwriting")
-                pass
+            return Lexicon.from_file(words_path)
         except Exception as e:
-            print(f"[WARNING] Failed to copy words.txt next to DLL: {e}")
+           # print(f"[WARNING] Failed to load words file: {e}")
+           return Lexicon()
+
+    def reload(self, words_path: Path | None = None) -> int:
+        """Load a dictionary (``words_path`` or the current one again) and swap it in; returns the word count.
+
+        Both lexicons are built before anything is swapped, so a failed load
+        leaves the old dictionary in place. Games already in progress keep
+        their secret; only games started afterwards use the new words.
+        """
+        path = Path(words_path) if words_path is not None else self.words_path
+        if not path.exists():
+            raise FileNotFoundError(f"Words file not found: {path}")
+        with self._reload_lock:
+            lexicon = self._load_words_file(path)
+            if not len(lexicon):
+                raise ValueError(f"No words loaded from {path}")
+            if self.native.load_words:
+                self._load_native_words(path, lexicon=lexicon)
+            elif self.native.init_db:
+                # Old DLLs can only re-read words.txt from the working directory.
+                self.native.init_db()
+            self.words_path = path
+            old, self._lexicon = self._lexicon, lexicon
+            self._all_words = lexicon.words
+            self.dictionary_generation += 1
+        self._retire_lexicon(old)
+        return len(lexicon)
+
+    def load_language(self, language: str, words_path: Path | None = None) -> int:
+        """Load (or reload) the dictionary of another language; returns the word count.
+
+        It goes into the native core as well when the library supports it, so
+        sessions switched with ``set_language()`` play it on the native path.
+        """
+        if language == DEFAULT_LANGUAGE:
+            return self.reload(words_path)
+        path = Path(words_path) if words_path is not None else language_words_path(self.words_path, language)
+        if not path.exists():
+            raise FileNotFoundError(f"Words file not found: {path}")
+        with self._reload_lock:
+            lexicon = self._load_words_file(path)
+            if not len(lexicon):
+                raise ValueError(f"No words loaded from {path}")
+            if self.native.load_language_words:
+                self._load_native_words(path, language, lexicon)
+                self._native_languages.add(language)
+            old = self._lexicons.get(language, (None, None))[0]
+            self._lexicons[language] = (lexicon, path)
+            self.dictionary_generation += 1
+        if old is not None:
+            self._retire_lexicon(old)
+        return len(lexicon)
+
+    def languages(self) -> list[str]:
+        return [DEFAULT_LANGUAGE, *self._lexicons]
+
+    def lexicon(self, language: str | None = None) -> Lexicon:
+        """The current lexicon of ``language``; a .gwd-backed one is closed by the next reload."""
+        return self._language_entry(language)[0]
+
+    @contextmanager
+    def _borrow_lexicon(self, language: str | None = None):
+        """The lexicon of ``language``, kept open until the block ends even if a reload swaps it out."""
+        with self._lexicon_lock:
+            self._lexicon_readers += 1
+        try:
+            yield self.lexicon(language)
+        finally:
+            with self._lexicon_lock:
+                self._lexicon_readers -= 1
+                retired = []
+                if not self._lexicon_readers:
+                    retired, self._retired_lexicons = self._retired_lexicons, []
+            for old in retired:
+                _close_lexicon(old)
+
+    def _retire_lexicon(self, old) -> None:
+        """Close a swapped-out lexicon (its mmap and file handle) once no call is still reading it."""
+        with self._lexicon_lock:
+            if self._lexicon_readers:
+                self._retired_lexicons.append(old)
+                return
+        _close_lexicon(old)
+
+    def _language_entry(self, language: str | None) -> tuple[Lexicon, Path]:
+        if language is None or language == DEFAULT_LANGUAGE:
+            return self._lexicon, self.words_path
+        try:
+            return self._lexicons[language]
+        except KeyError:
+            raise ValueError(f"Language is not loaded: {language}") from None
 
-        self._init_db_fn = self._resolve_optional("init_db")
-        if self._init_db_fn:
+    @property
+    def language(self) -> str:
+        return self._default_session.language
+
+    def set_language(self, language: str) -> None:
+        self._default_session.set_language(language)
+
+    def reload_async(self, words_path: Path | None = None) -> Future:
+        """``reload()`` on a background thread; the native load runs without the GIL."""
+        future: Future = Future()
+
+        def run() -> None:
             try:
-                self._init_db_fn()
+                future.set_result(self.reload(words_path))
             except Exception as e:
-               # print(f"[WARNING] init_db raised: {e}")
-               pass
+                future.set_exception(e)
+
+        threading.Thread(target=run, name="dictionary-reload", daemon=True).start()
+        return future
+
+    def watch(self, interval: float = 1.0, on_reload=None) -> "DictionaryWatcher":
+        """Reload automatically when the words file (or its .gwd) changes on disk."""
+        if self._watcher is None:
+            self._watcher = DictionaryWatcher(self, interval, on_reload)
+            self._watcher.start()
+        return self._watcher
+
+    def daily_schedule(self, seed: int = 0, days: int = 365, day=None, language: str | None = None):
+        """Word-of-the-day schedule of the ``days``-long period containing ``day`` (default: today, UTC).
 
-        self._get_categories_fn = self._resolve_optional("get_categories", restype=c_char_p)
-        self._get_category_fn = self._resolve_optional("get_category", restype=c_char_p)
-        self._get_secret_fn = self._resolve_optional("get_secret", restype=c_char_p)
-        self._get_lives_fn = self._resolve_optional("get_lives", restype=c_int)
-        self._get_game_status_fn = self._resolve_optional("get_game_status", restype=c_int)
+        Precomputed once per period and cached on disk; the build runs under a
+        lock, so concurrent first requests of a period share one build.
+        """
+        from daily import DailySchedule, period_start, today_utc
 
-        self._start_game_fn = self._resolve_optional("start_game")
-        if self._start_game_fn:
+        start = period_start(day or today_utc(), days)
+        key = (language or DEFAULT_LANGUAGE, seed, days)
+        version = (start, self.dictionary_generation)
+        with self._daily_lock:
+            cached = self._daily.get(key)
+            if cached is None or cached[0] != version:
+                words_path = self._language_entry(language)[1]
+                with self._borrow_lexicon(language) as lexicon:
+                    schedule = DailySchedule.load_or_build(lexicon, words_path, seed, start, days)
+                cached = self._daily[key] = (version, schedule)
+            return cached[1]
+
+    def get_categories(self, language: str | None = None) -> list[str]:
+        language = language or self.language
+        if language != DEFAULT_LANGUAGE:
+            with self._borrow_lexicon(language) as lexicon:
+                return ["Any", *lexicon.categories]
+        native = self.native
+        if native.copy_categories:
             try:
-                self._start_game_fn.argtypes = [c_char_p]
-                self._start_game_fn.restype = None
+                text = _read_native_string(native.copy_categories).decode("utf-8")
+                return text.split("|") if text else ["Any"]
             except Exception:
-                pass
-
-        self._check_word_fn = self._resolve_optional("check_word_guess")
-        if self._check_word_fn:
+                self._count_error("get_categories")
+        if native.get_categories:
             try:
-                self._check_word_fn.argtypes = [c_char_p, POINTER(c_int)]
-                self._check_word_fn.restype = None
+                raw = native.get_categories() or b""
+                text = raw.decode("utf-8")
+                return text.split("|") if text else ["Any"]
             except Exception:
-                pass
+                self._count_error("get_categories")
+        # Same shape as the native list: "Any" first, then the dictionary's categories.
+        with self._borrow_lexicon() as lexicon:
+            return ["Any", *lexicon.categories]
 
-        self._use_local_emulation = False
-        self._local_secret = ""
-        self._local_attempts = 0
-        self._local_won = False
-        self._local_lost = False
+    def filter_words_by_category(self, category: str, language: str | None = None) -> list[str]:
+        with self._borrow_lexicon(language or self.language) as lexicon:
+            return list(lexicon.words_in(category))
 
-        self._all_words = self._load_words_file()
-        if not self._all_words:
-            print("[WARNING] No words loaded from words.txt; the game cannot run correctly.")
+    def evaluate_many(self, guesses: list[str], secret: str) -> list[list[int]]:
+        """Score every guess against one secret in a single native call."""
+        secret = secret.upper()
+        length = len(secret)
+        words = [g.upper() for g in guesses]
+        for w in words:
+            if len(w) != length:
+                raise ValueError("Guess length mismatch")
+        if not words:
+            return []
 
-    def _resolve_optional(self, base_name: str, restype=None):
-        if hasattr(self.lib, base_name):
-            fn = getattr(self.lib, base_name)
-            if restype is not None:
-                try:
-                    fn.restype = restype
-                except Exception:
-                    pass
-            return fn
-        candidates = [n for n in dir(self.lib) if base_name in n]
-        if candidates:
-            name = candidates[0]
-           # print(f"[DEBUG] Resolved native symbol '{base_name}' -> '{name}'")
-            fn = getattr(self.lib, name)
-            if restype is not None:
+        evaluate_many = self.native.evaluate_many
+        if evaluate_many:
+            secret_b = secret.encode("utf-8")
+            packed = "".join(words).encode("utf-8")
+            # The core scores bytes here, so multi-byte (non-ASCII) words are scored in Python.
+            if len(secret_b) == length and len(packed) == length * len(words):
+                results = (c_int * len(packed))()
                 try:
-                    fn.restype = restype
-                except Exception:
-                    pass
-            return fn
-        return None
+                    if evaluate_many(packed, len(words), length, secret_b, results) == len(words):
+                        flat = list(results)
+                        return [flat[i:i + length] for i in range(0, len(flat), length)]
+                except Exception as e:
+                    self._count_error("evaluate_many")
+                    print(f"[WARNING] native evaluate_many failed: {e}")
 
-    def _load_words_file(self) -> list[str]:
-        words = []
-        try:
-            with self.words_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    s = line.strip()
-                    if not s:
-                        continue
-                    if ";" in s:
-                        word, _ = s.split(";", 1)
-                        words.append(word.strip().upper())
-                    else:
-                        words.append(s.strip().upper())
-        except Exception as e:
-           # print(f"[WARNING] Failed to load words file: {e}")
-           pass
-        return words
+        if len(words) >= VECTORIZED_MIN_BATCH:
+            score_words = _vectorized_scorer()
+            if score_words is not None:
+                return score_words(words, secret)
+        return [evaluate_guess(w, secret) for w in words]
+
+    def enable_metrics(self, metrics=None):
+        """Start recording per-method calls, latency, execution path and errors; returns the Metrics."""
+        from metrics import Metrics, instrument
+
+        if self.metrics is not None:
+            self.disable_metrics()
+        with self._sessions_lock:
+            self.metrics = metrics if metrics is not None else Metrics()
+            instrument(self, CORE_METRIC_METHODS, self.metrics, GameCore._path)
+            for session in list(self._sessions):
+                instrument(session, SESSION_METRIC_METHODS, self.metrics, GameSession._path)
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        from metrics import uninstrument
+
+        with self._sessions_lock:
+            self.metrics = None
+            uninstrument(self, CORE_METRIC_METHODS)
+            for session in list(self._sessions):
+                uninstrument(session, SESSION_METRIC_METHODS)
+
+    def _path(self) -> str:
+        return "native" if self.lib is not None else "emulation"
+
+    def _count_error(self, method: str) -> None:
+        if self.metrics is not None:
+            self.metrics.count_error(method, "native")
 
-    def get_categories(self) -> list[str]:
-        if self._get_categories_fn:
+    def new_session(self) -> "GameSession":
+        """Create an independent game; close() it when done to free the native handle."""
+        return GameSession(self)
+
+    @property
+    def session(self) -> "GameSession":
+        return self._default_session
+
+    def start_game(self, category: str = "Any", attempts: int = 5) -> None:
+        self._default_session.start_game(category, attempts)
+
+    def start_local_game(self, secret: str, attempts: int = 5) -> None:
+        self._default_session.start_local_game(secret, attempts)
+
+    def start_daily_game(self, category: str = "Any", attempts: int = 5, seed: int = 0, day=None) -> None:
+        self._default_session.start_daily_game(category, attempts, seed, day)
+
+    def _evaluate_guess_local(self, guess: str) -> list[int]:
+        return self._default_session._evaluate_guess_local(guess)
+
+    def guess_word(self, word: str, length: int) -> list[int]:
+        return self._default_session.guess_word(word, length)
+
+    def guess_word_view(self, word: str, length: int) -> memoryview:
+        return self._default_session.guess_word_view(word, length)
+
+    def get_secret(self) -> str:
+        return self._default_session.get_secret()
+
+    def get_lives(self) -> int:
+        return self._default_session.get_lives()
+
+    def get_game_status(self) -> int:
+        return self._default_session.get_game_status()
+
+    def get_state(self) -> GameState:
+        return self._default_session.get_state()
+
+    def close(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+        self._default_session.close()
+
+
+class DictionaryWatcher(threading.Thread):
+    """Polls the mtime and size of the words file and its .gwd; reloads once a change has settled."""
+
+    def __init__(self, core: GameCore, interval: float = 1.0, on_reload=None):
+        super().__init__(name="dictionary-watcher", daemon=True)
+        self.core = core
+        self.interval = interval
+        self.on_reload = on_reload
+        self._stop_event = threading.Event()
+
+    def _signature(self) -> tuple:
+        from dictionary import current_binary_path
+
+        path = self.core.words_path
+        sig = []
+        for p in (path, current_binary_path(path)):
             try:
-                raw = self._get_categories_fn() or b""
-                text = raw.decode("utf-8")
-                return text.split("|") if text else ["Any"]
-            except Exception:
-                pass
-        cats = set()
+                st = p.stat()
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def run(self) -> None:
+        seen = self._signature()
+        pending = None
+        while not self._stop_event.wait(self.interval):
+            current = self._signature()
+            if current == seen:
+                pending = None
+                continue
+            # The file may still be being written: reload only once it is unchanged between two polls.
+            if current != pending:
+                pending = current
+                continue
+            seen, pending = current, None
+            try:
+                count = self.core.reload()
+            except Exception as e:
+                print(f"[WARNING] Dictionary reload failed, keeping the old words: {e}")
+                continue
+            if self.on_reload is not None:
+                self.on_reload(count)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+
+class GameSession:
+    """A single game. Uses its own native engine handle when the library
+    exports the session API and falls back to Python emulation otherwise.
+
+    Every public call holds the session's ``lock``, so one session can be
+    shared between threads. Native calls release the GIL, so separate
+    sessions run in parallel. Hold ``lock`` yourself to make several calls
+    atomic, e.g. to read a ``guess_word_view()`` before another thread guesses.
+    """
+
+    def __init__(self, core: GameCore, legacy: bool = False):
+        self.lock = self._lock = threading.RLock()
+        self.core = core
+        # All of the session's native calls (or None for emulation) are chosen once, here.
+        self._native = None
+        native = core.native
         try:
-            with self.words_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    if ";" in line:
-                        _, cat = line.strip().split(";", 1)
-                        cats.add(cat.strip())
+            if not legacy and native.has_sessions:
+                self._native = NativeSession(native)
+            elif legacy and native.has_legacy_game:
+                self._native = LegacyNativeSession(native)
         except Exception:
-            pass
-        return sorted(cats) if cats else ["Any"]
+            self._native = None
+        with core._sessions_lock:
+            core._sessions.add(self)
+            if core.metrics is not None:
+                from metrics import instrument
 
-    def filter_words_by_category(self, category: str) -> list[str]:
-        if category in (None, "", "Any"):
-            return list(self._all_words)
-        filtered = []
+                instrument(self, SESSION_METRIC_METHODS, core.metrics, GameSession._path)
+
+        self._results = None
+        self._results_view = None
+        self._view = None
+        self._use_local_emulation = False
+        self.language = DEFAULT_LANGUAGE
+        # Whether the native session has the current language's dictionary; otherwise its games run in emulation.
+        self._native_language = True
+        self._rng = random.Random()
+        self._local_secret = ""
+        self._local_attempts = 0
+        self._local_won = False
+        self._local_lost = False
+
+    def __enter__(self) -> "GameSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __del__(self):
         try:
-            with self.words_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    s = line.strip()
-                    if not s:
-                        continue
-                    if ";" in s:
-                        word, cat = s.split(";", 1)
-                        if cat.strip() == category:
-                            filtered.append(word.strip().upper())
-                    else:
-                        pass
+            self.close()
         except Exception:
             pass
-        return filtered
+
+    def _native_secret(self) -> str | None:
+        return self._native.secret() if self._native is not None else None
+
+    def _path(self) -> str:
+        return "native" if self._native is not None and not self._use_local_emulation else "emulation"
+
+    def set_language(self, language: str) -> None:
+        """Take the words of the following games from ``language`` (loaded with GameCore.load_language)."""
+        with self._lock:
+            self.core.lexicon(language)
+            self.language = language
+            self._native_language = False
+            set_native = self._native.set_language if self._native is not None else None
+            if set_native:
+                name = "" if language == DEFAULT_LANGUAGE else language
+                try:
+                    self._native_language = bool(set_native(name.encode("utf-8")))
+                except Exception:
+                    self.core._count_error("set_language")
+            elif language == DEFAULT_LANGUAGE:
+                self._native_language = True
 
     def start_game(self, category: str = "Any", attempts: int = 5) -> None:
-        self._use_local_emulation = False
-        if self._start_game_fn:
+        """Start a game in ``category`` ("Any" in any letter case for the whole dictionary).
+
+        Raises ValueError for a category the dictionary does not have.
+        """
+        if not category or category.casefold() == "any":
+            category = "Any"
+        with self._lock, self.core._borrow_lexicon(self.language) as lexicon:
+            if category != "Any" and not lexicon.words_in(category):
+                raise ValueError(f"Unknown category: {category}")
+            self._use_local_emulation = False
+            native = self._native if self._native_language else None
+            started = False
             try:
-                self._start_game_fn(category.encode("utf-8"))
+                if native is not None:
+                    started = bool(native.start(category.encode("utf-8"), attempts))
             except Exception as e:
                # print(f"[WARNING] native start_game failed: {e}")
-               pass
+               self.core._count_error("start_game")
 
-        native_secret = None
-        if self._get_secret_fn:
+            # A failed start leaves the previous game in the engine, so its secret must not be reused.
+            native_secret = None
             try:
-                raw = self._get_secret_fn() or b""
-                native_secret = raw.decode("utf-8") if raw else ""
+                native_secret = native.secret() if started else None
             except Exception as e:
+                self.core._count_error("start_game")
                 print(f"[DEBUG] get_secret failed: {e}")
                 native_secret = ""
 
-        if not native_secret or native_secret.upper() not in self._all_words:
-            candidates = self.filter_words_by_category(category)
-            if not candidates:
-                candidates = list(self._all_words)
-            if not candidates:
-                raise RuntimeError("No words available to start the game")
-            self._local_secret = random.choice(candidates)
-          #  print(f"[INFO] Using local emulation secret: {self._local_secret}")
-            self._use_local_emulation = True
-            self._local_attempts = attempts
-            self._local_won = False
-            self._local_lost = False
-        else:
-            self._local_secret = native_secret.upper()
-            self._use_local_emulation = False
+            if native_secret and native_secret.upper() not in lexicon.known:
+                # The native and Python dictionaries disagree; say so instead of silently dropping to emulation.
+                self.core._count_error("start_game")
+                print(f"[WARNING] Native secret {native_secret!r} is not in the '{self.language}' dictionary; using emulation.")
+            if not native_secret or native_secret.upper() not in lexicon.known:
+                candidates = lexicon.words_in(category)
+                if not candidates:
+                    candidates = lexicon.words
+                if not candidates:
+                    raise RuntimeError("No words available to start the game")
+                self._reset_local(self._rng.choice(candidates), attempts)
+              #  print(f"[INFO] Using local emulation secret: {self._local_secret}")
+            else:
+                self._local_secret = native_secret.upper()
+                self._use_local_emulation = False
+
+    def seed(self, value: int) -> None:
+        """Make start_game() pick a reproducible sequence of words (native and emulation alike)."""
+        with self._lock:
+            self._rng.seed(value)
+            if self._native is not None and self._native.seed:
+                self._native.seed(value & 0xFFFFFFFF)
+
+    def start_with_word(self, word: str, attempts: int = 5, category: str = "Any") -> None:
+        """Start a game with a known secret (e.g. the word of the day) from the dictionary."""
+        with self._lock:
+            word = word.upper()
+            with self.core._borrow_lexicon(self.language) as lexicon:
+                known = word in lexicon.known
+            if not known:
+                raise ValueError(f"Word is not in the dictionary: {word}")
+            native = self._native if self._native_language else None
+            start = native.start_with_word if native is not None else None
+            if start:
+                try:
+                    if start(category.encode("utf-8"), word.encode("utf-8"), attempts):
+                        self._local_secret = word
+                        self._use_local_emulation = False
+                        return
+                except Exception:
+                    self.core._count_error("start_with_word")
+            self._reset_local(word, attempts)
+
+    def start_daily_game(self, category: str = "Any", attempts: int = 5, seed: int = 0, day=None) -> None:
+        """Start today's (or ``day``'s) scheduled word; the same on every node with this dictionary and seed."""
+        word = self.core.daily_schedule(seed, day=day, language=self.language).word(category, day)
+        if word is None:
+            raise RuntimeError(f"No words in category {category}")
+        self.start_with_word(word, attempts, category)
+
+    def start_local_game(self, secret: str, attempts: int = 5) -> None:
+        """Play the given word in Python emulation, bypassing the native engine."""
+        with self._lock:
+            self._reset_local(secret, attempts)
+
+    def _reset_local(self, secret: str, attempts: int) -> None:
+        self._local_secret = secret.upper()
+        self._use_local_emulation = True
+        self._local_attempts = attempts
+        self._local_won = False
+        self._local_lost = False
 
     def _evaluate_guess_local(self, guess: str) -> list[int]:
-        guess = guess.upper()
-        secret = self._local_secret.upper()
-        
-        if len(guess) != len(secret):
-            raise ValueError("Guess length mismatch")
-            
-        from collections import Counter
-        counts = Counter(secret)
-        
-        result = [0] * len(secret)
-        
-        for i, ch in enumerate(guess):
-            if ch == secret[i]:
-                result[i] = 2
-                counts[ch] -= 1
-        
-        for i, ch in enumerate(guess):
-            if result[i] == 2:
-                continue
-            
-            if counts[ch] > 0:
-                result[i] = 1
-                counts[ch] -= 1
-                
-        return result
+        return evaluate_guess(guess, self._local_secret)
 
     def guess_word(self, word: str, length: int) -> list[int]:
+        with self._lock:
+            view = self._guess(word, length, "guess_word")
+            return view if isinstance(view, list) else view.tolist()
+
+    def guess_word_view(self, word: str, length: int) -> memoryview:
+        """guess_word() without building a list: a read-only view of the session's result buffer.
+
+        The view is only valid until the next guess on this session; copy it
+        (``list(view)``, ``bytes(view)``) to keep it. ``numpy.frombuffer(view, numpy.uint8)``
+        wraps it without copying when the core has the uint8 ABI. When the
+        session is shared between threads, make the guess and read the view
+        while holding ``session.lock``, or another thread's guess may overwrite it.
+        """
+        with self._lock:
+            view = self._guess(word, length, "guess_word_view")
+            return memoryview(bytes(view)) if isinstance(view, list) else view
+
+    def _result_view(self, length: int) -> memoryview:
+        """Read-only view of the first ``length`` results; reused while the word length stays the same."""
+        view = self._view
+        if view is not None and len(view) == length:
+            return view
+        view = self._results_view
+        if view is None or len(view) < length:
+            result_type = self._native.result_type
+            self._results = (result_type * max(length, 32))()
+            # A memoryview of a ctypes array has format "<B"/"<i", which tolist() rejects, so cast it to the native one.
+            view = memoryview(self._results).cast("B")
+            if result_type is not c_uint8:
+                view = view.cast("i")
+            view = self._results_view = view.toreadonly()
+        self._view = view[:length]
+        return self._view
+
+    def _guess(self, word: str, length: int, method: str):
+        """Score a guess; a view of the result buffer on the native path, a list in emulation."""
         word_u = word.upper()
         if len(word_u) != length:
             raise ValueError("expected_len must match guess length")
 
-        if self._check_word_fn and not self._use_local_emulation:
-            arr = (c_int * length)()
+        native = self._native
+        if native is not None and not self._use_local_emulation:
+            view = self._result_view(length)
             try:
-                self._check_word_fn(word_u.encode("utf-8"), arr)
-                return list(arr)
+                if native.check(word_u.encode("utf-8"), self._results):
+                    return view
             except Exception as e:
+                self.core._count_error(method)
                 print(f"[WARNING] native check_word_guess failed: {e}")
-           
+
         statuses = self._evaluate_guess_local(word_u)
         #update attempts/won/lost
         if statuses == [2] * length:
@@ -247,33 +1043,61 @@ class GameCore:
         return statuses
 
     def get_secret(self) -> str:
-        if self._get_secret_fn and not self._use_local_emulation:
-            try:
-                raw = self._get_secret_fn() or b""
-                return raw.decode("utf-8") if raw else ""
-            except Exception:
-                return ""
-        return self._local_secret
+        with self._lock:
+            if not self._use_local_emulation:
+                try:
+                    native_secret = self._native_secret()
+                    if native_secret is not None:
+                        return native_secret
+                except Exception:
+                    self.core._count_error("get_secret")
+                    return ""
+            return self._local_secret
 
     def get_lives(self) -> int:
-        if self._get_lives_fn and not self._use_local_emulation:
-            try:
-                return int(self._get_lives_fn())
-            except Exception:
-                return 0
-        return int(self._local_attempts)
+        with self._lock:
+            core = self.core
+            if not self._use_local_emulation:
+                try:
+                    if self._native is not None:
+                        return int(self._native.lives())
+                except Exception:
+                    core._count_error("get_lives")
+                    return 0
+            return int(self._local_attempts)
 
     def get_game_status(self) -> int:
-        if self._get_game_status_fn and not self._use_local_emulation:
-            try:
-                return int(self._get_game_status_fn())
-            except Exception:
-                return 0
-        if self._local_won:
-            return 1
-        if self._local_lost:
-            return -1
-        return 0
+        with self._lock:
+            core = self.core
+            if not self._use_local_emulation:
+                try:
+                    if self._native is not None:
+                        return int(self._native.status())
+                except Exception:
+                    core._count_error("get_game_status")
+                    return 0
+            if self._local_won:
+                return 1
+            if self._local_lost:
+                return -1
+            return 0
+
+    def get_state(self) -> GameState:
+        """Attempts left, status, word length and mask; a single native call when the core exports session_get_state."""
+        with self._lock:
+            native = self._native
+            if native is not None and not self._use_local_emulation:
+                try:
+                    state = native.state()
+                    if state is not None:
+                        return state
+                except Exception:
+                    self.core._count_error("get_state")
+            length = len(self.get_secret())
+            return GameState(self.get_lives(), self.get_game_status(), length, "?" * length)
 
     def close(self) -> None:
-        return
\ No newline at end of file
+        with self._lock:
+            native, self._native = self._native, None
+            if native is not None:
+                native.close()
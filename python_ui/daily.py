@@ -0,0 +1,168 @@
+"""Deterministic "word of the day" schedules.
+
+The word for (seed, category, day) is a pure function of those values and
+the dictionary. Every node with the same words file and seed serves the same
+word without coordinating:
+
+    index = sha256("seed|category|YYYY-MM-DD")[:8] mod len(words)
+
+Candidates are taken in canonical .gwd order (length, then text). A
+schedule precomputes N days for every category once, and is cached as
+JSON next to the pattern matrices, so serving a daily game is a dict lookup.
+Cached schedules cover fixed N-day periods counted from EPOCH, so one is
+built per period rather than per calendar day, and replaced ones are pruned.
+
+    python python_ui/daily.py words.txt --days 30 --seed 7 --category FRUIT
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import hashlib
+import json
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "cache"
+ANY = "Any"
+EPOCH = date(2024, 1, 1)
+
+
+def today_utc() -> date:
+    # Every node switches the word of the day at the same moment, whatever its time zone.
+    return datetime.now(timezone.utc).date()
+
+
+def period_start(day: date, days: int) -> date:
+    """First day of the ``days``-long period, counted from EPOCH, that contains ``day``."""
+    return EPOCH + timedelta(days=(day - EPOCH).days // days * days)
+
+
+def dictionary_fingerprint(path: Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()[:16]
+
+
+def canonical_words(lexicon, category: str) -> list[str]:
+    words = lexicon.words_in(None if category == ANY else category)
+    return sorted(words, key=lambda w: (len(w), w))
+
+
+def pick_index(seed: int, category: str, day: date, count: int) -> int:
+    digest = hashlib.sha256(f"{seed}|{category}|{day.isoformat()}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count
+
+
+def word_for_day(words: list[str], seed: int, category: str, day: date) -> str | None:
+    return words[pick_index(seed, category, day, len(words))] if words else None
+
+
+class DailySchedule:
+    def __init__(self, seed: int, start: date, days: int, words: dict[str, list[str]], lexicon=None):
+        self.seed = seed
+        self.start = start
+        self.days = days
+        self.words = words
+        self._lexicon = lexicon
+
+    @classmethod
+    def build(cls, lexicon, seed: int = 0, start: date | None = None, days: int = 365) -> "DailySchedule":
+        start = start or today_utc()
+        schedule: dict[str, list[str]] = {}
+        for category in [ANY, *lexicon.categories]:
+            words = canonical_words(lexicon, category)
+            if words:
+                schedule[category] = [
+                    word_for_day(words, seed, category, start + timedelta(days=i)) for i in range(days)
+                ]
+        return cls(seed, start, days, schedule, lexicon)
+
+    @classmethod
+    def load_or_build(
+        cls,
+        lexicon,
+        words_path: Path,
+        seed: int = 0,
+        start: date | None = None,
+        days: int = 365,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+    ) -> "DailySchedule":
+        """Cached schedule of ``days`` days from ``start`` (default: the period containing today)."""
+        start = start or period_start(today_utc(), days)
+        prefix = f"daily-{Path(words_path).stem}-{seed}-{days}-"
+        # Hash the file actually loaded: a .gwd generation can be newer than words.txt.
+        fingerprint = dictionary_fingerprint(getattr(lexicon, "path", None) or words_path)
+        path = Path(cache_dir) / f"{prefix}{fingerprint}-{start.isoformat()}.json"
+        if path.exists():
+            try:
+                return cls.from_dict(json.loads(path.read_text(encoding="utf-8")), lexicon)
+            except (ValueError, KeyError) as e:
+                print(f"[WARNING] Ignoring corrupt schedule {path}: {e}")
+        schedule = cls.build(lexicon, seed, start, days)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Each writer gets its own temp file, so concurrent builders (threads or nodes) never collide.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=path.name, suffix=".tmp", delete=False
+        ) as fh:
+            json.dump(schedule.to_dict(), fh, ensure_ascii=False)
+        tmp = Path(fh.name)
+        try:
+            tmp.replace(path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        # Schedules of earlier periods or of older dictionaries are never read again.
+        for old in path.parent.glob(glob.escape(prefix) + "*.json"):
+            old_fingerprint, _, old_start = old.name[len(prefix):-len(".json")].partition("-")
+            if old_fingerprint != fingerprint or old_start < start.isoformat():
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
+        return schedule
+
+    def to_dict(self) -> dict:
+        return {"seed": self.seed, "start": self.start.isoformat(), "days": self.days, "words": self.words}
+
+    @classmethod
+    def from_dict(cls, raw: dict, lexicon=None) -> "DailySchedule":
+        return cls(raw["seed"], date.fromisoformat(raw["start"]), raw["days"], raw["words"], lexicon)
+
+    def word(self, category: str = ANY, day: date | None = None) -> str | None:
+        """Word of the day; days outside the precomputed range are computed on demand."""
+        day = day or today_utc()
+        category = category or ANY
+        if category.casefold() == ANY.casefold():
+            category = ANY
+        offset = (day - self.start).days
+        words = self.words.get(category)
+        if words is not None and 0 <= offset < len(words):
+            return words[offset]
+        if self._lexicon is None:
+            return None
+        return word_for_day(canonical_words(self._lexicon, category), self.seed, category, day)
+
+
+def main(argv: list[str] | None = None) -> None:
+    from core_bridge import Lexicon
+
+    parser = argparse.ArgumentParser(description="Print the word-of-the-day schedule.")
+    parser.add_argument("words", type=Path)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--start", type=date.fromisoformat, help="first day (default: today, UTC)")
+    parser.add_argument("--category", default=ANY)
+    args = parser.parse_args(argv)
+
+    schedule = DailySchedule.build(Lexicon.from_file(args.words), args.seed, args.start, args.days)
+    for i in range(args.days):
+        day = schedule.start + timedelta(days=i)
+        print(day.isoformat(), schedule.word(args.category, day))
+
+
+if __name__ == "__main__":
+    main()
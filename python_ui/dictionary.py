@@ -0,0 +1,356 @@
+"""Compact binary dictionary (.gwd) shared by the C++ engine and GameCore.
+
+Layout (little-endian, offsets from the start of the file; see DictionaryHeader
+in cpp_core/GameEngine.h):
+
+    header       magic "GWDICT\\0\\1", version, counts and section offsets
+    records      one {u32 text offset, u16 byte length, u16 category id} per word,
+                 sorted by (length in letters, UTF-8 bytes)
+    categories   one {u32 name offset, u32 name length, u32 ids first, u32 ids count} each
+    category ids u32 word ids grouped by category
+    buckets      one {u32 length, u32 first, u32 count} per word length
+    blob         UTF-8 text of all words and category names
+
+MappedLexicon reads it through mmap and only decodes the words that are asked
+for, so opening a dictionary costs the same regardless of its size.
+
+    python python_ui/dictionary.py words.txt words.gwd
+"""
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from pathlib import Path
+
+from core_bridge import Lexicon
+
+MAGIC = b"GWDICT\x00\x01"
+VERSION = 1
+NO_CATEGORY = 0xFFFF
+
+HEADER = struct.Struct("<8s10I")
+RECORD = struct.Struct("<IHH")
+CATEGORY = struct.Struct("<4I")
+BUCKET = struct.Struct("<3I")
+
+
+def binary_path_for(words_path: Path) -> Path:
+    return Path(words_path).with_suffix(".gwd")
+
+
+def binary_generations(words_path: Path) -> list[Path]:
+    """Existing generations of the .gwd for ``words_path``, oldest first: words.gwd, words.1.gwd, ..."""
+    base = binary_path_for(words_path)
+    found = [(0, base)] if base.exists() else []
+    prefix = base.stem + "."
+    try:
+        entries = list(base.parent.iterdir())
+    except OSError:
+        entries = []
+    for p in entries:
+        gen = p.stem[len(prefix):]
+        if p.suffix == base.suffix and p.stem.startswith(prefix) and gen.isascii() and gen.isdigit():
+            found.append((int(gen), p))
+    return [p for _, p in sorted(found)]
+
+
+def current_binary_path(words_path: Path) -> Path:
+    """The .gwd readers should open: the newest generation, or words.gwd if there is none."""
+    generations = binary_generations(words_path)
+    return generations[-1] if generations else binary_path_for(words_path)
+
+
+def install_dictionary(tmp: Path, dst: Path) -> Path:
+    """Move a finished .gwd into place at ``dst``; returns the path readers will open.
+
+    On Windows a dictionary mapped by a running game or server cannot be
+    replaced, so the new file is written as the next generation
+    (words.1.gwd, ...) instead. Readers always open the newest one, and
+    older generations are removed once nothing maps them.
+    """
+    dst = Path(dst)
+    generations = binary_generations(dst)
+    if generations in ([], [dst]):
+        try:
+            tmp.replace(dst)
+            return dst
+        except PermissionError:
+            pass
+    last = int(generations[-1].stem.rsplit(".", 1)[1]) if generations and generations[-1] != dst else 0
+    target = dst.with_name(f"{dst.stem}.{last + 1}{dst.suffix}")
+    tmp.replace(target)
+    for old in generations:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+    return target
+
+
+def is_binary_dictionary(path: Path) -> bool:
+    try:
+        with Path(path).open("rb") as fh:
+            return fh.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_dictionary(entries, dst: Path) -> int:
+    """Write ``(word, category or None)`` pairs as a .gwd file; returns the word count."""
+    words: dict[str, str | None] = {}
+    for word, category in entries:
+        word = word.strip().upper()
+        if word and word not in words:
+            words[word] = (category.strip() or None) if category else None
+
+    ordered = sorted(words, key=lambda w: (len(w), w.encode("utf-8")))
+    category_names: list[str] = []
+    category_index: dict[str, int] = {}
+    blob = bytearray()
+    name_spans = []
+    for word in ordered:
+        cat = words[word]
+        if cat is not None and cat not in category_index:
+            if len(category_names) >= NO_CATEGORY:
+                raise ValueError("Too many categories")
+            category_index[cat] = len(category_names)
+            category_names.append(cat)
+            encoded = cat.encode("utf-8")
+            name_spans.append((len(blob), len(encoded)))
+            blob += encoded
+
+    records = bytearray()
+    ids_by_category: list[list[int]] = [[] for _ in category_names]
+    buckets: list[list[int]] = []
+    for word_id, word in enumerate(ordered):
+        encoded = word.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            raise ValueError(f"Word too long: {word[:20]}...")
+        cat = words[word]
+        cat_id = category_index[cat] if cat is not None else NO_CATEGORY
+        if cat is not None:
+            ids_by_category[cat_id].append(word_id)
+        records += RECORD.pack(len(blob), len(encoded), cat_id)
+        blob += encoded
+        if buckets and buckets[-1][0] == len(word):
+            buckets[-1][2] += 1
+        else:
+            buckets.append([len(word), word_id, 1])
+
+    categories = bytearray()
+    category_ids = bytearray()
+    first = 0
+    for (name_off, name_len), ids in zip(name_spans, ids_by_category):
+        categories += CATEGORY.pack(name_off, name_len, first, len(ids))
+        category_ids += struct.pack(f"<{len(ids)}I", *ids)
+        first += len(ids)
+    bucket_bytes = b"".join(BUCKET.pack(*b) for b in buckets)
+
+    records_off = HEADER.size
+    categories_off = records_off + len(records)
+    category_ids_off = categories_off + len(categories)
+    buckets_off = category_ids_off + len(category_ids)
+    blob_off = buckets_off + len(bucket_bytes)
+    if blob_off + len(blob) > 0xFFFFFFFF:
+        raise ValueError("Dictionary exceeds the 4 GiB format limit")
+    header = HEADER.pack(
+        MAGIC, VERSION, len(ordered), len(category_names), len(buckets),
+        records_off, categories_off, category_ids_off, buckets_off, blob_off, len(blob),
+    )
+
+    dst = Path(dst)
+    tmp = dst.with_name(dst.name + ".tmp")
+    with tmp.open("wb") as fh:
+        for part in (header, records, categories, category_ids, bucket_bytes, blob):
+            fh.write(part)
+    install_dictionary(tmp, dst)
+    return len(ordered)
+
+
+def compile_words_file(src: Path, dst: Path | None = None) -> Path:
+    """Compile a WORD;CATEGORY text file into a .gwd next to it (or at ``dst``)."""
+    lexicon = Lexicon.from_file(src)
+    dst = Path(dst) if dst is not None else binary_path_for(src)
+    write_dictionary(((w, lexicon.category_of.get(w)) for w in lexicon.words), dst)
+    return current_binary_path(dst)
+
+
+class _WordSeq(Sequence):
+    """Read-only list of words backed by word ids (a range or a u32 memoryview)."""
+
+    def __init__(self, lexicon: "MappedLexicon", ids):
+        self._lexicon = lexicon
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._lexicon.word(i) for i in self._ids[index]]
+        return self._lexicon.word(self._ids[index])
+
+
+class _KnownWords:
+    def __init__(self, lexicon: "MappedLexicon"):
+        self._lexicon = lexicon
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._lexicon.find(word) is not None
+
+    def __len__(self) -> int:
+        return len(self._lexicon)
+
+    def __iter__(self):
+        return iter(self._lexicon.words)
+
+
+class _CategoryOf:
+    def __init__(self, lexicon: "MappedLexicon"):
+        self._lexicon = lexicon
+
+    def get(self, word: str, default=None):
+        word_id = self._lexicon.find(word)
+        if word_id is None:
+            return default
+        cat = self._lexicon.category_id(word_id)
+        return self._lexicon.category_names[cat] if cat != NO_CATEGORY else default
+
+    def __getitem__(self, word: str) -> str:
+        value = self.get(word)
+        if value is None:
+            raise KeyError(word)
+        return value
+
+    def __contains__(self, word: str) -> bool:
+        return self.get(word) is not None
+
+
+class MappedLexicon:
+    """Lexicon-compatible read-only view over a memory-mapped .gwd file."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _parse(self) -> None:
+        mm = self._mm
+        if len(mm) < HEADER.size:
+            raise ValueError(f"Truncated dictionary: {self.path}")
+        (magic, version, count, n_categories, n_buckets, records_off, categories_off,
+         category_ids_off, buckets_off, blob_off, blob_size) = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a word dictionary: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported dictionary version {version}: {self.path}")
+        if blob_off + blob_size > len(mm):
+            raise ValueError(f"Corrupt dictionary: {self.path}")
+
+        self._count = count
+        self._records_off = records_off
+        self._blob_off = blob_off
+        # One id array for the whole dictionary (not an object per word); the slices below are views into it.
+        self._category_ids = array("I")
+        self._category_ids.frombytes(mm[category_ids_off:buckets_off])
+        if sys.byteorder != "little":
+            self._category_ids.byteswap()
+        ids = memoryview(self._category_ids)
+
+        self.category_names: list[str] = []
+        self.by_category: dict[str, _WordSeq] = {}
+        for i in range(n_categories):
+            name_off, name_len, first, n = CATEGORY.unpack_from(mm, categories_off + i * CATEGORY.size)
+            name = bytes(mm[blob_off + name_off:blob_off + name_off + name_len]).decode("utf-8")
+            self.category_names.append(name)
+            self.by_category[name] = _WordSeq(self, ids[first:first + n])
+
+        self.by_length: dict[int, _WordSeq] = {}
+        for i in range(n_buckets):
+            length, first, n = BUCKET.unpack_from(mm, buckets_off + i * BUCKET.size)
+            self.by_length[length] = _WordSeq(self, range(first, first + n))
+
+        self.words = _WordSeq(self, range(count))
+        self.known = _KnownWords(self)
+        self.category_of = _CategoryOf(self)
+        self.categories = sorted(self.category_names)
+
+    def _record(self, word_id: int) -> tuple[int, int, int]:
+        return RECORD.unpack_from(self._mm, self._records_off + word_id * RECORD.size)
+
+    def word_bytes(self, word_id: int) -> bytes:
+        offset, length, _ = self._record(word_id)
+        start = self._blob_off + offset
+        return self._mm[start:start + length]
+
+    def word(self, word_id: int) -> str:
+        return self.word_bytes(word_id).decode("utf-8")
+
+    def category_id(self, word_id: int) -> int:
+        return self._record(word_id)[2]
+
+    def find(self, word: str) -> int | None:
+        """Word id by binary search inside its length bucket."""
+        word = word.upper()
+        bucket = self.by_length.get(len(word))
+        if bucket is None:
+            return None
+        ids = bucket._ids
+        target = word.encode("utf-8")
+        keys = _BucketKeys(self, ids)
+        pos = bisect_left(keys, target)
+        if pos < len(ids) and keys[pos] == target:
+            return ids[pos]
+        return None
+
+    def words_in(self, category: str | None):
+        if category in (None, "", "Any"):
+            return self.words
+        return self.by_category.get(category, ())
+
+    def words_of_length(self, length: int):
+        return self.by_length.get(length, ())
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.known
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class _BucketKeys(Sequence):
+    def __init__(self, lexicon: MappedLexicon, ids: range):
+        self._lexicon = lexicon
+        self._ids = ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._lexicon.word_bytes(self._ids[index])
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile words.txt into the binary .gwd dictionary.")
+    parser.add_argument("src", type=Path)
+    parser.add_argument("dst", type=Path, nargs="?")
+    args = parser.parse_args(argv)
+    dst = compile_words_file(args.src, args.dst)
+    print(f"[INFO] Wrote {dst}")
+
+
+if __name__ == "__main__":
+    main()
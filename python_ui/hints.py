@@ -0,0 +1,139 @@
+"""Entropy-based hints over the set of words still consistent with the game so far.
+
+The candidate set only ever shrinks: every guess feedback or revealed letter
+filters the surviving indices, so later hints touch fewer words. Per-position
+letter columns are precomputed once so a reveal is a single boolean mask.
+
+Survivors are kept as an array of word indices rather than a bitset over the
+whole dictionary: a filter step then costs O(survivors) instead of
+O(dictionary), and after the first guess the survivors are a small fraction
+of it.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from scoring import build_alphabet, encode_words, score_codes
+
+# At most this many words are considered when picking the best guess, so a hint stays instant.
+MAX_GUESS_POOL = 64
+MAX_SECRET_SAMPLE = 1024
+
+_UNKNOWN_LETTER = 1000
+MAX_CODED_LENGTH = 40
+
+
+def _entropy(counts: np.ndarray) -> float:
+    counts = counts[counts > 0]
+    total = counts.sum()
+    if total == 0:
+        return 0.0
+    p = counts / total
+    return float(-(p * np.log2(p)).sum())
+
+
+class HintEngine:
+    def __init__(self, words: list[str], length: int, seed: int | None = None):
+        self.length = length
+        self.words = sorted({w.upper() for w in words if len(w) == length})
+        self._alphabet = build_alphabet(self.words) if self.words else np.array([], dtype="<u4")
+        self._letter_codes = {chr(int(cp)): i for i, cp in enumerate(self._alphabet)}
+        self._codes = encode_words(self.words, self._alphabet) if self.words else np.empty((0, length), dtype=np.uint8)
+        # Base-3 codes of whole feedback rows fit in uint64 up to 40 letters.
+        self._powers = 3 ** np.arange(length, dtype=np.uint64) if length <= MAX_CODED_LENGTH else None
+        self._alive = np.arange(len(self.words))
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def candidates(self) -> list[str]:
+        return [self.words[i] for i in self._alive]
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def reset(self, seed: int | None = None) -> None:
+        """Forget all feedback, so one engine (and its encoded words) serves many games; re-seed if given."""
+        self._alive = np.arange(len(self.words))
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+
+    def _encode_guess(self, guess: str) -> np.ndarray:
+        return np.array([self._letter_codes.get(ch, _UNKNOWN_LETTER) for ch in guess.upper()], dtype=np.int16)
+
+    def apply_feedback(self, guess: str, statuses: list[int]) -> None:
+        """Keep only the words that would have produced this feedback for this guess."""
+        if len(guess) != self.length or len(statuses) != self.length or not len(self._alive):
+            return
+        secret_rows = self._codes[self._alive]
+        guesses = np.broadcast_to(self._encode_guess(guess), secret_rows.shape)
+        feedback = score_codes(guesses, secret_rows)
+        self._alive = self._alive[(feedback == np.asarray(statuses, dtype=np.uint8)).all(axis=1)]
+
+    def apply_reveal(self, position: int, letter: str) -> None:
+        code = self._letter_codes.get(letter.upper())
+        if code is None:
+            self._alive = self._alive[:0]
+            return
+        self._alive = self._alive[self._codes[self._alive, position] == code]
+
+    def best_reveal_position(self, exclude=()) -> int | None:
+        """Position whose letter is least predictable among the candidates (max entropy)."""
+        positions = [i for i in range(self.length) if i not in exclude]
+        if not positions:
+            return None
+        if not len(self._alive):
+            return positions[0]
+        alive_codes = self._codes[self._alive]
+        scores = [_entropy(np.bincount(alive_codes[:, i])) for i in positions]
+        return positions[int(np.argmax(scores))]
+
+    def random_candidate(self) -> str | None:
+        if not len(self._alive):
+            return None
+        return self.words[int(self._rng.choice(self._alive))]
+
+    def frequency_guess(self) -> str | None:
+        """Candidate whose letters are the most common at their positions among the candidates."""
+        if not len(self._alive):
+            return None
+        alive_codes = self._codes[self._alive]
+        scores = np.zeros(len(self._alive))
+        for i in range(self.length):
+            column = alive_codes[:, i]
+            scores += np.bincount(column)[column]
+        return self.words[int(self._alive[int(np.argmax(scores))])]
+
+    def suggest_guess(self) -> str | None:
+        """Candidate guess with the highest expected information about the secret."""
+        if not len(self._alive):
+            return None
+        if len(self._alive) <= 2:
+            return self.words[self._alive[0]]
+
+        secrets = self._alive
+        if len(secrets) > MAX_SECRET_SAMPLE:
+            secrets = self._rng.choice(secrets, MAX_SECRET_SAMPLE, replace=False)
+        pool = self._alive
+        if len(pool) > MAX_GUESS_POOL:
+            pool = self._rng.choice(pool, MAX_GUESS_POOL, replace=False)
+
+        # All (guess, secret) pairs are scored in one call.
+        n_pool, n_secrets = len(pool), len(secrets)
+        guesses = np.repeat(self._codes[pool], n_secrets, axis=0)
+        secret_rows = np.tile(self._codes[secrets], (n_pool, 1))
+        feedback = score_codes(guesses, secret_rows)
+        if self._powers is not None:
+            patterns = (feedback.astype(np.uint64) @ self._powers).reshape(n_pool, n_secrets)
+        else:
+            # Too long for a uint64 code: compare whole feedback rows as opaque byte strings.
+            patterns = np.ascontiguousarray(feedback).view(np.dtype((np.void, self.length))).reshape(n_pool, n_secrets)
+
+        # Pattern histograms come from sorting each guess's patterns, so memory stays
+        # O(pool x secrets) instead of a dense 3**length bincount per guess.
+        patterns.sort(axis=1)
+        starts = np.ones(patterns.shape, dtype=bool)
+        starts[:, 1:] = patterns[:, 1:] != patterns[:, :-1]
+        first = np.flatnonzero(starts)
+        p = np.diff(np.append(first, patterns.size)) / n_secrets
+        scores = np.bincount(first // n_secrets, weights=-p * np.log2(p), minlength=n_pool)
+        return self.words[int(pool[int(np.argmax(scores))])]
@@ -0,0 +1,343 @@
+"""Streaming import of huge word lists into the binary .gwd dictionary.
+
+    python python_ui/importer.py corpus.txt.gz words.gwd --alphabet ABCDEFGHIJKLMNOPQRSTUVWXYZ
+
+The input is read line by line and goes through a generator pipeline:
+parse ``WORD;CATEGORY`` (as words.txt), normalize to upper case, validate
+length and alphabet, assign a category, dedupe and write. Memory stays
+bounded by ``--chunk-words``:
+
+1. Accepted words are sorted in chunks and spilled to temporary run files.
+2. The runs are k-way merged in .gwd order, (length, UTF-8 bytes). The
+   first occurrence of a duplicate wins, as in ``write_dictionary``.
+3. Records go straight into the output file while texts go to a spill file.
+4. Per-category id lists are scattered into place from the written records.
+
+Gzip input (``.gz``) is read transparently.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import heapq
+import io
+import sys
+import tempfile
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_UI_DIR = Path(__file__).resolve().parent
+if str(_UI_DIR) not in sys.path:
+    sys.path.insert(0, str(_UI_DIR))
+
+from core_bridge import parse_word_lines  # noqa: E402
+from dictionary import BUCKET, CATEGORY, HEADER, MAGIC, NO_CATEGORY, RECORD, VERSION, install_dictionary  # noqa: E402
+
+DEFAULT_CHUNK_WORDS = 500_000
+# How many category ids are buffered in total before writing them to disk.
+SCATTER_BUFFER_IDS = 1 << 20
+# Most run files open at once while merging; more runs are merged in several passes.
+MAX_MERGE_FANIN = 64
+
+
+@dataclass
+class ImportStats:
+    lines: int = 0
+    bytes_read: int = 0
+    accepted: int = 0
+    duplicates: int = 0
+    written: int = 0
+    categories: int = 0
+    runs: int = 0
+    rejected: Counter = field(default_factory=Counter)
+    seconds: float = 0.0
+    path: Path | None = None
+
+    def as_dict(self) -> dict:
+        secs = self.seconds or 1e-9
+        return {
+            "lines": self.lines,
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "written": self.written,
+            "categories": self.categories,
+            "rejected": dict(self.rejected),
+            "runs": self.runs,
+            "seconds": round(self.seconds, 3),
+            "lines_per_s": round(self.lines / secs, 1),
+            "mb_per_s": round(self.bytes_read / secs / 1e6, 2),
+        }
+
+
+def read_lines(path: Path, stats: ImportStats):
+    opener = gzip.open if Path(path).suffix == ".gz" else open
+    with opener(path, "rb") as raw:
+        # Decode in large blocks; broken bytes become U+FFFD and are rejected by validate().
+        with io.TextIOWrapper(raw, encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                stats.lines += 1
+                yield line
+            stats.bytes_read = raw.tell()
+
+
+def validate(entries, stats: ImportStats, alphabet: str | None = None, min_length: int = 1, max_length: int = 64):
+    allowed = set(alphabet.upper()) if alphabet else None
+    for word, category in entries:
+        if not (min_length <= len(word) <= max_length):
+            stats.rejected["length"] += 1
+        elif "�" in word:
+            stats.rejected["encoding"] += 1
+        elif allowed is not None and not allowed.issuperset(word):
+            stats.rejected["alphabet"] += 1
+        elif allowed is None and not word.isalpha():
+            stats.rejected["alphabet"] += 1
+        elif category is not None and ("\t" in category or "\n" in category):
+            stats.rejected["category"] += 1
+        else:
+            yield word, category
+
+
+def assign_categories(entries, default_category: str | None = None):
+    for word, category in entries:
+        yield word, category or default_category
+
+
+def _spill(chunk: dict[str, tuple[int, str]], tmp_dir: Path, index: int) -> Path:
+    path = tmp_dir / f"run{index:05d}.txt"
+    ordered = sorted(chunk.items(), key=lambda kv: (len(kv[0]), kv[0]))
+    with path.open("w", encoding="utf-8", newline="\n") as fh:
+        for word, (seq, category) in ordered:
+            fh.write(f"{seq}\t{word}\t{category or ''}\n")
+    return path
+
+
+def sorted_runs(entries, tmp_dir: Path, stats: ImportStats, chunk_words: int) -> list[Path]:
+    """Spill sorted, chunk-deduplicated runs of at most ``chunk_words`` words."""
+    runs: list[Path] = []
+    chunk: dict[str, tuple[int, str]] = {}
+    for seq, (word, category) in enumerate(entries):
+        stats.accepted += 1
+        if word in chunk:
+            stats.duplicates += 1
+            continue
+        chunk[word] = (seq, category)
+        if len(chunk) >= chunk_words:
+            runs.append(_spill(chunk, tmp_dir, len(runs)))
+            chunk = {}
+    if chunk:
+        runs.append(_spill(chunk, tmp_dir, len(runs)))
+    stats.runs = len(runs)
+    return runs
+
+
+def _read_run(path: Path):
+    with path.open("r", encoding="utf-8", newline="\n") as fh:
+        for line in fh:
+            seq, word, category = line.rstrip("\n").split("\t")
+            # .gwd order: length in characters, then UTF-8 bytes (the same as code point order).
+            yield len(word), word, int(seq), category or None
+
+
+def _merge_runs(runs: list[Path], stats: ImportStats):
+    """Merge runs in .gwd order, keeping the first occurrence (lowest seq) of every word."""
+    last = None
+    for entry in heapq.merge(*(_read_run(r) for r in runs)):
+        if entry[1] == last:
+            stats.duplicates += 1
+            continue
+        last = entry[1]
+        yield entry
+
+
+def reduce_runs(runs: list[Path], tmp_dir: Path, stats: ImportStats, fanin: int = MAX_MERGE_FANIN) -> list[Path]:
+    """Merge groups of ``fanin`` runs into bigger ones until at most ``fanin`` remain."""
+    generation = 0
+    while len(runs) > fanin:
+        merged = []
+        for i in range(0, len(runs), fanin):
+            group = runs[i:i + fanin]
+            path = tmp_dir / f"merge{generation:02d}_{len(merged):05d}.txt"
+            with path.open("w", encoding="utf-8", newline="\n") as fh:
+                for _, word, seq, category in _merge_runs(group, stats):
+                    fh.write(f"{seq}\t{word}\t{category or ''}\n")
+            for run in group:
+                run.unlink()
+            merged.append(path)
+        runs = merged
+        generation += 1
+    return runs
+
+
+def merged_unique(runs: list[Path], stats: ImportStats):
+    for _, word, _, category in _merge_runs(runs, stats):
+        yield word, category
+
+
+def _scatter_category_ids(out, records_off: int, count: int, ids_off: int, firsts: list[int]) -> None:
+    """Write each category's word ids (ascending) into the category ids section."""
+    cursors = list(firsts)
+    buffers: dict[int, array] = {}
+    buffered = 0
+
+    def flush(cat: int) -> None:
+        ids = buffers.pop(cat)
+        if sys.byteorder != "little":
+            ids.byteswap()
+        out.seek(ids_off + 4 * (cursors[cat] - len(ids)))
+        out.write(ids.tobytes())
+
+    batch = 1 << 16
+    for start in range(0, count, batch):
+        n = min(batch, count - start)
+        out.seek(records_off + start * RECORD.size)
+        data = out.read(n * RECORD.size)
+        for i, (_, _, cat) in enumerate(RECORD.iter_unpack(data)):
+            if cat == NO_CATEGORY:
+                continue
+            buffers.setdefault(cat, array("I")).append(start + i)
+            cursors[cat] += 1
+            buffered += 1
+        if buffered >= SCATTER_BUFFER_IDS:
+            for cat in list(buffers):
+                flush(cat)
+            buffered = 0
+    for cat in list(buffers):
+        flush(cat)
+
+
+def write_stream(entries, dst: Path, tmp_dir: Path, stats: ImportStats) -> int:
+    """Write words already in .gwd order (unique) as a dictionary; returns the word count."""
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(dst.name + ".tmp")
+    blob_path = tmp_dir / "blob.bin"
+    category_index: dict[str, int] = {}
+    category_counts: list[int] = []
+    buckets: list[list[int]] = []
+    blob_size = 0
+    count = 0
+
+    with tmp.open("w+b") as out, blob_path.open("w+b") as blob:
+        out.write(b"\0" * HEADER.size)
+        for word, category in entries:
+            encoded = word.encode("utf-8")
+            if len(encoded) > 0xFFFF:
+                stats.rejected["length"] += 1
+                continue
+            cat_id = NO_CATEGORY
+            if category is not None:
+                cat_id = category_index.get(category)
+                if cat_id is None:
+                    if len(category_index) >= NO_CATEGORY:
+                        raise ValueError("Too many categories")
+                    cat_id = category_index[category] = len(category_counts)
+                    category_counts.append(0)
+                category_counts[cat_id] += 1
+            out.write(RECORD.pack(blob_size, len(encoded), cat_id))
+            blob.write(encoded)
+            blob_size += len(encoded)
+            if buckets and buckets[-1][0] == len(word):
+                buckets[-1][2] += 1
+            else:
+                buckets.append([len(word), count, 1])
+            count += 1
+
+        categories = bytearray()
+        firsts = []
+        first = 0
+        for name, cat_id in sorted(category_index.items(), key=lambda kv: kv[1]):
+            encoded = name.encode("utf-8")
+            categories += CATEGORY.pack(blob_size, len(encoded), first, category_counts[cat_id])
+            blob.write(encoded)
+            blob_size += len(encoded)
+            firsts.append(first)
+            first += category_counts[cat_id]
+
+        records_off = HEADER.size
+        categories_off = records_off + count * RECORD.size
+        category_ids_off = categories_off + len(categories)
+        buckets_off = category_ids_off + 4 * first
+        bucket_bytes = b"".join(BUCKET.pack(*b) for b in buckets)
+        blob_off = buckets_off + len(bucket_bytes)
+        if blob_off + blob_size > 0xFFFFFFFF:
+            raise ValueError("Dictionary exceeds the 4 GiB format limit")
+
+        out.seek(categories_off)
+        out.write(categories)
+        out.truncate(buckets_off)
+        _scatter_category_ids(out, records_off, count, category_ids_off, firsts)
+        out.seek(buckets_off)
+        out.write(bucket_bytes)
+        blob.seek(0)
+        while True:
+            piece = blob.read(1 << 20)
+            if not piece:
+                break
+            out.write(piece)
+        out.seek(0)
+        out.write(HEADER.pack(
+            MAGIC, VERSION, count, len(category_index), len(buckets),
+            records_off, categories_off, category_ids_off, buckets_off, blob_off, blob_size,
+        ))
+    stats.path = install_dictionary(tmp, dst)
+    stats.written = count
+    stats.categories = len(category_index)
+    return count
+
+
+def import_words(
+    src: Path,
+    dst: Path,
+    alphabet: str | None = None,
+    min_length: int = 1,
+    max_length: int = 64,
+    default_category: str | None = None,
+    chunk_words: int = DEFAULT_CHUNK_WORDS,
+    tmp_dir: Path | None = None,
+) -> ImportStats:
+    stats = ImportStats()
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="gw_import_", dir=tmp_dir) as tmp:
+        tmp = Path(tmp)
+        entries = parse_word_lines(read_lines(src, stats))
+        entries = validate(entries, stats, alphabet, min_length, max_length)
+        entries = assign_categories(entries, default_category)
+        runs = reduce_runs(sorted_runs(entries, tmp, stats, chunk_words), tmp, stats)
+        write_stream(merged_unique(runs, stats), dst, tmp, stats)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Import a large WORD;CATEGORY list into a .gwd dictionary.")
+    parser.add_argument("src", type=Path, help="text word list (optionally .gz)")
+    parser.add_argument("dst", type=Path, help="output .gwd")
+    parser.add_argument("--alphabet", help="allowed letters (default: any Unicode letters)")
+    parser.add_argument("--min-length", type=int, default=1)
+    parser.add_argument("--max-length", type=int, default=64)
+    parser.add_argument("--default-category", help="category for lines without one")
+    parser.add_argument("--chunk-words", type=int, default=DEFAULT_CHUNK_WORDS, help="words sorted in memory at once")
+    parser.add_argument("--tmp-dir", type=Path, help="where to spill sorted runs")
+    args = parser.parse_args(argv)
+
+    stats = import_words(
+        args.src, args.dst, args.alphabet, args.min_length, args.max_length,
+        args.default_category, args.chunk_words, args.tmp_dir,
+    )
+    report = stats.as_dict()
+    try:
+        import resource
+
+        report["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:
+        pass
+    print(f"[INFO] Wrote {stats.path}: {stats.written} words, {stats.lines} lines in {stats.seconds:.1f}s "
+          f"({report['lines_per_s']:.0f} lines/s, {report['mb_per_s']} MB/s)")
+    print(report)
+
+
+if __name__ == "__main__":
+    main()
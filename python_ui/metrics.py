@@ -0,0 +1,153 @@
+"""Opt-in call metrics for GameCore: counts, latency histograms, native/emulation paths, errors.
+
+Nothing here runs unless ``GameCore.enable_metrics()`` is called; enabling wraps
+the instrumented methods on the instances themselves, so a core without
+metrics pays no per-call cost at all.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import time
+import weakref
+
+# Latency histogram bounds in seconds (1 us ... 1 s).
+LATENCY_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class _MethodStats:
+    __slots__ = ("calls", "errors", "paths", "sum", "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.paths: dict[str, int] = {}
+        self.sum = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+
+class Metrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: dict[str, _MethodStats] = {}
+        self._errors_by_path: dict[tuple[str, str], int] = {}
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            stats = self._methods[method] = _MethodStats()
+        return stats
+
+    def observe(self, method: str, seconds: float, path: str) -> None:
+        idx = 0
+        for bound in LATENCY_BUCKETS:
+            if seconds <= bound:
+                break
+            idx += 1
+        with self._lock:
+            stats = self._stats(method)
+            stats.calls += 1
+            stats.sum += seconds
+            stats.buckets[idx] += 1
+            stats.paths[path] = stats.paths.get(path, 0) + 1
+
+    def count_error(self, method: str, path: str) -> None:
+        with self._lock:
+            self._stats(method).errors += 1
+            key = (method, path)
+            self._errors_by_path[key] = self._errors_by_path.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods.clear()
+            self._errors_by_path.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            methods = {}
+            for name, s in sorted(self._methods.items()):
+                cumulative, buckets = 0, {}
+                for bound, n in zip(LATENCY_BUCKETS, s.buckets):
+                    cumulative += n
+                    buckets[repr(bound)] = cumulative
+                buckets["+Inf"] = cumulative + s.buckets[-1]
+                methods[name] = {
+                    "calls": s.calls,
+                    "errors": s.errors,
+                    "paths": dict(s.paths),
+                    "latency_seconds": {"sum": s.sum, "buckets": buckets},
+                }
+            errors = [
+                {"method": m, "path": p, "count": n}
+                for (m, p), n in sorted(self._errors_by_path.items())
+            ]
+        return {"methods": methods, "errors": errors}
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self, prefix: str = "guess_game") -> str:
+        snap = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total GameCore calls by method and execution path.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for name, m in snap["methods"].items():
+            for path, n in sorted(m["paths"].items()):
+                lines.append(f'{prefix}_calls_total{{method="{name}",path="{path}"}} {n}')
+
+        lines += [
+            f"# HELP {prefix}_errors_total Exceptions raised or swallowed inside GameCore calls.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        for e in snap["errors"]:
+            lines.append(f'{prefix}_errors_total{{method="{e["method"]}",path="{e["path"]}"}} {e["count"]}')
+
+        lines += [
+            f"# HELP {prefix}_call_latency_seconds GameCore call latency.",
+            f"# TYPE {prefix}_call_latency_seconds histogram",
+        ]
+        for name, m in snap["methods"].items():
+            lat = m["latency_seconds"]
+            for le, n in lat["buckets"].items():
+                lines.append(f'{prefix}_call_latency_seconds_bucket{{method="{name}",le="{le}"}} {n}')
+            lines.append(f'{prefix}_call_latency_seconds_sum{{method="{name}"}} {lat["sum"]:.9f}')
+            lines.append(f'{prefix}_call_latency_seconds_count{{method="{name}"}} {m["calls"]}')
+        return "\n".join(lines) + "\n"
+
+
+def instrument(obj, method_names, metrics: Metrics, path_of) -> None:
+    """Shadow ``obj``'s methods with timing wrappers; ``path_of(obj)`` labels native vs emulation.
+
+    The wrappers hold ``obj`` weakly, so instrumenting does not turn it into a
+    reference cycle and a session still frees its native handle as soon as the
+    last reference goes away.
+    """
+    clock = time.perf_counter
+    ref = weakref.ref(obj)
+    for name in method_names:
+        fn = getattr(type(obj), name)
+
+        def wrapper(*args, __fn=fn, __name=name, **kwargs):
+            target = ref()
+            if target is None:
+                raise ReferenceError(f"{__name} called on a collected object")
+            t0 = clock()
+            try:
+                result = __fn(target, *args, **kwargs)
+            except Exception:
+                metrics.count_error(__name, path_of(target))
+                raise
+            metrics.observe(__name, clock() - t0, path_of(target))
+            return result
+
+        setattr(obj, name, functools.update_wrapper(wrapper, fn))
+
+
+def uninstrument(obj, method_names) -> None:
+    for name in method_names:
+        obj.__dict__.pop(name, None)
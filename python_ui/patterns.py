@@ -0,0 +1,144 @@
+"""Precomputed guess x secret feedback matrices.
+
+Each feedback row (0 - absent, 1 - present, 2 - correct per letter) is packed
+into one base-3 integer, letter i contributing ``status * 3**i``. A matrix holds
+the code for every (guess, secret) pair of one word length, so solvers and hint
+logic can look feedback up instead of re-scoring words.
+"""
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from core_bridge import Lexicon
+from scoring import build_alphabet, encode_words, score_codes
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / "cache"
+# Longest word whose base-3 code still fits in uint64 (3**40 < 2**64 < 3**41).
+MAX_PATTERN_LENGTH = 40
+
+
+def pattern_dtype(length: int) -> np.dtype:
+    if length > MAX_PATTERN_LENGTH:
+        raise ValueError(f"Feedback patterns support words of up to {MAX_PATTERN_LENGTH} letters, got {length}")
+    if 3 ** length <= 256:
+        return np.dtype(np.uint8)
+    if 3 ** length <= 65536:
+        return np.dtype(np.uint16)
+    if 3 ** length <= 2 ** 32:
+        return np.dtype(np.uint32)
+    return np.dtype(np.uint64)
+
+
+def encode_pattern(statuses: list[int]) -> int:
+    code = 0
+    for i, s in enumerate(statuses):
+        code += int(s) * 3 ** i
+    return code
+
+
+def decode_pattern(code: int, length: int) -> list[int]:
+    statuses = []
+    for _ in range(length):
+        code, s = divmod(int(code), 3)
+        statuses.append(s)
+    return statuses
+
+
+def all_correct(length: int) -> int:
+    return 3 ** length - 1
+
+
+def _powers(length: int) -> np.ndarray:
+    pattern_dtype(length)
+    return 3 ** np.arange(length, dtype=np.uint64)
+
+
+class PatternMatrix:
+    """Feedback codes for all words of one length; ``matrix[g, s]`` is guess g against secret s."""
+
+    def __init__(self, words: list[str], matrix: np.ndarray):
+        self.words = list(words)
+        self.length = len(self.words[0]) if self.words else 0
+        self.matrix = matrix
+        self.index = {w: i for i, w in enumerate(self.words)}
+
+    @classmethod
+    def build(cls, words: list[str], core=None) -> "PatternMatrix":
+        """Score every pair; uses ``core.evaluate_many`` when a GameCore is given, NumPy otherwise."""
+        words = [w.upper() for w in words]
+        n = len(words)
+        length = len(words[0]) if words else 0
+        if any(len(w) != length for w in words):
+            raise ValueError("All words in a pattern matrix must have the same length")
+
+        matrix = np.empty((n, n), dtype=pattern_dtype(length))
+        powers = _powers(length)
+        codes = encode_words(words, build_alphabet(words)) if core is None else None
+        for s, secret in enumerate(words):
+            if core is not None:
+                column = np.asarray(core.evaluate_many(words, secret), dtype=np.uint64).reshape(n, length)
+            else:
+                column = score_codes(codes, codes[s]).astype(np.uint64)
+            matrix[:, s] = column @ powers
+        return cls(words, matrix)
+
+    @classmethod
+    def load_or_build(cls, words: list[str], cache_dir: Path = DEFAULT_CACHE_DIR, core=None) -> "PatternMatrix":
+        """Memory-map a cached ``.npy`` for this exact word list, building it on a miss."""
+        words = [w.upper() for w in words]
+        cache_dir = Path(cache_dir)
+        path = cache_dir / cache_file_name(words)
+        if path.exists():
+            try:
+                matrix = np.load(path, mmap_mode="r")
+                if matrix.shape == (len(words), len(words)):
+                    return cls(words, matrix)
+            except Exception as e:
+                print(f"[WARNING] Ignoring unreadable pattern cache {path}: {e}")
+
+        built = cls.build(words, core=core)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer, so processes building the same cache never collide.
+            with tempfile.NamedTemporaryFile(dir=cache_dir, prefix=path.stem, suffix=".tmp", delete=False) as fh:
+                np.save(fh, built.matrix)
+            tmp = Path(fh.name)
+            try:
+                tmp.replace(path)
+            except OSError:
+                tmp.unlink(missing_ok=True)
+                raise
+            return cls(words, np.load(path, mmap_mode="r"))
+        except Exception as e:
+            print(f"[WARNING] Failed to write pattern cache {path}: {e}")
+            return built
+
+    def pattern(self, guess: str, secret: str) -> int:
+        return int(self.matrix[self.index[guess.upper()], self.index[secret.upper()]])
+
+    def row(self, guess: str) -> np.ndarray:
+        return self.matrix[self.index[guess.upper()]]
+
+    def feedback(self, guess: str, secret: str) -> list[int]:
+        return decode_pattern(self.pattern(guess, secret), self.length)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def cache_file_name(words: list[str]) -> str:
+    length = len(words[0]) if words else 0
+    digest = hashlib.sha1("\n".join(words).encode("utf-8")).hexdigest()[:16]
+    return f"patterns_len{length}_{digest}.npy"
+
+
+def matrices_for_lexicon(lexicon: Lexicon, cache_dir: Path = DEFAULT_CACHE_DIR, core=None) -> dict[int, PatternMatrix]:
+    """One cached matrix per word length in the lexicon (n x n each, so keep buckets modest)."""
+    return {
+        length: PatternMatrix.load_or_build(words, cache_dir=cache_dir, core=core)
+        for length, words in sorted(lexicon.by_length.items())
+    }
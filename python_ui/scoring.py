@@ -0,0 +1,74 @@
+"""Vectorized NumPy scoring of many guesses at once.
+
+Words are encoded as rows of uint8 letter codes. Scoring keeps the same
+repeated-letter rule as the two-pass ``evaluate_guess``/``GameEngine::checkWord``:
+exact matches first, then a letter is "present" only while unmatched copies of
+it remain in the secret, claimed left to right.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+
+
+def _code_points(words: list[str]) -> np.ndarray:
+    length = len(words[0]) if words else 0
+    if any(len(w) != length for w in words):
+        raise ValueError("Guess length mismatch")
+    flat = np.frombuffer("".join(words).encode("utf-32-le"), dtype="<u4")
+    return flat.reshape(len(words), length)
+
+
+def build_alphabet(words) -> np.ndarray:
+    """Sorted code points of every letter used; a letter's uint8 code is its index here."""
+    words = [w.upper() for w in words]
+    letters = np.unique(np.frombuffer("".join(words).encode("utf-32-le"), dtype="<u4"))
+    if len(letters) > 256:
+        raise ValueError("Too many distinct letters for uint8 codes")
+    return letters
+
+
+def encode_words(words, alphabet: np.ndarray) -> np.ndarray:
+    """Encode equal-length words as an (n, length) uint8 array."""
+    points = _code_points([w.upper() for w in words])
+    codes = np.searchsorted(alphabet, points)
+    if codes.size and (codes.max() >= len(alphabet) or not np.array_equal(alphabet[codes], points)):
+        raise ValueError("Word contains a letter outside the alphabet")
+    return codes.astype(np.uint8)
+
+
+def score_codes(guesses: np.ndarray, secrets: np.ndarray) -> np.ndarray:
+    """Score guess rows against secret rows (a single secret row broadcasts).
+
+    Returns an (n, length) uint8 array of 0/1/2 feedback.
+    """
+    g = np.asarray(guesses, dtype=np.int16)
+    if g.ndim == 1:
+        g = g[np.newaxis, :]
+    s = np.broadcast_to(np.asarray(secrets, dtype=np.int16), g.shape)
+
+    green = g == s
+    result = np.where(green, CORRECT, ABSENT).astype(np.uint8)
+    # Green positions drop out of the count: the secret and the guess get different sentinels there.
+    s_free = np.where(green, -1, s)
+    g_free = np.where(green, -2, g)
+
+    for i in range(g.shape[1]):
+        letter = g_free[:, i:i + 1]
+        available = (s_free == letter).sum(axis=1)
+        claimed = (g_free[:, :i] == letter).sum(axis=1)
+        result[(~green[:, i]) & (claimed < available), i] = PRESENT
+    return result
+
+
+def score_words(guesses: list[str], secret: str) -> list[list[int]]:
+    """Drop-in bulk equivalent of ``[evaluate_guess(g, secret) for g in guesses]``."""
+    if not guesses:
+        return []
+    alphabet = build_alphabet(list(guesses) + [secret])
+    codes = encode_words(guesses, alphabet)
+    target = encode_words([secret], alphabet)[0]
+    if codes.shape[1] != target.shape[0]:
+        raise ValueError("Guess length mismatch")
+    return score_codes(codes, target).tolist()
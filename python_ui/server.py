@@ -0,0 +1,181 @@
+"""Headless game server: JSON lines over a local socket, one GameSession per connection.
+
+Run from the project root with ``python -m python_ui.server`` (or
+``python python_ui/server.py``). Every request is one JSON object per line:
+
+    {"op": "categories"}
+    {"op": "start", "category": "FRUIT", "attempts": 5}
+    {"op": "start", "category": "FRUIT", "daily": true}   (word of the day, the same on every node)
+    {"op": "guess", "word": "APPLE"}
+    {"op": "status"}
+    {"op": "metrics", "format": "json" | "prometheus"}   (with --metrics)
+
+and every reply is one JSON object with ``"ok": true`` or ``"ok": false`` plus ``"error"``.
+Native calls run on a thread pool so a slow call never blocks the event loop.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+_UI_DIR = Path(__file__).resolve().parent
+# python_ui modules import each other flat (as in app.py), so add the folder to the path for -m runs too.
+if str(_UI_DIR) not in sys.path:
+    sys.path.insert(0, str(_UI_DIR))
+
+from core_bridge import GameCore, GameSession, find_library  # noqa: E402
+
+STATUS_NAMES = {1: "won", -1: "lost", 0: "playing"}
+
+
+class GameServer:
+    def __init__(self, core: GameCore, workers: int = 8, daily_seed: int = 0):
+        self.core = core
+        self.daily_seed = daily_seed
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="game-core")
+        self.connections = 0
+
+    async def _call(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(fn, *args, **kwargs))
+
+    def _state(self, session: GameSession) -> dict:
+        game = session.get_state()
+        state = {
+            "ok": True,
+            "length": game.word_length,
+            "attempts_left": game.attempts_left,
+            "status": STATUS_NAMES.get(game.status, "playing"),
+        }
+        if game.status != 0:
+            state["secret"] = session.get_secret()
+        return state
+
+    def _start(self, session: GameSession, category: str, attempts: int, daily: bool = False) -> dict:
+        if daily:
+            session.start_daily_game(category, attempts, seed=self.daily_seed)
+        else:
+            session.start_game(category, attempts)
+        return self._state(session)
+
+    def _guess(self, session: GameSession, word: str, length: int) -> dict:
+        if session.get_game_status() != 0:
+            return {"ok": False, "error": "game is over"}
+        statuses = session.guess_word(word, length)
+        state = self._state(session)
+        state["statuses"] = statuses
+        return state
+
+    async def handle_request(self, session: GameSession, game: dict, request: dict) -> dict:
+        op = request.get("op")
+        if op == "categories":
+            return {"ok": True, "categories": await self._call(self.core.get_categories)}
+        if op == "metrics":
+            metrics = self.core.metrics
+            if metrics is None:
+                return {"ok": False, "error": "metrics are disabled (start the server with --metrics)"}
+            if request.get("format") == "prometheus":
+                return {"ok": True, "text": metrics.to_prometheus()}
+            return {"ok": True, "metrics": metrics.snapshot()}
+        if op == "start":
+            category = str(request.get("category") or "Any")
+            attempts = int(request.get("attempts") or 5)
+            try:
+                reply = await self._call(self._start, session, category, attempts, bool(request.get("daily")))
+            except (RuntimeError, ValueError) as e:
+                return {"ok": False, "error": str(e)}
+            game["length"] = reply["length"]
+            return reply
+        if not game.get("length"):
+            return {"ok": False, "error": "no game started"}
+        if op == "guess":
+            word = str(request.get("word") or "").strip().upper()
+            if len(word) != game["length"]:
+                return {"ok": False, "error": f"word must contain {game['length']} letters"}
+            return await self._call(self._guess, session, word, game["length"])
+        if op == "status":
+            return await self._call(self._state, session)
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        session = await self._call(self.core.new_session)
+        game: dict = {}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                    reply = await self.handle_request(session, game, request)
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            await self._call(session.close)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str, port: int, unix_path: str | None = None) -> None:
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port)
+        addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+        print(f"[INFO] Game server listening on {addrs}")
+        async with server:
+            await server.serve_forever()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        self.core.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless Guess The Word server (JSON lines).")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", dest="unix_path", help="listen on a Unix domain socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=8, help="threads for native calls")
+    parser.add_argument("--lib", type=Path, help="path to the native game core library")
+    parser.add_argument("--words", type=Path, default=_UI_DIR.parent / "words.txt")
+    parser.add_argument("--emulation", action="store_true", help="use the Python emulation instead of the native core")
+    parser.add_argument("--metrics", action="store_true", help="record GameCore call metrics")
+    parser.add_argument("--daily-seed", type=int, default=0, help="seed of the word-of-the-day schedule")
+    parser.add_argument("--watch", type=float, metavar="SECONDS", help="reload the words file when it changes")
+    args = parser.parse_args(argv)
+
+    lib = None if args.emulation else args.lib or find_library(_UI_DIR)
+    core = GameCore(lib, args.words, use_native=not args.emulation)
+    if args.metrics:
+        core.enable_metrics()
+    if args.watch:
+        core.watch(args.watch, on_reload=lambda n: print(f"[INFO] Dictionary reloaded: {n} words"))
+    server = GameServer(core, workers=args.workers, daily_seed=args.daily_seed)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix_path))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Play many automated games against GameCore on every core of the machine.
+
+    python python_ui/simulate.py --games 1000000 --strategy entropy --output sim.json
+
+Games are split into chunks that run on a ProcessPoolExecutor. Every worker
+owns one GameCore and one native session. It returns only the aggregate
+counters of its chunk. The parent merges chunks as they complete and keeps a
+bounded number in flight, so memory does not grow with ``--games``.
+``--jsonl`` additionally streams every chunk's counters as they arrive.
+
+Chunk ``i`` seeds the session and the strategies with ``--seed + i``, so a
+run is reproducible whatever worker plays each chunk. When a strategy runs
+out of consistent words the game is counted as lost and reported under
+``stuck`` rather than finished by guessing the secret.
+
+Strategies guess among the words still consistent with the feedback so far
+(see HintEngine):
+    random     a random consistent word
+    frequency  the consistent word with the most common letters per position
+    entropy    the word with the highest expected information
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+_UI_DIR = Path(__file__).resolve().parent
+if str(_UI_DIR) not in sys.path:
+    sys.path.insert(0, str(_UI_DIR))
+
+from core_bridge import GameCore, find_library  # noqa: E402
+from hints import HintEngine  # noqa: E402
+
+STRATEGIES = {
+    "random": HintEngine.random_candidate,
+    "frequency": HintEngine.frequency_guess,
+    "entropy": HintEngine.suggest_guess,
+}
+
+# Worker process state: the core, a session and hint engines by (category, length).
+_worker: dict = {}
+
+
+def _init_worker(lib_path: str | None, words_path: str, use_native: bool) -> None:
+    core = GameCore(Path(lib_path) if lib_path else None, Path(words_path), use_native=use_native)
+    _worker["core"] = core
+    _worker["session"] = core.new_session()
+    _worker["engines"] = {}
+    # Engines already re-seeded for the current chunk.
+    _worker["seeded"] = set()
+
+
+def _engine_for(category: str, length: int, seed: int) -> HintEngine:
+    """The worker's engine for (category, length), built once; its RNG follows the chunk's seed."""
+    key = (category, length)
+    engine = _worker["engines"].get(key)
+    if engine is None:
+        core = _worker["core"]
+        words = [w for w in core.filter_words_by_category(category) if len(w) == length]
+        engine = _worker["engines"][key] = HintEngine(words, length, seed=seed)
+    elif key not in _worker["seeded"]:
+        engine.reset(seed)
+    _worker["seeded"].add(key)
+    engine.reset()
+    return engine
+
+
+def _new_totals() -> dict:
+    return {
+        "games": 0,
+        "wins": 0,
+        "stuck": 0,
+        "guesses": 0,
+        "guess_distribution": Counter(),
+        "by_length": {},
+        "by_word": {},
+        "seconds": 0.0,
+    }
+
+
+def play_chunk(strategy: str, category: str, attempts: int, games: int, seed: int, per_word: bool) -> dict:
+    """Play ``games`` games in this worker and return their counters."""
+    random.seed(seed)
+    session = _worker["session"]
+    session.seed(seed)
+    _worker["seeded"].clear()
+    choose = STRATEGIES[strategy]
+    totals = _new_totals()
+    started = time.perf_counter()
+    for _ in range(games):
+        session.start_game(category, attempts)
+        secret = session.get_secret().upper()
+        length = len(secret)
+        engine = _engine_for(category, length, seed)
+        guesses = 0
+        status = 0
+        while status == 0:
+            guess = choose(engine)
+            if guess is None:
+                # No consistent word left: a loss, never a free guess of the secret.
+                totals["stuck"] += 1
+                status = -1
+                break
+            statuses = session.guess_word_view(guess, length)
+            guesses += 1
+            engine.apply_feedback(guess, statuses)
+            status = session.get_game_status()
+        won = status == 1
+
+        totals["games"] += 1
+        totals["wins"] += won
+        totals["guesses"] += guesses
+        totals["guess_distribution"][guesses if won else 0] += 1
+        bucket = totals["by_length"].setdefault(length, [0, 0])
+        bucket[0 if won else 1] += 1
+        if per_word:
+            bucket = totals["by_word"].setdefault(secret, [0, 0])
+            bucket[0 if won else 1] += 1
+    totals["seconds"] = time.perf_counter() - started
+    return totals
+
+
+def merge(into: dict, chunk: dict) -> None:
+    for key in ("games", "wins", "stuck", "guesses", "seconds"):
+        into[key] += chunk[key]
+    into["guess_distribution"].update(chunk["guess_distribution"])
+    for table in ("by_length", "by_word"):
+        for key, (wins, losses) in chunk[table].items():
+            bucket = into[table].setdefault(key, [0, 0])
+            bucket[0] += wins
+            bucket[1] += losses
+
+
+def summary(totals: dict, wall_s: float) -> dict:
+    games = totals["games"]
+    by_word = sorted(totals["by_word"].items(), key=lambda kv: (-kv[1][1] / sum(kv[1]), -sum(kv[1])))
+    return {
+        "games": games,
+        "wins": totals["wins"],
+        "win_rate": round(100.0 * totals["wins"] / games, 3) if games else 0.0,
+        # Losses where the strategy had no consistent word left to guess.
+        "stuck": totals["stuck"],
+        "avg_guesses": round(totals["guesses"] / games, 4) if games else 0.0,
+        # 0 means lost games.
+        "guess_distribution": {str(k): v for k, v in sorted(totals["guess_distribution"].items())},
+        "by_length": {str(k): v for k, v in sorted(totals["by_length"].items())},
+        "hardest_words": [[w, wins, losses] for w, (wins, losses) in by_word[:50]],
+        "wall_s": round(wall_s, 3),
+        "games_per_s": round(games / wall_s, 1) if wall_s else None,
+        "worker_cpu_s": round(totals["seconds"], 3),
+    }
+
+
+def simulate(
+    games: int,
+    strategy: str = "entropy",
+    category: str = "Any",
+    attempts: int = 6,
+    workers: int | None = None,
+    chunk_size: int = 500,
+    seed: int = 0,
+    lib_path: Path | None = None,
+    words_path: Path = _UI_DIR.parent / "words.txt",
+    use_native: bool = True,
+    per_word: bool = False,
+    on_chunk=None,
+) -> dict:
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    workers = workers or os.cpu_count() or 1
+    totals = _new_totals()
+    started = time.perf_counter()
+    chunks = ((i, min(chunk_size, games - start)) for i, start in enumerate(range(0, games, chunk_size)))
+    init_args = (str(lib_path) if lib_path else None, str(words_path), use_native)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+        pending = set()
+        for index, size in chunks:
+            pending.add(pool.submit(play_chunk, strategy, category, attempts, size, seed + index, per_word))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = future.result()
+                    merge(totals, chunk)
+                    if on_chunk is not None:
+                        on_chunk(chunk, totals)
+        for future in pending:
+            chunk = future.result()
+            merge(totals, chunk)
+            if on_chunk is not None:
+                on_chunk(chunk, totals)
+    return summary(totals, time.perf_counter() - started)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Play automated Guess The Word games in parallel.")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--category", default="Any")
+    parser.add_argument("--attempts", type=int, default=6)
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    parser.add_argument("--chunk", type=int, default=500, help="games per task")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lib", type=Path, help="path to the native game core library")
+    parser.add_argument("--words", type=Path, default=_UI_DIR.parent / "words.txt")
+    parser.add_argument("--emulation", action="store_true", help="use the Python emulation instead of the native core")
+    parser.add_argument("--per-word", action="store_true", help="collect wins/losses per secret word")
+    parser.add_argument("--jsonl", type=Path, help="stream per-chunk counters to this JSON lines file")
+    parser.add_argument("--output", type=Path, help="write the summary here instead of stdout")
+    args = parser.parse_args(argv)
+
+    lib = args.lib
+    if lib is None and not args.emulation:
+        try:
+            lib = find_library(_UI_DIR)
+        except FileNotFoundError as e:
+            print(f"[WARNING] {e} Using the Python emulation.")
+
+    stream = args.jsonl.open("w", encoding="utf-8") if args.jsonl else None
+
+    def on_chunk(chunk: dict, totals: dict) -> None:
+        if stream is not None:
+            stream.write(json.dumps({k: v for k, v in chunk.items() if k != "by_word"}) + "\n")
+        print(f"[INFO] {totals['games']}/{args.games} games, win rate {100.0 * totals['wins'] / totals['games']:.2f}%",
+              file=sys.stderr)
+
+    try:
+        result = simulate(
+            args.games, args.strategy, args.category, args.attempts, args.workers, args.chunk, args.seed,
+            lib, args.words, use_native=not args.emulation and lib is not None, per_word=args.per_word,
+            on_chunk=on_chunk,
+        )
+    finally:
+        if stream is not None:
+            stream.close()
+    result["params"] = {"strategy": args.strategy, "category": args.category, "attempts": args.attempts}
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+        print(f"[INFO] Wrote {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
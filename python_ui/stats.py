@@ -0,0 +1,428 @@
+"""Game statistics: an append-only result log plus a periodically compacted snapshot.
+
+``record()`` only updates the in-memory totals and queues the result; a
+background thread appends queued results to ``<name>.log`` (one JSON line per
+game) in batches. Every ``compact_every`` games the totals are written to the
+snapshot (``stats.json``) through a temp file and an atomic rename, and the log
+is truncated. Each result carries a sequence number and the snapshot remembers
+the last one it includes, so a crash at any point neither loses nor double
+counts a logged game.
+
+SQLiteStatsStore keeps the same interface on top of a local SQLite database
+(WAL mode) with per-game and per-guess rows. Triggers maintain small rollup
+tables, so win rates, the guess distribution and the hardest words are read
+from a few hundred rows no matter how many games were recorded.
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+SNAPSHOT_VERSION = 2
+_NOTHING = object()
+
+
+@dataclass
+class GameResult:
+    won: bool
+    category: str | None = None
+    word_length: int = 0
+    guesses: int = 0
+    duration_s: float = 0.0
+    finished_at: float = field(default_factory=time.time)
+    seq: int = 0
+    word: str | None = None
+    # [[guess, base-3 pattern as in patterns.encode_pattern], ...]
+    history: list[list] = field(default_factory=list)
+
+
+@dataclass
+class GameStats:
+    wins: int = 0
+    losses: int = 0
+    guesses: int = 0
+    duration_s: float = 0.0
+    by_category: dict[str, list[int]] = field(default_factory=dict)
+    by_length: dict[str, list[int]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return self.wins + self.losses
+
+    @property
+    def win_rate(self) -> float:
+        return (self.wins / self.total) * 100 if self.total else 0.0
+
+    def add(self, result: GameResult) -> None:
+        idx = 0 if result.won else 1
+        if result.won:
+            self.wins += 1
+        else:
+            self.losses += 1
+        self.guesses += result.guesses
+        self.duration_s += result.duration_s
+        # [wins, losses] per category and per word length.
+        if result.category:
+            self.by_category.setdefault(result.category, [0, 0])[idx] += 1
+        if result.word_length:
+            self.by_length.setdefault(str(result.word_length), [0, 0])[idx] += 1
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "GameStats":
+        known = {k: raw[k] for k in cls.__dataclass_fields__ if k in raw}
+        return cls(**known)
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        fh.write(text)
+        fh.flush()
+        os.fsync(fh.fileno())
+    tmp.replace(path)
+
+
+class StatsStore:
+    def __init__(
+        self,
+        path: Path,
+        persist: bool = True,
+        flush_interval: float = 1.0,
+        compact_every: int = 100,
+    ):
+        self.path = Path(path)
+        self.log_path = self.path.with_suffix(".log")
+        self.persist = bool(persist)
+        self.flush_interval = flush_interval
+        self.compact_every = max(1, compact_every)
+        self.data = GameStats()
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue()
+        self._logged_since_compact = 0
+        self._writer: threading.Thread | None = None
+        if self.persist:
+            self._load()
+            self._writer = threading.Thread(target=self._run_writer, name="stats-writer", daemon=True)
+            self._writer.start()
+
+    def _load(self) -> None:
+        snapshot_seq = 0
+        if self.path.exists():
+            try:
+                with self.path.open("r", encoding="utf-8") as fh:
+                    raw = json.load(fh)
+                self.data = GameStats.from_dict(raw)
+                snapshot_seq = int(raw.get("seq", 0))
+            except Exception:
+                self.data = GameStats()
+        self._seq = snapshot_seq
+
+        if not self.log_path.exists():
+            return
+        with self.log_path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    result = GameResult(**json.loads(line))
+                except (ValueError, TypeError):
+                    # A truncated last line after a crash.
+                    continue
+                if result.seq <= snapshot_seq:
+                    continue
+                self.data.add(result)
+                self._seq = max(self._seq, result.seq)
+                self._logged_since_compact += 1
+
+    def record(self, won: bool, category: str | None = None, word_length: int = 0,
+               guesses: int = 0, duration_s: float = 0.0, word: str | None = None,
+               history: list[tuple[str, list[int]]] = ()) -> GameResult:
+        encoded = [[guess, sum(int(st) * 3 ** i for i, st in enumerate(statuses))] for guess, statuses in history]
+        with self._lock:
+            self._seq += 1
+            result = GameResult(won, category, word_length, guesses, round(duration_s, 3),
+                                seq=self._seq, word=word, history=encoded)
+            self.data.add(result)
+        if self.persist:
+            self._queue.put(result)
+        return result
+
+    def _run_writer(self) -> None:
+        while True:
+            batch: list[GameResult] = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            # Build a batch: everything that arrived within flush_interval is written in one call.
+            while isinstance(item, GameResult):
+                batch.append(item)
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    item = _NOTHING
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = _NOTHING
+            try:
+                if batch:
+                    self._append(batch)
+                if self._logged_since_compact >= self.compact_every or (item is not _NOTHING and self._logged_since_compact):
+                    self.compact()
+            except OSError as e:
+                print(f"[WARNING] Failed to save stats: {e}")
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
+    def _append(self, batch: list[GameResult]) -> None:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        text = "".join(json.dumps(asdict(r), ensure_ascii=False) + "\n" for r in batch)
+        with self.log_path.open("a", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        self._logged_since_compact += len(batch)
+
+    def compact(self) -> None:
+        """Write the totals as the snapshot and truncate the log (called on the writer thread)."""
+        with self._lock:
+            snapshot = asdict(self.data)
+            snapshot["seq"] = self._seq
+        snapshot["version"] = SNAPSHOT_VERSION
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self.path, json.dumps(snapshot, indent=2, ensure_ascii=False))
+        # If we crash before truncating, records with seq <= snapshot["seq"] are skipped on load.
+        with self.log_path.open("w", encoding="utf-8"):
+            pass
+        self._logged_since_compact = 0
+
+    def save(self) -> None:
+        """Write everything recorded so far and compact; blocks until done."""
+        if self._writer is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        if self._writer is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    won INTEGER NOT NULL,
+    category TEXT,
+    word TEXT,
+    word_length INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    duration_s REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_finished_at ON games(finished_at);
+CREATE INDEX IF NOT EXISTS games_category ON games(category, won);
+CREATE INDEX IF NOT EXISTS games_word ON games(word, won);
+
+CREATE TABLE IF NOT EXISTS guesses (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    turn INTEGER NOT NULL,
+    word TEXT NOT NULL,
+    pattern INTEGER NOT NULL,
+    PRIMARY KEY (game_id, turn)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS guesses_word ON guesses(word);
+
+CREATE TABLE IF NOT EXISTS category_totals (
+    category TEXT PRIMARY KEY, wins INTEGER NOT NULL, losses INTEGER NOT NULL,
+    guesses INTEGER NOT NULL, duration_s REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS length_totals (
+    word_length INTEGER PRIMARY KEY, wins INTEGER NOT NULL, losses INTEGER NOT NULL,
+    guesses INTEGER NOT NULL, duration_s REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS word_totals (
+    word TEXT PRIMARY KEY, wins INTEGER NOT NULL, losses INTEGER NOT NULL, guesses INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS guess_distribution (
+    guesses INTEGER NOT NULL, won INTEGER NOT NULL, games INTEGER NOT NULL,
+    PRIMARY KEY (guesses, won)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS games_rollup AFTER INSERT ON games BEGIN
+    INSERT INTO category_totals VALUES
+        (coalesce(NEW.category, ''), NEW.won, 1 - NEW.won, NEW.guesses, NEW.duration_s)
+        ON CONFLICT(category) DO UPDATE SET wins = wins + excluded.wins, losses = losses + excluded.losses,
+            guesses = guesses + excluded.guesses, duration_s = duration_s + excluded.duration_s;
+    INSERT INTO length_totals VALUES
+        (NEW.word_length, NEW.won, 1 - NEW.won, NEW.guesses, NEW.duration_s)
+        ON CONFLICT(word_length) DO UPDATE SET wins = wins + excluded.wins, losses = losses + excluded.losses,
+            guesses = guesses + excluded.guesses, duration_s = duration_s + excluded.duration_s;
+    INSERT INTO word_totals SELECT NEW.word, NEW.won, 1 - NEW.won, NEW.guesses WHERE NEW.word IS NOT NULL
+        ON CONFLICT(word) DO UPDATE SET wins = wins + excluded.wins, losses = losses + excluded.losses,
+            guesses = guesses + excluded.guesses;
+    INSERT INTO guess_distribution VALUES (NEW.guesses, NEW.won, 1)
+        ON CONFLICT(guesses, won) DO UPDATE SET games = games + 1;
+END;
+"""
+
+_INSERT_GAME = (
+    "INSERT INTO games (finished_at, won, category, word, word_length, guesses, duration_s) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_GUESS = "INSERT INTO guesses (game_id, turn, word, pattern) VALUES (?, ?, ?, ?)"
+
+
+def _connect(path: Path, **kwargs) -> sqlite3.Connection:
+    # Queries are constant strings, so sqlite3's statement cache reuses them.
+    conn = sqlite3.connect(path, cached_statements=256, **kwargs)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+class SQLiteStatsStore(StatsStore):
+    """StatsStore on SQLite: games and guesses are written by the background writer, queries read via WAL."""
+
+    def __init__(self, path: Path, flush_interval: float = 1.0, compact_every: int = 1000,
+                 legacy_snapshot: Path | None = None):
+        self._legacy_snapshot = legacy_snapshot
+        self._write_conn: sqlite3.Connection | None = None
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = _connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+        super().__init__(path, persist=True, flush_interval=flush_interval, compact_every=compact_every)
+
+    def _load(self) -> None:
+        if self._legacy_snapshot is not None:
+            self._import_legacy(self._legacy_snapshot)
+        self.data = self.totals()
+        self._seq = self._conn.execute("SELECT coalesce(max(id), 0) FROM games").fetchone()[0]
+
+    def _import_legacy(self, snapshot: Path) -> None:
+        """Carry wins/losses of a JSON snapshot over once; they have no per-game rows."""
+        if not snapshot.exists() or self._meta("legacy") is not None:
+            return
+        try:
+            legacy = GameStats.from_dict(json.loads(snapshot.read_text(encoding="utf-8")))
+        except Exception:
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO meta VALUES ('legacy', ?)",
+                (json.dumps({"wins": legacy.wins, "losses": legacy.losses,
+                             "guesses": legacy.guesses, "duration_s": legacy.duration_s}),),
+            )
+
+    def _meta(self, key: str):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _append(self, batch: list[GameResult]) -> None:
+        if self._write_conn is None:
+            self._write_conn = _connect(self.path, check_same_thread=False)
+        conn = self._write_conn
+        with conn:
+            for r in batch:
+                game_id = conn.execute(_INSERT_GAME, (
+                    r.finished_at, int(r.won), r.category, r.word, r.word_length, r.guesses, r.duration_s,
+                )).lastrowid
+                conn.executemany(_INSERT_GUESS, [
+                    (game_id, turn, guess, pattern) for turn, (guess, pattern) in enumerate(r.history)
+                ])
+        self._logged_since_compact += len(batch)
+
+    def compact(self) -> None:
+        """Fold the WAL back into the database file."""
+        conn = self._write_conn or self._conn
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._logged_since_compact = 0
+
+    def close(self) -> None:
+        super().close()
+        if self._write_conn is not None:
+            self._write_conn.close()
+            self._write_conn = None
+        self._conn.close()
+
+    # --- analytics (reads only the rollup tables) ---
+
+    def totals(self) -> GameStats:
+        stats = GameStats()
+        for category, wins, losses, guesses, duration in self._conn.execute(
+            "SELECT category, wins, losses, guesses, duration_s FROM category_totals"
+        ):
+            stats.wins += wins
+            stats.losses += losses
+            stats.guesses += guesses
+            stats.duration_s += duration
+            if category:
+                stats.by_category[category] = [wins, losses]
+        for length, wins, losses in self._conn.execute("SELECT word_length, wins, losses FROM length_totals"):
+            if length:
+                stats.by_length[str(length)] = [wins, losses]
+        legacy = self._meta("legacy")
+        if legacy:
+            legacy = json.loads(legacy)
+            stats.wins += legacy["wins"]
+            stats.losses += legacy["losses"]
+            stats.guesses += legacy["guesses"]
+            stats.duration_s += legacy["duration_s"]
+        return stats
+
+    def win_rate_by_category(self) -> list[tuple[str, int, float]]:
+        """``(category, games, win rate %)`` ordered by number of games."""
+        rows = self._conn.execute(
+            "SELECT category, wins + losses AS games, 100.0 * wins / (wins + losses) FROM category_totals "
+            "WHERE category != '' ORDER BY games DESC, category"
+        )
+        return rows.fetchall()
+
+    def win_rate_by_length(self) -> list[tuple[int, int, float]]:
+        """``(word length, games, win rate %)`` ordered by length."""
+        rows = self._conn.execute(
+            "SELECT word_length, wins + losses, 100.0 * wins / (wins + losses) FROM length_totals "
+            "WHERE word_length > 0 ORDER BY word_length"
+        )
+        return rows.fetchall()
+
+    def guess_distribution(self, won_only: bool = True) -> dict[int, int]:
+        """Number of games by guesses taken (won games only by default)."""
+        rows = self._conn.execute(
+            "SELECT guesses, sum(games) FROM guess_distribution WHERE won >= ? GROUP BY guesses ORDER BY guesses",
+            (1 if won_only else 0,),
+        )
+        return dict(rows.fetchall())
+
+    def hardest_words(self, limit: int = 10, min_games: int = 3) -> list[tuple[str, int, float, float]]:
+        """``(word, games, loss rate %, average guesses)`` for the most often lost secrets."""
+        rows = self._conn.execute(
+            "SELECT word, wins + losses AS games, 100.0 * losses / (wins + losses) AS loss_rate, "
+            "1.0 * guesses / (wins + losses) AS avg_guesses FROM word_totals "
+            "WHERE wins + losses >= ? ORDER BY loss_rate DESC, avg_guesses DESC, games DESC LIMIT ?",
+            (min_games, limit),
+        )
+        return rows.fetchall()
+
+
+def open_stats_store(directory: Path) -> StatsStore:
+    """SQLite stats in ``directory``, or the JSON store there if SQLite cannot be used."""
+    directory = Path(directory)
+    try:
+        return SQLiteStatsStore(directory / "stats.db", legacy_snapshot=directory / "stats.json")
+    except sqlite3.Error as e:
+        print(f"[WARNING] SQLite stats unavailable, using stats.json: {e}")
+        return StatsStore(directory / "stats.json", persist=True)
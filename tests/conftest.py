@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+UI_DIR = Path(__file__).resolve().parent.parent / "python_ui"
+if str(UI_DIR) not in sys.path:
+    sys.path.insert(0, str(UI_DIR))
@@ -0,0 +1,33 @@
+import os
+from datetime import date
+
+from core_bridge import GameCore
+from daily import ANY, DailySchedule
+from dictionary import binary_path_for, write_dictionary
+
+START = date(2024, 1, 1)
+
+
+def test_schedule_follows_the_loaded_dictionary(tmp_path):
+    words_path = tmp_path / "words.txt"
+    words_path.write_text("APPLE;Food\nMANGO;Food\n", encoding="utf-8")
+    cache = tmp_path / "cache"
+    write_dictionary([("APPLE", "Food"), ("MANGO", "Food")], binary_path_for(words_path))
+    core = GameCore(None, words_path, use_native=False)
+    try:
+        with core._borrow_lexicon(None) as lexicon:
+            DailySchedule.load_or_build(lexicon, words_path, 0, START, 7, cache)
+        # A newer dictionary leaves words.txt untouched, but the cached schedule must not be reused.
+        write_dictionary([("ZEBRA", "Animals")], binary_path_for(words_path))
+        core.reload()
+        with core._borrow_lexicon(None) as lexicon:
+            schedule = DailySchedule.load_or_build(lexicon, words_path, 0, START, 7, cache)
+    finally:
+        core.close()
+    assert schedule.word(ANY, START) == "ZEBRA"
+    assert len(os.listdir(cache)) == 1
+
+
+def test_any_matches_case_insensitively():
+    schedule = DailySchedule(0, START, 2, {ANY: ["APPLE", "MANGO"]})
+    assert schedule.word("any", START) == schedule.word("ANY", START) == "APPLE"
@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core_bridge import evaluate_guess
+from scoring import build_alphabet, encode_words, score_codes, score_words
+
+
+def random_words(rng: random.Random, count: int, length: int, letters: str) -> list[str]:
+    return ["".join(rng.choice(letters) for _ in range(length)) for _ in range(count)]
+
+
+@pytest.mark.parametrize("letters", ["AB", "ABC", "ABCDEF", "АБВҐ"])
+@pytest.mark.parametrize("length", [1, 3, 5, 8])
+def test_score_words_matches_evaluate_guess(letters, length):
+    # Small alphabets make repeated letters in both the guess and the secret the common case.
+    rng = random.Random(f"{letters}{length}")
+    for _ in range(50):
+        secret = random_words(rng, 1, length, letters)[0]
+        guesses = random_words(rng, 40, length, letters)
+        assert score_words(guesses, secret) == [evaluate_guess(g, secret) for g in guesses]
+
+
+def test_score_codes_with_one_secret_per_row():
+    rng = random.Random(5)
+    guesses = random_words(rng, 500, 5, "ABCD")
+    secrets = random_words(rng, 500, 5, "ABCD")
+    alphabet = build_alphabet(guesses + secrets)
+    result = score_codes(encode_words(guesses, alphabet), encode_words(secrets, alphabet))
+    assert result.tolist() == [evaluate_guess(g, s) for g, s in zip(guesses, secrets)]
+
+
+@pytest.mark.parametrize(
+    "guess, secret, expected",
+    [
+        ("AABBB", "ABABA", [2, 1, 1, 2, 0]),
+        ("EERIE", "THERE", [1, 0, 1, 0, 2]),
+        ("LLAMA", "HELLO", [1, 1, 0, 0, 0]),
+        ("SPEED", "ABIDE", [0, 0, 1, 0, 1]),
+    ],
+)
+def test_repeated_letters(guess, secret, expected):
+    assert evaluate_guess(guess, secret) == expected
+    assert score_words([guess], secret) == [expected]
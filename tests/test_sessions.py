@@ -0,0 +1,97 @@
+import os
+import random
+import threading
+
+import pytest
+
+from conftest import UI_DIR
+from core_bridge import GameCore, evaluate_guess, find_library
+
+THREADS = 8
+LETTERS = "ABCDE"
+LENGTH = 5
+
+
+@pytest.fixture(params=["emulation", "native"])
+def core(request, tmp_path):
+    rng = random.Random(0)
+    words = {"".join(rng.choice(LETTERS) for _ in range(LENGTH)) for _ in range(300)}
+    words_path = tmp_path / "words.txt"
+    words_path.write_text("".join(f"{w};LETTERS\n" for w in sorted(words)), encoding="utf-8")
+    if request.param == "emulation":
+        core = GameCore(None, words_path, use_native=False)
+    else:
+        try:
+            lib = os.environ.get("GUESS_WORD_LIB") or find_library(UI_DIR)
+        except FileNotFoundError:
+            pytest.skip("native core is not built")
+        core = GameCore(lib, words_path)
+    yield core
+    core.close()
+
+
+def run_threads(target, count=THREADS):
+    errors = []
+
+    def run(i):
+        try:
+            target(i)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
+
+
+def test_shared_session_scores_every_guess(core):
+    attempts = 10**6
+    guesses_per_thread = 200
+    with core.new_session() as session:
+        session.start_game("Any", attempts)
+        secret = session.get_secret()
+        pool = [w for w in core.lexicon().words if w != secret]
+
+        def play(i):
+            rng = random.Random(i)
+            for n in range(guesses_per_thread):
+                guess = pool[rng.randrange(len(pool))]
+                if n % 2:
+                    assert session.guess_word(guess, LENGTH) == evaluate_guess(guess, secret)
+                else:
+                    with session.lock:
+                        assert list(session.guess_word_view(guess, LENGTH)) == evaluate_guess(guess, secret)
+
+        run_threads(play)
+        state = session.get_state()
+        assert state.status == 0
+        assert state.attempts_left == attempts - THREADS * guesses_per_thread
+
+
+def test_sessions_per_thread_score_every_guess(core):
+    pool = core.lexicon().words
+
+    def play(i):
+        rng = random.Random(i)
+        with core.new_session() as session:
+            session.seed(i)
+            for _ in range(30):
+                session.start_game("LETTERS", 6)
+                secret = session.get_secret()
+                while session.get_game_status() == 0:
+                    guess = pool[rng.randrange(len(pool))]
+                    assert session.guess_word(guess, LENGTH) == evaluate_guess(guess, secret)
+
+    run_threads(play)
+
+
+def test_categories_have_the_same_shape_in_every_language(core, tmp_path):
+    other = tmp_path / "words_de.txt"
+    other.write_text("APFEL;OBST\nBIRNE;OBST\n", encoding="utf-8")
+    core.load_language("de", other)
+    assert core.get_categories() == ["Any", "LETTERS"]
+    assert core.get_categories("de") == ["Any", "OBST"]
@@ -0,0 +1,129 @@
+import json
+import random
+import sqlite3
+from dataclasses import asdict
+
+from stats import GameResult, SQLiteStatsStore, StatsStore, open_stats_store
+
+
+def open_store(path, **kwargs):
+    # A long flush interval: nothing reaches disk until save() or close().
+    return StatsStore(path, flush_interval=60.0, **kwargs)
+
+
+def test_round_trip(tmp_path):
+    store = open_store(tmp_path / "stats.json")
+    store.record(True, "ANIMAL", 5, 3, 12.5)
+    store.record(False, "CITY", 6, 6, 30.0)
+    store.record(True, "ANIMAL", 6, 4, 1.25)
+    store.save()
+    store.close()
+
+    reopened = open_store(tmp_path / "stats.json")
+    try:
+        assert reopened.data == store.data
+        assert (reopened.data.wins, reopened.data.losses, reopened.data.guesses) == (2, 1, 13)
+        assert reopened.data.by_category == {"ANIMAL": [2, 0], "CITY": [0, 1]}
+        assert reopened.data.by_length == {"5": [1, 0], "6": [1, 1]}
+        # New games continue the sequence instead of reusing logged numbers.
+        assert reopened.record(True).seq == 4
+    finally:
+        reopened.close()
+
+
+def test_replays_log_tail_after_a_crash(tmp_path):
+    path = tmp_path / "stats.json"
+    store = open_store(path)
+    for won in (True, False, True):
+        store.record(won, "ANIMAL", 5, 4)
+    store.save()
+    store.close()
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    assert snapshot["seq"] == 3
+
+    # A crash between writing the snapshot and truncating the log leaves games 2-3
+    # in both; games 4-5 were only logged, and the last line was cut off mid-write.
+    tail = [GameResult(won, "CITY", 6, 6, seq=seq) for seq, won in ((2, False), (3, True), (4, False), (5, True))]
+    lines = [json.dumps(asdict(r)) + "\n" for r in tail]
+    path.with_suffix(".log").write_text("".join(lines) + lines[-1][:20], encoding="utf-8")
+
+    reopened = open_store(path)
+    try:
+        assert (reopened.data.wins, reopened.data.losses) == (3, 2)
+        assert reopened.data.by_category == {"ANIMAL": [2, 1], "CITY": [1, 1]}
+        assert reopened.record(True).seq == 6
+    finally:
+        reopened.close()
+
+
+def test_close_flushes_queued_games(tmp_path):
+    path = tmp_path / "stats.json"
+    store = open_store(path, compact_every=1000)
+    for i in range(5):
+        store.record(i % 2 == 0, "ANIMAL", 5, i + 1)
+    store.close()
+
+    reopened = open_store(path)
+    try:
+        assert (reopened.data.wins, reopened.data.losses, reopened.data.guesses) == (3, 2, 15)
+    finally:
+        reopened.close()
+
+
+def test_sqlite_rollups_match_the_games_table(tmp_path):
+    rng = random.Random(0)
+    store = SQLiteStatsStore(tmp_path / "stats.db", flush_interval=60.0)
+    try:
+        for _ in range(300):
+            word = rng.choice(["APPLE", "MANGO", "TIGER", "PARIS", "ORANGE"])
+            store.record(rng.random() < 0.7, rng.choice(["FOOD", "ANIMAL", None]), len(word),
+                         rng.randint(1, 6), rng.uniform(1, 60), word if rng.random() < 0.9 else None)
+        store.save()
+        conn = sqlite3.connect(tmp_path / "stats.db")
+        try:
+            def rows(sql):
+                return sorted(conn.execute(sql).fetchall())
+
+            assert rows("SELECT count(*) FROM games") == [(300,)]
+            assert rows(
+                "SELECT category, wins, losses, guesses, round(duration_s, 6) FROM category_totals"
+            ) == rows(
+                "SELECT coalesce(category, ''), sum(won), sum(1 - won), sum(guesses), round(sum(duration_s), 6) "
+                "FROM games GROUP BY 1"
+            )
+            assert rows("SELECT word_length, wins, losses, guesses, round(duration_s, 6) FROM length_totals") == rows(
+                "SELECT word_length, sum(won), sum(1 - won), sum(guesses), round(sum(duration_s), 6) "
+                "FROM games GROUP BY 1"
+            )
+            assert rows("SELECT word, wins, losses, guesses FROM word_totals") == rows(
+                "SELECT word, sum(won), sum(1 - won), sum(guesses) FROM games WHERE word IS NOT NULL GROUP BY 1"
+            )
+            assert rows("SELECT guesses, won, games FROM guess_distribution") == rows(
+                "SELECT guesses, won, count(*) FROM games GROUP BY 1, 2"
+            )
+        finally:
+            conn.close()
+        assert store.totals().total == 300
+    finally:
+        store.close()
+
+
+def test_open_stats_store_falls_back_to_json(tmp_path):
+    # A directory where the database should be makes SQLite fail to open it.
+    (tmp_path / "stats.db").mkdir()
+    store = open_stats_store(tmp_path)
+    try:
+        assert type(store) is StatsStore
+        store.record(True, "ANIMAL", 5, 3)
+        store.save()
+    finally:
+        store.close()
+    assert json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))["wins"] == 1
+
+
+def test_open_stats_store_prefers_sqlite(tmp_path):
+    store = open_stats_store(tmp_path)
+    try:
+        assert isinstance(store, SQLiteStatsStore)
+    finally:
+        store.close()